@@ -0,0 +1,37 @@
+"""transcript history index
+
+Revision ID: 3b8e1c2d9a47
+Revises: f494f959dacb
+Create Date: 2026-10-17 19:18:40.127306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1c2d9a47'
+down_revision: Union[str, Sequence[str], None] = 'f494f959dacb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_transcript_user_id_created_at_id",
+        "transcript",
+        ["user_id", "created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_transcript_user_id_created_at_id",
+        table_name="transcript",
+        if_exists=True,
+    )
@@ -0,0 +1,49 @@
+"""compressed transcript bodies
+
+Revision ID: 9c4d2e7f1a05
+Revises: 3b8e1c2d9a47
+Create Date: 2026-10-17 19:40:12.603418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4d2e7f1a05'
+down_revision: Union[str, Sequence[str], None] = '3b8e1c2d9a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing bodies keep their text as UTF-8 bytes; CompressedText reads
+    # both, and scripts/compress_transcripts.py compresses them afterwards.
+    # SQLite needs no change: its columns hold blobs and text alike, and
+    # rebuilding the table would renumber the rowids the FTS index uses
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    op.alter_column(
+        "transcript",
+        "transcription",
+        type_=sa.LargeBinary(),
+        existing_nullable=False,
+        postgresql_using="convert_to(transcription, 'UTF8')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Run scripts/compress_transcripts.py --decompress first
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    op.alter_column(
+        "transcript",
+        "transcription",
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="convert_from(transcription, 'UTF8')",
+    )
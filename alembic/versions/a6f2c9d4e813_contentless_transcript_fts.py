@@ -0,0 +1,75 @@
+"""contentless transcript fts
+
+Revision ID: a6f2c9d4e813
+Revises: d81f3a6c2b94
+Create Date: 2026-10-19 09:41:05.162237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.compression import decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6f2c9d4e813'
+down_revision: Union[str, Sequence[str], None] = 'd81f3a6c2b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def _rebuild(content: str) -> None:
+    """Recreate the SQLite FTS5 index and refill it from transcripts"""
+    bind = op.get_bind()
+    op.execute("DROP TABLE IF EXISTS transcript_fts")
+    op.execute(
+        "CREATE VIRTUAL TABLE transcript_fts USING fts5("
+        f"owner, transcription, {content}tokenize = 'porter unicode61')"
+    )
+
+    # Bodies may be compressed, so the text is indexed from Python
+    transcript = sa.table(
+        "transcript",
+        sa.column("id", sa.String()),
+        sa.column("user_id", sa.String()),
+        sa.column("transcription", sa.LargeBinary()),
+    )
+    rowid = sa.literal_column("rowid")
+    last_rowid = None
+    while True:
+        statement = sa.select(
+            rowid, transcript.c.user_id, transcript.c.transcription
+        ).select_from(transcript)
+        if last_rowid is not None:
+            statement = statement.where(rowid > last_rowid)
+        rows = bind.execute(statement.order_by(rowid).limit(BATCH_SIZE)).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(
+                "INSERT INTO transcript_fts (rowid, owner, transcription) "
+                "VALUES (:rowid, :owner, :body)"
+            ),
+            [
+                {"rowid": row_id, "owner": user_id, "body": decompress_text(body)}
+                for row_id, user_id, body in rows
+            ],
+        )
+        last_rowid = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The tsvector table on Postgres never held the text
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild("content = '', ")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild("")
@@ -0,0 +1,58 @@
+"""transcription cache retention
+
+Revision ID: c3d7e1f9b265
+Revises: a6f2c9d4e813
+Create Date: 2026-10-19 14:27:51.903318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d7e1f9b265'
+down_revision: Union[str, Sequence[str], None] = 'a6f2c9d4e813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_cache(transcription: sa.types.TypeEngine) -> None:
+    op.create_table(
+        "transcription_cache",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("content_hash", sa.String(), nullable=False),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("transcription", transcription, nullable=False),
+        sa.Column("duration", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_transcription_cache_content_hash", "transcription_cache", ["content_hash"]
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "transcript", sa.Column("content_hash", sa.String(), nullable=True)
+    )
+    op.create_index("ix_transcript_content_hash", "transcript", ["content_hash"])
+
+    # Only a cache: start it over with compressed bodies rather than convert.
+    # Transcripts from before this revision have no hash, so their entries
+    # would otherwise outlive them until they expired
+    op.execute("DROP TABLE IF EXISTS transcription_cache")
+    _create_cache(sa.LargeBinary())
+    op.create_index(
+        "ix_transcription_cache_created_at", "transcription_cache", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("transcription_cache")
+    _create_cache(sa.String())
+    op.drop_index("ix_transcript_content_hash", table_name="transcript")
+    op.drop_column("transcript", "content_hash")
@@ -0,0 +1,67 @@
+"""transcript preview
+
+Revision ID: d81f3a6c2b94
+Revises: 9c4d2e7f1a05
+Create Date: 2026-10-18 10:12:37.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.compression import decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f3a6c2b94'
+down_revision: Union[str, Sequence[str], None] = '9c4d2e7f1a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREVIEW_CHARS = 500
+BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "transcript", sa.Column("preview", sa.String(PREVIEW_CHARS), nullable=True)
+    )
+
+    # Bodies may already be compressed, so previews are cut in Python
+    bind = op.get_bind()
+    transcript = sa.table(
+        "transcript",
+        sa.column("id", sa.Uuid()),
+        sa.column("transcription", sa.LargeBinary()),
+        sa.column("preview", sa.String()),
+    )
+    last_id = None
+    while True:
+        statement = sa.select(transcript.c.id, transcript.c.transcription)
+        if last_id is not None:
+            statement = statement.where(transcript.c.id > last_id)
+        rows = bind.execute(
+            statement.order_by(transcript.c.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            transcript.update()
+            .where(transcript.c.id == sa.bindparam("transcript_id"))
+            .values(preview=sa.bindparam("body_preview")),
+            [
+                {
+                    "transcript_id": transcript_id,
+                    "body_preview": decompress_text(body)[:PREVIEW_CHARS],
+                }
+                for transcript_id, body in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("transcript", "preview")
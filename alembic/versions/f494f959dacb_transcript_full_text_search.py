@@ -0,0 +1,67 @@
+"""transcript full-text search
+
+Revision ID: f494f959dacb
+Revises: fc7c5de6bf6f
+Create Date: 2026-10-17 19:02:11.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f494f959dacb'
+down_revision: Union[str, Sequence[str], None] = 'fc7c5de6bf6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5("
+            "owner, transcription, tokenize = 'porter unicode61')"
+        )
+        op.execute(
+            "INSERT INTO transcript_fts (rowid, owner, transcription) "
+            "SELECT rowid, user_id, transcription FROM transcript"
+        )
+    elif dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        op.create_table(
+            "transcript_search",
+            sa.Column(
+                "transcript_id",
+                sa.Uuid(),
+                sa.ForeignKey("transcript.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("user_id", sa.Uuid(), nullable=False),
+            sa.Column("document", sa.dialects.postgresql.TSVECTOR(), nullable=False),
+        )
+        op.create_index(
+            "ix_transcript_search_user_document",
+            "transcript_search",
+            ["user_id", "document"],
+            postgresql_using="gin",
+        )
+        op.execute(
+            "INSERT INTO transcript_search (transcript_id, user_id, document) "
+            "SELECT id, user_id, to_tsvector('english', transcription) FROM transcript"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        op.execute("DROP TABLE IF EXISTS transcript_fts")
+    elif dialect == "postgresql":
+        op.drop_index(
+            "ix_transcript_search_user_document", table_name="transcript_search"
+        )
+        op.drop_table("transcript_search")
@@ -0,0 +1,144 @@
+"""Helpers shared by the benchmarks: latency stats, memory, fixtures, results.
+
+Nothing here imports the app or its settings, so a benchmark can set
+environment overrides (e.g. ``ASR_BACKEND=stub``) before loading them.
+"""
+
+import asyncio
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+# Clip lengths of the standard synthetic fixture set
+FIXTURE_SECONDS = {"5s": 5, "60s": 60, "10min": 600}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_stats(seconds: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/mean/max of ``seconds``, in milliseconds"""
+    if not seconds:
+        return {}
+    return {
+        "p50_ms": percentile(seconds, 50) * 1000,
+        "p95_ms": percentile(seconds, 95) * 1000,
+        "p99_ms": percentile(seconds, 99) * 1000,
+        "mean_ms": statistics.mean(seconds) * 1000,
+        "max_ms": max(seconds) * 1000,
+    }
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: List[float]) -> None:
+    """Record how late a 10 ms ticker wakes up until ``stop`` is set"""
+    interval = 0.01
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+def _maxrss_mb(who: int) -> float:
+    rss = resource.getrusage(who).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def memory_usage() -> Dict[str, float]:
+    """Peak resident memory of this process and of its reaped children, in MB"""
+    return {
+        "peak_rss_mb": _maxrss_mb(resource.RUSAGE_SELF),
+        "peak_children_rss_mb": _maxrss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+
+def synthesize_clip(
+    seconds: float, sample_rate: int = 44100, channels: int = 2, seed: int = 0
+) -> np.ndarray:
+    """Deterministic speech-like audio: voiced bursts separated by pauses.
+
+    Bursts are harmonic tones with a syllable-rate envelope; pauses hold
+    faint noise. Shape (samples, channels), float32 in [-1, 1].
+    """
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sample_rate)
+    audio = rng.normal(0, 0.002, total).astype(np.float32)
+    position = 0
+    while position < total:
+        burst = int(rng.uniform(0.4, 2.5) * sample_rate)
+        end = min(total, position + burst)
+        t = np.arange(end - position) / sample_rate
+        pitch = rng.uniform(100, 220)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+        envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))  # ~4 syllables/s
+        audio[position:end] += (0.2 * envelope * voiced).astype(np.float32)
+        position = end + int(rng.uniform(0.15, 0.8) * sample_rate)
+    audio = np.clip(audio, -1.0, 1.0)
+    return np.repeat(audio[:, None], channels, axis=1)
+
+
+def wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
+    """Encode float samples as 16-bit PCM WAV"""
+    frames = audio if audio.ndim == 2 else audio[:, None]
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(frames.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes((frames * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def fixture_clip(name: str, sample_rate: int = 44100) -> bytes:
+    """A standard synthetic fixture (see FIXTURE_SECONDS) as WAV bytes"""
+    return wav_bytes(synthesize_clip(FIXTURE_SECONDS[name], sample_rate), sample_rate)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Where a result was measured, so runs can be compared across commits"""
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def write_results(path: Optional[Path], benchmark: str, results: Dict) -> None:
+    """Write ``results`` with run metadata as JSON, if ``path`` is given"""
+    if path is None:
+        return
+    document = {
+        "benchmark": benchmark,
+        "environment": environment(),
+        "memory": memory_usage(),
+        **results,
+    }
+    path.write_text(json.dumps(document, indent=2))
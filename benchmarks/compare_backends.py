@@ -0,0 +1,169 @@
+"""Compare ASR backends for speed and accuracy on a fixture set.
+
+Every audio file in the fixture directory is transcribed by each backend.
+A ``<name>.txt`` file next to a clip is used as its reference transcript;
+without one, the output of the first backend is the reference. The run
+fails if any backend's word error rate exceeds the baseline's by more than
+``--tolerance``.
+
+    python -m benchmarks.compare_backends --fixtures benchmarks/fixtures \\
+        --backends transformers torch-int8 onnx --output backends.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from config.settings import settings
+from services.asr_backends import BACKENDS, load_backend
+from utils.file_utils import decode_audio, is_audio_file
+
+SAMPLE_RATE = 16000
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length"""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word),
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def load_fixtures(fixtures_dir: Path) -> List[Dict]:
+    fixtures = []
+    for path in sorted(fixtures_dir.iterdir()):
+        if not is_audio_file(path.name):
+            continue
+        audio = decode_audio(str(path), SAMPLE_RATE)
+        if audio is None:
+            raise SystemExit(f"Could not decode fixture {path}")
+        reference_path = path.with_suffix(".txt")
+        fixtures.append(
+            {
+                "name": path.name,
+                "audio": audio,
+                "reference": (
+                    reference_path.read_text().strip()
+                    if reference_path.exists()
+                    else None
+                ),
+            }
+        )
+    return fixtures
+
+
+def run_backend(name: str, fixtures: List[Dict], model_path: Optional[str]) -> Dict:
+    start = time.perf_counter()
+    backend = load_backend(
+        name,
+        settings.MODEL,
+        model_path=model_path,
+        num_threads=settings.ASR_NUM_THREADS,
+    )
+    load_seconds = time.perf_counter() - start
+
+    # Warm-up pass so one-off initialisation doesn't count against the first clip
+    backend.transcribe(fixtures[0]["audio"])
+
+    clips = []
+    for fixture in fixtures:
+        start = time.perf_counter()
+        text = backend.transcribe(fixture["audio"]).get("text", "").strip()
+        seconds = time.perf_counter() - start
+        clips.append(
+            {
+                "name": fixture["name"],
+                "text": text,
+                "inference_seconds": seconds,
+                "real_time_factor": seconds / (len(fixture["audio"]) / SAMPLE_RATE),
+            }
+        )
+
+    return {"backend": name, "load_seconds": load_seconds, "clips": clips}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=Path("benchmarks/fixtures"))
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["transformers", "torch-int8"],
+        choices=sorted(BACKENDS),
+    )
+    parser.add_argument(
+        "--model-path",
+        action="append",
+        default=[],
+        metavar="BACKEND=PATH",
+        help="Exported model to use for a backend, e.g. ctranslate2=./whisper-ct2",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.02,
+        help="Allowed absolute WER increase over the baseline (first backend)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    model_paths = dict(item.split("=", 1) for item in args.model_path)
+    fixtures = load_fixtures(args.fixtures)
+    if not fixtures:
+        raise SystemExit(f"No audio fixtures found in {args.fixtures}")
+
+    results = [
+        run_backend(name, fixtures, model_paths.get(name)) for name in args.backends
+    ]
+
+    baseline = {clip["name"]: clip["text"] for clip in results[0]["clips"]}
+    for result in results:
+        errors = []
+        for fixture, clip in zip(fixtures, result["clips"]):
+            reference = fixture["reference"] or baseline[clip["name"]]
+            clip["wer"] = word_error_rate(reference, clip["text"])
+            errors.append(clip["wer"])
+        total_inference = sum(clip["inference_seconds"] for clip in result["clips"])
+        total_audio = sum(len(f["audio"]) for f in fixtures) / SAMPLE_RATE
+        result["mean_wer"] = sum(errors) / len(errors)
+        result["real_time_factor"] = total_inference / total_audio
+
+    baseline_wer = results[0]["mean_wer"]
+    baseline_rtf = results[0]["real_time_factor"]
+    failed = False
+    print(f"{'backend':<14}{'load s':>9}{'RTF':>9}{'speedup':>9}{'WER':>8}")
+    for result in results:
+        result["speedup"] = baseline_rtf / result["real_time_factor"]
+        result["within_tolerance"] = result["mean_wer"] - baseline_wer <= args.tolerance
+        failed |= not result["within_tolerance"]
+        print(
+            f"{result['backend']:<14}{result['load_seconds']:>9.1f}"
+            f"{result['real_time_factor']:>9.3f}{result['speedup']:>8.2f}x"
+            f"{result['mean_wer']:>8.3f}"
+            f"{'' if result['within_tolerance'] else '  FAIL'}"
+        )
+
+    if args.output:
+        args.output.write_text(
+            json.dumps({"model": settings.MODEL, "results": results}, indent=2)
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""In-process load generator for the API.
+
+Drives the ASGI app with httpx (no sockets) using ``--concurrency``
+clients for ``--requests`` requests of one scenario:
+
+* ``transcribe``: upload a synthetic clip to POST /transcriptions/
+* ``list``, ``summaries``, ``search``: read endpoints over ``--seed``
+  transcripts created up front
+* ``health``: the bare framework overhead
+
+The ``stub`` ASR backend is the default so HTTP, queueing and database
+costs are measured apart from Whisper (``--backend`` to change). Rate
+limiting, admission control and the transcription cache are off unless
+already set in the environment. Reports throughput, p50/p95/p99 latency,
+status codes, event-loop lag and peak RSS.
+
+    DATABASE_URL=sqlite+aiosqlite:///./bench.db \\
+        python -m benchmarks.load_bench --scenario transcribe --concurrency 16 \\
+        --requests 500 --output load.json
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+import httpx
+from benchmarks.common import (
+    FIXTURE_SECONDS,
+    fixture_clip,
+    latency_stats,
+    measure_loop_lag,
+    memory_usage,
+    write_results,
+)
+
+SCENARIOS = ("transcribe", "list", "summaries", "search", "health")
+PASSWORD = "benchmark-password"
+
+
+async def run(
+    scenario: str, requests: int, concurrency: int, clip: str, seed: int
+) -> Dict:
+    from config.settings import settings
+    from main import app
+    from models import engine
+
+    prefix = settings.API_V1_PREFIX
+    audio = fixture_clip(clip)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            response = await client.post(
+                f"{prefix}/auth/register",
+                json={
+                    "email": f"load-{time.time_ns()}@example.com",
+                    "password": PASSWORD,
+                },
+            )
+            response.raise_for_status()
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+            async def transcribe(i: int) -> httpx.Response:
+                return await client.post(
+                    f"{prefix}/transcriptions/",
+                    headers=headers,
+                    files={"file": (f"load-{i}.wav", audio, "audio/wav")},
+                )
+
+            if scenario in ("list", "summaries", "search"):
+                for i in range(seed):
+                    (await transcribe(i)).raise_for_status()
+
+            send = {
+                "transcribe": transcribe,
+                "list": lambda i: client.get(
+                    f"{prefix}/transcriptions/", headers=headers
+                ),
+                "summaries": lambda i: client.get(
+                    f"{prefix}/transcriptions/summaries", headers=headers
+                ),
+                "search": lambda i: client.get(
+                    f"{prefix}/transcriptions/search",
+                    params={"q": "patient pain"},
+                    headers=headers,
+                ),
+                "health": lambda i: client.get("/health"),
+            }[scenario]
+
+            slots = asyncio.Semaphore(concurrency)
+            latencies: List[float] = []
+            statuses: Counter = Counter()
+
+            async def one(i: int) -> None:
+                async with slots:
+                    start = time.perf_counter()
+                    response = await send(i)
+                    latencies.append(time.perf_counter() - start)
+                    statuses[response.status_code] += 1
+
+            stop = asyncio.Event()
+            lags: List[float] = []
+            ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+            start = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(requests)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await ticker
+
+    await engine.dispose()
+
+    return {
+        "scenario": scenario,
+        "backend": settings.ASR_BACKEND,
+        "database": engine.dialect.name,
+        "clip": clip if scenario == "transcribe" else None,
+        "requests": requests,
+        "concurrency": concurrency,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "failures": sum(n for code, n in statuses.items() if code >= 400),
+        "throughput_rps": requests / elapsed,
+        "latency": latency_stats(latencies),
+        "max_loop_lag_ms": max(lags, default=0.0) * 1000,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, default="transcribe")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--clip", choices=FIXTURE_SECONDS, default="5s", help="Upload to transcribe"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=50, help="Transcripts to create for reads"
+    )
+    parser.add_argument("--backend", default="stub", help="ASR backend")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    # Settings are read at import, so overrides go in before the app loads
+    os.environ["ASR_BACKEND"] = args.backend
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    os.environ.setdefault("ADMISSION_ENABLED", "false")
+    os.environ.setdefault("TRANSCRIPTION_CACHE_ENABLED", "false")
+
+    result = asyncio.run(
+        run(args.scenario, args.requests, args.concurrency, args.clip, args.seed)
+    )
+    latency = result["latency"]
+    print(
+        f"{result['requests']} {result['scenario']} requests at concurrency "
+        f"{result['concurrency']}: {result['throughput_rps']:.1f} req/s, "
+        f"p50 {latency['p50_ms']:.1f} ms, p95 {latency['p95_ms']:.1f} ms, "
+        f"p99 {latency['p99_ms']:.1f} ms, max loop lag "
+        f"{result['max_loop_lag_ms']:.1f} ms, "
+        f"peak RSS {memory_usage()['peak_rss_mb']:.0f} MB, "
+        f"{result['failures']} failed"
+    )
+    write_results(args.output, "load", result)
+    return 1 if result["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
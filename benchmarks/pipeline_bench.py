@@ -0,0 +1,199 @@
+"""Time each transcription pipeline stage on short, medium and long clips.
+
+Runs decode (ffmpeg to 16 kHz mono, as uploads are decoded), an isolated
+resample pass, the VAD pre-pass and inference (through the inference pool
+and micro-batcher, long-form chunking included) ``--repeat`` times per clip.
+Clips are synthetic 44.1 kHz stereo WAVs of 5 s, 60 s and 10 min unless
+``--fixtures`` points at real recordings. Reports per-stage p50/p95/p99,
+the real-time factor and peak RSS.
+
+    python -m benchmarks.pipeline_bench --backend transformers --repeat 3 \\
+        --output pipeline.json
+    python -m benchmarks.pipeline_bench --backend stub --clips 5s 60s
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import ffmpeg
+import numpy as np
+from benchmarks.common import (
+    FIXTURE_SECONDS,
+    fixture_clip,
+    latency_stats,
+    write_results,
+)
+
+SAMPLE_RATE = 16000
+SYNTHETIC_RATE = 44100
+
+
+def source_sample_rate(name: str, fixtures_dir: Optional[Path]) -> int:
+    if fixtures_dir is None:
+        return SYNTHETIC_RATE
+    streams = ffmpeg.probe(str(fixtures_dir / name))["streams"]
+    return int(next(s for s in streams if s["codec_type"] == "audio")["sample_rate"])
+
+
+def resample(audio: np.ndarray, source_rate: int) -> bytes:
+    """One ffmpeg pass from raw PCM at ``source_rate`` to 16 kHz"""
+    out, _ = (
+        ffmpeg.input("pipe:0", format="f32le", ac=1, ar=source_rate)
+        .output("pipe:1", format="f32le", ar=SAMPLE_RATE)
+        .global_args("-hide_banner", "-loglevel", "error")
+        .run(input=audio.tobytes(), capture_stdout=True, capture_stderr=True)
+    )
+    return out
+
+
+def load_clips(
+    names: List[str], fixtures_dir: Optional[Path]
+) -> List[Tuple[str, bytes]]:
+    from utils.file_utils import is_audio_file
+
+    if fixtures_dir is None:
+        return [(name, fixture_clip(name, SYNTHETIC_RATE)) for name in names]
+    return [
+        (path.name, path.read_bytes())
+        for path in sorted(fixtures_dir.iterdir())
+        if is_audio_file(path.name)
+    ]
+
+
+async def run(
+    clips: List[Tuple[str, bytes]],
+    fixtures_dir: Optional[Path],
+    repeat: int,
+    inference: bool,
+) -> Dict:
+    from config.settings import settings
+    from services.batching import inference_batcher
+    from services.inference_worker import inference_pool
+    from services.transcription_service import TranscriptionService
+    from utils.file_utils import decode_audio
+    from utils.vad import trim_silence
+
+    service = TranscriptionService()
+    load_seconds = None
+    if inference:
+        start = time.perf_counter()
+        await inference_pool.warm_up()
+        load_seconds = time.perf_counter() - start
+
+    results = []
+    for name, data in clips:
+        source_rate = source_sample_rate(name, fixtures_dir)
+        native = decode_audio(data, source_rate)
+        if native is None:
+            raise SystemExit(f"Could not decode clip {name}")
+        audio_seconds = len(native) / source_rate
+
+        timings: Dict[str, List[float]] = {
+            "decode": [],
+            "resample": [],
+            "vad": [],
+            "inference": [],
+        }
+        for _ in range(repeat):
+            start = time.perf_counter()
+            audio = decode_audio(data, SAMPLE_RATE)
+            timings["decode"].append(time.perf_counter() - start)
+            assert audio is not None
+
+            start = time.perf_counter()
+            resample(native, source_rate)
+            timings["resample"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            trim_silence(
+                audio,
+                SAMPLE_RATE,
+                backend=settings.VAD_BACKEND,
+                aggressiveness=settings.VAD_AGGRESSIVENESS,
+                threshold_db=settings.VAD_THRESHOLD_DB,
+                padding_ms=settings.VAD_PADDING_MS,
+            )
+            timings["vad"].append(time.perf_counter() - start)
+
+            if inference:
+                start = time.perf_counter()
+                await service._run_model(audio)
+                timings["inference"].append(time.perf_counter() - start)
+
+        result = {
+            "clip": name,
+            "bytes": len(data),
+            "audio_seconds": audio_seconds,
+            "stages": {
+                stage: latency_stats(seconds)
+                for stage, seconds in timings.items()
+                if seconds
+            },
+        }
+        if timings["inference"]:
+            result["real_time_factor"] = (
+                sorted(timings["inference"])[len(timings["inference"]) // 2]
+                / audio_seconds
+            )
+        results.append(result)
+        print(_summary_line(result))
+
+    await inference_batcher.shutdown()
+    await inference_pool.shutdown()
+
+    return {
+        "backend": settings.ASR_BACKEND,
+        "executor": settings.INFERENCE_EXECUTOR,
+        "workers": settings.INFERENCE_WORKERS,
+        "repeat": repeat,
+        "model_load_seconds": load_seconds,
+        "clips": results,
+    }
+
+
+def _summary_line(result: Dict) -> str:
+    stages = ", ".join(
+        f"{stage} p50 {stats['p50_ms']:.1f} ms"
+        for stage, stats in result["stages"].items()
+    )
+    rtf = result.get("real_time_factor")
+    return f"{result['clip']} ({result['audio_seconds']:.0f}s): {stages}" + (
+        f", RTF {rtf:.3f}" if rtf is not None else ""
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--clips", nargs="+", default=list(FIXTURE_SECONDS), choices=FIXTURE_SECONDS
+    )
+    parser.add_argument(
+        "--fixtures", type=Path, help="Benchmark these recordings instead"
+    )
+    parser.add_argument("--backend", help="ASR backend (defaults to ASR_BACKEND)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-inference", action="store_true")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    # Settings are read at import, so overrides go in before the app loads
+    if args.backend:
+        os.environ["ASR_BACKEND"] = args.backend
+
+    clips = load_clips(args.clips, args.fixtures)
+    if not clips:
+        raise SystemExit(f"No audio fixtures found in {args.fixtures}")
+
+    results = asyncio.run(
+        run(clips, args.fixtures, args.repeat, not args.skip_inference)
+    )
+    write_results(args.output, "pipeline", results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
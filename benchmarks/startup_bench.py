@@ -0,0 +1,130 @@
+"""Measure API process startup: import time, time to first response and RSS.
+
+Each run is a fresh interpreter that imports ``main``, runs the app's
+startup and answers GET /health, as a uvicorn worker would. Reports the
+median over ``--runs`` and the ML modules the web process loaded. The run
+fails if any of the ML libraries got imported (they belong behind the
+inference boundary) or if ``--max-import-s`` / ``--max-rss-mb`` are exceeded,
+so it can guard against regressions in CI.
+
+    python -m benchmarks.startup_bench --runs 5 --max-import-s 1.5 \\
+        --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+from benchmarks.common import write_results
+
+# Must not be imported by the API process unless it runs the model itself
+ML_MODULES = (
+    "torch",
+    "transformers",
+    "librosa",
+    "onnxruntime",
+    "optimum",
+    "ctranslate2",
+    "faster_whisper",
+)
+
+
+def measure_startup() -> Dict:
+    import asyncio
+    import time
+
+    started = time.perf_counter()
+    from main import app
+
+    imported = time.perf_counter()
+
+    import httpx
+    from benchmarks.common import memory_usage
+
+    async def first_response() -> int:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench"
+            ) as client:
+                return (await client.get("/health")).status_code
+
+    status = asyncio.run(first_response())
+    return {
+        "import_seconds": imported - started,
+        "first_response_seconds": time.perf_counter() - started,
+        "status": status,
+        "modules": len(sys.modules),
+        "ml_modules": sorted(m for m in ML_MODULES if m in sys.modules),
+        **memory_usage(),
+    }
+
+
+def run_once(env: Dict[str, str]) -> Dict:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_bench", "--child"],
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-s", type=float, help="Fail above this")
+    parser.add_argument("--max-rss-mb", type=float, help="Fail above this")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_startup()))
+        return 0
+
+    workdir = Path(tempfile.mkdtemp(prefix="scribe-startup-bench-"))
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir / 'startup.db'}",
+        "PRELOAD_MODEL": "false",
+    }
+    runs = [run_once(env) for _ in range(args.runs)]
+
+    result = {
+        "runs": runs,
+        "import_seconds": statistics.median(r["import_seconds"] for r in runs),
+        "first_response_seconds": statistics.median(
+            r["first_response_seconds"] for r in runs
+        ),
+        "peak_rss_mb": statistics.median(r["peak_rss_mb"] for r in runs),
+        "ml_modules": sorted({m for r in runs for m in r["ml_modules"]}),
+    }
+    problems = []
+    if result["ml_modules"]:
+        problems.append(f"ML modules imported: {', '.join(result['ml_modules'])}")
+    if args.max_import_s and result["import_seconds"] > args.max_import_s:
+        problems.append(f"import took over {args.max_import_s}s")
+    if args.max_rss_mb and result["peak_rss_mb"] > args.max_rss_mb:
+        problems.append(f"RSS above {args.max_rss_mb} MB")
+    result["problems"] = problems
+
+    print(
+        f"import {result['import_seconds']:.3f}s, first response "
+        f"{result['first_response_seconds']:.3f}s, peak RSS "
+        f"{result['peak_rss_mb']:.0f} MB (median of {args.runs})"
+    )
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    write_results(args.output, "startup", result)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
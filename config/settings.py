@@ -9,7 +9,24 @@ load_dotenv()
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL") or "sqlite+aiosqlite:///./test.db"
-    MODEL: str = os.getenv("MODEL") or "base.en"
+    # tuned: the settings below for the URL's database | baseline: driver defaults
+    DB_ENGINE_PROFILE: str = os.getenv("DB_ENGINE_PROFILE") or "tuned"
+    # SQLite (file databases)
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE") or "WAL"
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS") or "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS") or 5000)
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE") or 268435456)
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB") or 65536)
+    # Connection pool (server databases such as Postgres)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE") or 10)
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW") or 20)
+    DB_POOL_TIMEOUT_S: float = float(os.getenv("DB_POOL_TIMEOUT_S") or 30)
+    DB_POOL_RECYCLE_S: int = int(os.getenv("DB_POOL_RECYCLE_S") or 1800)
+    # Prepared statements cached per asyncpg connection; 0 behind PgBouncer
+    DB_STATEMENT_CACHE_SIZE: int = int(
+        os.getenv("DB_STATEMENT_CACHE_SIZE") or 100
+    )
+    MODEL: str = os.getenv("MODEL") or "0x456665/whisper-small-medical"
     # JWT Configuration
     SECRET_KEY: str = (
         os.getenv("SECRET_KEY") or "your-super-secret-key-change-this-in-production"
@@ -19,10 +36,107 @@ class Settings(BaseSettings):
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES") or 15
     )
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS") or 15)
+    # Argon2 password hashing; stored hashes are upgraded on the next login
+    # after these change. PASSWORD_HASH_WORKERS caps concurrent hashes.
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST") or 3)
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST") or 65536)  # KiB
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM") or 4)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS") or 2)
+    # Verified tokens and their users are cached per process for up to this long
+    # (0 disables); user changes made through the ORM invalidate immediately
+    PRINCIPAL_CACHE_TTL_S: float = float(os.getenv("PRINCIPAL_CACHE_TTL_S") or 60)
+    PRINCIPAL_CACHE_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_SIZE") or 10000)
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE") or 10000)
 
     # File Upload
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE") or 50485760)  # 50MB
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR") or "./temp"
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv("UPLOAD_CHUNK_SIZE") or 1048576)  # 1MB
+    # Uploads up to this size stay in memory, larger ones are spooled to UPLOAD_DIR
+    UPLOAD_SPOOL_SIZE: int = int(os.getenv("UPLOAD_SPOOL_SIZE") or 8388608)  # 8MB
+    # POST /transcriptions/batch: files per batch (or audio files per archive),
+    # archive size limit, and files of one batch transcribed at a time
+    UPLOAD_BATCH_MAX_FILES: int = int(os.getenv("UPLOAD_BATCH_MAX_FILES") or 100)
+    UPLOAD_BATCH_MAX_ARCHIVE_SIZE: int = int(
+        os.getenv("UPLOAD_BATCH_MAX_ARCHIVE_SIZE") or 524288000
+    )  # 500MB
+    UPLOAD_BATCH_CONCURRENCY: int = int(os.getenv("UPLOAD_BATCH_CONCURRENCY") or 4)
+    # Batch files wait this long for admission before failing, and finished
+    # ones are inserted together every FLUSH_ROWS transcripts or FLUSH_MS
+    UPLOAD_BATCH_ADMISSION_WAIT_S: float = float(
+        os.getenv("UPLOAD_BATCH_ADMISSION_WAIT_S") or 600
+    )
+    UPLOAD_BATCH_FLUSH_ROWS: int = int(os.getenv("UPLOAD_BATCH_FLUSH_ROWS") or 50)
+    UPLOAD_BATCH_FLUSH_MS: int = int(os.getenv("UPLOAD_BATCH_FLUSH_MS") or 1000)
+    # GET /transcriptions/export: rows fetched and encoded per batch
+    # (one Parquet row group each)
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE") or 1000)
+    # Stored transcript bodies: zstd (needs the zstd extra) | gzip | none.
+    # Bodies under the minimum size are stored as plain text; level 0 is the
+    # codec's default
+    TRANSCRIPT_COMPRESSION: str = os.getenv("TRANSCRIPT_COMPRESSION") or "gzip"
+    TRANSCRIPT_COMPRESSION_MIN_BYTES: int = int(
+        os.getenv("TRANSCRIPT_COMPRESSION_MIN_BYTES") or 256
+    )
+    TRANSCRIPT_COMPRESSION_LEVEL: int = int(
+        os.getenv("TRANSCRIPT_COMPRESSION_LEVEL") or 0
+    )
+    # Inference
+    # ASR runtime: transformers | torch-int8 | onnx | ctranslate2 | stub
+    ASR_BACKEND: str = os.getenv("ASR_BACKEND") or "transformers"
+    # Exported/converted model for the onnx and ctranslate2 backends (defaults to MODEL)
+    ASR_MODEL_PATH: str = os.getenv("ASR_MODEL_PATH") or ""
+    # Intra-op threads per inference worker, 0 lets the runtime decide
+    ASR_NUM_THREADS: int = int(os.getenv("ASR_NUM_THREADS") or 0)
+    # Seconds the model-free stub backend sleeps per audio second (benchmarks)
+    ASR_STUB_RTF: float = float(os.getenv("ASR_STUB_RTF") or 0.0)
+    INFERENCE_EXECUTOR: str = os.getenv("INFERENCE_EXECUTOR") or "process"  # process | thread | socket
+    # Unix socket of the inference server used by INFERENCE_EXECUTOR=socket
+    INFERENCE_SOCKET: str = os.getenv("INFERENCE_SOCKET") or "/tmp/scribe-inference.sock"
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS") or 1)
+    # Load and warm up the model at startup; /ready reports 503 until done
+    PRELOAD_MODEL: bool = (os.getenv("PRELOAD_MODEL") or "false").lower() == "true"
+    # Micro-batching of concurrent clips into one forward pass (1 disables it)
+    BATCH_MAX_SIZE: int = int(os.getenv("BATCH_MAX_SIZE") or 8)
+    BATCH_MAX_WAIT_MS: float = float(os.getenv("BATCH_MAX_WAIT_MS") or 20)
+    # Long-form mode: audio longer than LONGFORM_MIN_DURATION_S is split into
+    # overlapping chunks that are transcribed concurrently
+    LONGFORM_ENABLED: bool = (os.getenv("LONGFORM_ENABLED") or "true").lower() == "true"
+    LONGFORM_MIN_DURATION_S: float = float(os.getenv("LONGFORM_MIN_DURATION_S") or 30)
+    LONGFORM_CHUNK_LENGTH_S: float = float(os.getenv("LONGFORM_CHUNK_LENGTH_S") or 30)
+    LONGFORM_STRIDE_S: float = float(os.getenv("LONGFORM_STRIDE_S") or 5)
+    # Voice-activity detection: only speech regions (plus padding) reach the model
+    VAD_ENABLED: bool = (os.getenv("VAD_ENABLED") or "false").lower() == "true"
+    VAD_BACKEND: str = os.getenv("VAD_BACKEND") or "energy"  # energy | webrtc
+    VAD_AGGRESSIVENESS: int = int(os.getenv("VAD_AGGRESSIVENESS") or 2)  # webrtc 0-3
+    VAD_THRESHOLD_DB: float = float(os.getenv("VAD_THRESHOLD_DB") or -45)  # energy
+    VAD_PADDING_MS: int = int(os.getenv("VAD_PADDING_MS") or 300)
+    # Live transcription over WebSocket: partials every STREAM_PARTIAL_INTERVAL_MS
+    # of new audio; a segment is finalized after a pause or at STREAM_MAX_WINDOW_S
+    STREAM_PARTIAL_INTERVAL_MS: int = int(os.getenv("STREAM_PARTIAL_INTERVAL_MS") or 500)
+    STREAM_PAUSE_MS: int = int(os.getenv("STREAM_PAUSE_MS") or 700)
+    STREAM_MAX_WINDOW_S: float = float(os.getenv("STREAM_MAX_WINDOW_S") or 15)
+    # Reuse results for byte-identical audio (keyed by content hash + model + params)
+    TRANSCRIPTION_CACHE_ENABLED: bool = (
+        os.getenv("TRANSCRIPTION_CACHE_ENABLED") or "true"
+    ).lower() == "true"
+    TRANSCRIPTION_CACHE_LRU_SIZE: int = int(
+        os.getenv("TRANSCRIPTION_CACHE_LRU_SIZE") or 256
+    )
+    # Entries older than this are ignored and pruned (default: 7 days)
+    TRANSCRIPTION_CACHE_TTL_S: float = float(
+        os.getenv("TRANSCRIPTION_CACHE_TTL_S") or 604800
+    )
+    # Admission control: reject transcriptions with 503 once the backlog's
+    # estimated processing time would exceed the budget
+    ADMISSION_ENABLED: bool = (os.getenv("ADMISSION_ENABLED") or "true").lower() == "true"
+    ADMISSION_LATENCY_BUDGET_S: float = float(
+        os.getenv("ADMISSION_LATENCY_BUDGET_S") or 120
+    )
+    # Starting guess of inference seconds per audio second, refined as work completes
+    ADMISSION_INITIAL_RTF: float = float(os.getenv("ADMISSION_INITIAL_RTF") or 0.5)
+    # Background workers for async (202 Accepted) transcription jobs
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS") or 2)
     # WHISPER_MODEL_PATH: str = Field(
     #     default="./models/ggml-base.en.bin", env="WHISPER_MODEL_PATH"
     # )
@@ -31,9 +145,41 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = os.getenv("API_V1_PREFIX") or "/api/v1"
     DEBUG: bool = bool(os.getenv("DEBUG") or False)
 
-    # Rate Limiting
+    # Rate Limiting (token buckets per user, or per IP when anonymous)
+    RATE_LIMIT_ENABLED: bool = (
+        os.getenv("RATE_LIMIT_ENABLED") or "true"
+    ).lower() == "true"
     RATE_LIMIT_REQUESTS: int = int(os.getenv("RATE_LIMIT_REQUESTS") or 100)
     RATE_LIMIT_WINDOW: int = int(os.getenv("RATE_LIMIT_WINDOW") or 3600)
+    # Job polling and transcript reads (GET by id, list, summaries) are
+    # counted apart; the default allows one a second, sustained
+    RATE_LIMIT_READ_REQUESTS: int = int(
+        os.getenv("RATE_LIMIT_READ_REQUESTS") or 3600
+    )
+    # Transcriptions are charged by audio duration instead of request count
+    RATE_LIMIT_AUDIO_SECONDS: float = float(
+        os.getenv("RATE_LIMIT_AUDIO_SECONDS") or 7200
+    )
+    # memory (per process) | redis (shared by all workers)
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND") or "memory"
+    RATE_LIMIT_REDIS_URL: str = (
+        os.getenv("RATE_LIMIT_REDIS_URL") or "redis://localhost:6379/0"
+    )
+
+    # Server-Timing header with per-request pipeline stage durations
+    SERVER_TIMING_ENABLED: bool = (
+        os.getenv("SERVER_TIMING_ENABLED") or "false"
+    ).lower() == "true"
+    # Sampling profiler (needs the profiling extra): requests with
+    # X-Profile-Token == PROFILER_TOKEN, plus a random PROFILE_SAMPLE_RATE share
+    PROFILING_ENABLED: bool = (
+        os.getenv("PROFILING_ENABLED") or "false"
+    ).lower() == "true"
+    PROFILER_TOKEN: str = os.getenv("PROFILER_TOKEN") or ""
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE") or 0.0)
+    PROFILE_INTERVAL_MS: float = float(os.getenv("PROFILE_INTERVAL_MS") or 1)
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR") or "./profiles"
+    PROFILE_MAX_FILES: int = int(os.getenv("PROFILE_MAX_FILES") or 100)
     PORT: int = int(os.getenv("PORT") or 8000)
 
     class Config:
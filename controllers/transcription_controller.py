@@ -1,29 +1,75 @@
 from fastapi import Depends, HTTPException, status, UploadFile
+from fastapi import WebSocket, WebSocketDisconnect, WebSocketException
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import LargeBinary, func, tuple_, type_coerce
 from sqlmodel import select, desc
-from typing import List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import asyncio
+from datetime import datetime
+import json
 import os
+import time
 import uuid
+from models import engine
 from models.user import User
-from models.transcript import Transcript, TranscriptCreate, TranscriptRead
+from models.transcript import (
+    Transcript,
+    TranscriptCreate,
+    TranscriptRead,
+    TranscriptPage,
+    TranscriptSearchResult,
+    TranscriptSummary,
+)
+from models.transcription_job import TranscriptionJob, TranscriptionJobRead, JobStatus
 from services.transcription_service import TranscriptionService
+from services.job_service import job_service, TERMINAL_STATUSES
+from services.streaming_service import StreamingTranscriber
+from services.search_service import SearchService, search_terms
+from services.rate_limiter import charge_audio_seconds, current_rate_limit
+from services.admission import AdmissionTicket, admission_controller
+from services.transcription_cache import transcription_cache
 from middleware.auth_middleware import get_async_session, get_current_user
-from utils.file_utils import save_upload_file, is_audio_file, cleanup_file
+from utils.file_utils import (
+    SpooledUpload,
+    extract_audio_files,
+    is_archive_file,
+    is_audio_file,
+    stream_upload_file,
+)
+from utils.audio_stream import create_stream_decoder
+from utils.compression import accepts_encoding, decompress_text, stored_encoding
+from utils.export import EXPORT_COLUMNS, EXPORT_MEDIA_TYPES, export_encoder
+from utils.pagination import decode_cursor, encode_cursor
+from utils.metrics import (
+    STREAM_SESSIONS,
+    STREAM_TIME_TO_FIRST_WORD,
+    TRANSCRIPTION_REQUESTS,
+    TRANSCRIPTIONS_IN_FLIGHT,
+    stage_timer,
+)
 from config.settings import settings
-from errors.custom_exceptions import ValidationError, TranscriptionError
+from errors.custom_exceptions import (
+    ValidationError,
+    TranscriptionError,
+    ServiceUnavailableError,
+    FileTooLargeError,
+)
 
 
 class TranscriptionController:
     def __init__(self):
         self.transcription_service = TranscriptionService()
+        self.search_service = SearchService()
 
     async def transcribe_audio(
         self,
         file: UploadFile,
         current_user: User = Depends(get_current_user),
         session: AsyncSession = Depends(get_async_session),
-    ) -> TranscriptRead:
-        """Transcribe uploaded audio file"""
+        background: bool = False,
+    ) -> Union[TranscriptRead, TranscriptionJobRead]:
+        """Transcribe uploaded audio file, or queue it as a job when ``background``"""
 
         # Validate file
         if not file.filename:
@@ -37,55 +83,601 @@ class TranscriptionController:
                 detail=f"Unsupported file format. Supported formats: {', '.join(self.transcription_service.get_supported_formats())}",
             )
 
-        # Check file size
-        file_content = await file.read()
-        if len(file_content) > settings.MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / 1024 / 1024:.1f}MB",
-            )
+        mode = "async" if background else "sync"
 
-        # Save file temporarily
-        unique_filename = f"{uuid.uuid4()}_{file.filename}"
-        file_path = await save_upload_file(
-            file_content, unique_filename, settings.UPLOAD_DIR
-        )
+        # Copy the parsed upload out in chunks. BodySizeLimitMiddleware has
+        # already cut off bodies over the limit while they were received
+        try:
+            with stage_timer("upload"):
+                upload = await stream_upload_file(
+                    file,
+                    settings.UPLOAD_DIR,
+                    max_size=settings.MAX_FILE_SIZE,
+                    chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                    spool_size=settings.UPLOAD_SPOOL_SIZE,
+                )
+        except FileTooLargeError:
+            TRANSCRIPTION_REQUESTS.labels(mode=mode, outcome="too_large").inc()
+            raise
 
+        # Shed load up front rather than letting every request time out
+        try:
+            ticket = await self._admit(upload)
+        except ServiceUnavailableError:
+            upload.close()
+            TRANSCRIPTION_REQUESTS.labels(mode=mode, outcome="rejected").inc()
+            raise
+
+        if background:
+            return await self._submit_job(upload, current_user, session, ticket)
+
+        in_flight = TRANSCRIPTIONS_IN_FLIGHT.labels(mode=mode)
+        in_flight.inc()
         try:
             # Transcribe audio
-            result = await self.transcription_service.transcribe_audio(
-                file_path, file.filename
-            )
+            result = await self.transcription_service.transcribe_audio(upload)
+            await charge_audio_seconds(result.get("duration"))
 
             # Save transcript to database
-            transcript_data = TranscriptCreate(
-                filename=result["filename"],
-                transcription=result["transcription"],
-                duration=result.get("duration"),
-                file_size=result.get("file_size"),
-            )
             if current_user.id is None:
                 raise ValidationError("User ID is required")
-            transcript = Transcript(**transcript_data.model_dump(), user_id=current_user.id)
-
-            session.add(transcript)
-            await session.commit()
-            await session.refresh(transcript)
+            transcript = await self._save_transcript(result, current_user.id, session)
 
+            TRANSCRIPTION_REQUESTS.labels(mode=mode, outcome="success").inc()
             return TranscriptRead.model_validate(transcript)
 
         except TranscriptionError as e:
+            TRANSCRIPTION_REQUESTS.labels(mode=mode, outcome="failed").inc()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
         except Exception as e:
+            TRANSCRIPTION_REQUESTS.labels(mode=mode, outcome="failed").inc()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Transcription failed: {str(e)}",
             )
         finally:
             # Clean up uploaded file
-            cleanup_file(file_path)
+            upload.close()
+            self._release(ticket)
+            in_flight.dec()
+
+    async def transcribe_batch(
+        self,
+        files: List[UploadFile],
+        current_user: User = Depends(get_current_user),
+    ) -> StreamingResponse:
+        """Transcribe many files, or one zip/tar archive, streaming NDJSON results"""
+        if current_user.id is None:
+            raise ValidationError("User ID is required")
+        user_id = current_user.id
+
+        uploads = await self._receive_batch(files)
+        # The response outlives the request's dependencies and context
+        rate_limit = current_rate_limit.get()
+
+        async def transcribe(index: int) -> Dict[str, Any]:
+            upload = uploads[index]
+            ticket = None
+            try:
+                # Files are admitted one at a time as they start: a whole
+                # batch can exceed the latency budget on an idle service
+                ticket = await self._admit_waiting(upload)
+                with TRANSCRIPTIONS_IN_FLIGHT.labels(mode="batch").track_inprogress():
+                    result = await self.transcription_service.transcribe_audio(upload)
+                await charge_audio_seconds(result.get("duration"), rate_limit)
+                return result
+            finally:
+                upload.close()
+                self._release(ticket)
+
+        def failure(index: int, error: BaseException) -> Dict[str, Any]:
+            return {
+                "index": index,
+                "filename": uploads[index].filename,
+                "status": "failed",
+                "error": str(error),
+            }
+
+        async def results() -> AsyncIterator[str]:
+            loop = asyncio.get_running_loop()
+            slots = settings.UPLOAD_BATCH_CONCURRENCY
+            waiting = list(range(len(uploads)))
+            running: Dict[asyncio.Task, int] = {}
+            # Finished transcriptions wait here to be inserted together
+            unsaved: List[Tuple[int, Dict[str, Any]]] = []
+            flush_at = 0.0
+            counts = {"completed": 0, "failed": 0}
+
+            def report(line: Dict[str, Any]) -> str:
+                ok = line["status"] == "completed"
+                counts["completed" if ok else "failed"] += 1
+                TRANSCRIPTION_REQUESTS.labels(
+                    mode="batch", outcome="success" if ok else "failed"
+                ).inc()
+                return json.dumps(line) + "\n"
+
+            try:
+                while waiting or running or unsaved:
+                    # A few files at a time, so one batch can't take every worker
+                    while waiting and len(running) < slots:
+                        index = waiting.pop(0)
+                        running[asyncio.create_task(transcribe(index))] = index
+
+                    if running:
+                        timeout = (
+                            max(0.0, flush_at - loop.time()) if unsaved else None
+                        )
+                        done, _ = await asyncio.wait(
+                            running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            index = running.pop(task)
+                            if task.exception() is not None:
+                                yield report(failure(index, task.exception()))
+                                continue
+                            if not unsaved:
+                                flush_at = (
+                                    loop.time() + settings.UPLOAD_BATCH_FLUSH_MS / 1000
+                                )
+                            unsaved.append((index, task.result()))
+
+                    # Lines for saved transcripts go out once they're committed
+                    if unsaved and (
+                        len(unsaved) >= settings.UPLOAD_BATCH_FLUSH_ROWS
+                        or loop.time() >= flush_at
+                        or not running
+                    ):
+                        lines = await self._save_batch(unsaved, uploads, user_id)
+                        unsaved = []
+                        for line in lines:
+                            yield report(line)
+
+                yield json.dumps({"done": True, **counts}) + "\n"
+            finally:
+                # Client went away: stop the rest of the batch
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                for index in waiting:
+                    uploads[index].close()
+
+        return StreamingResponse(
+            results(),
+            media_type="application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _receive_batch(self, files: List[UploadFile]) -> List[SpooledUpload]:
+        """Spool every file of a batch upload, unpacking a single archive"""
+        if not files:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No files provided"
+            )
+        archive = len(files) == 1 and is_archive_file(files[0].filename or "")
+        if not archive:
+            if len(files) > settings.UPLOAD_BATCH_MAX_FILES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"At most {settings.UPLOAD_BATCH_MAX_FILES} files per batch",
+                )
+            unsupported = [f.filename for f in files if not is_audio_file(f.filename or "")]
+            if unsupported:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unsupported file format: {', '.join(map(str, unsupported))}. "
+                    f"Supported formats: {', '.join(self.transcription_service.get_supported_formats())}, "
+                    "or a single zip/tar archive",
+                )
+
+        uploads: List[SpooledUpload] = []
+        try:
+            with stage_timer("upload"):
+                for file in files:
+                    upload = await stream_upload_file(
+                        file,
+                        settings.UPLOAD_DIR,
+                        max_size=(
+                            settings.UPLOAD_BATCH_MAX_ARCHIVE_SIZE
+                            if archive
+                            else settings.MAX_FILE_SIZE
+                        ),
+                        chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                        spool_size=settings.UPLOAD_SPOOL_SIZE,
+                    )
+                    uploads.append(upload)
+
+            if archive:
+                packed = uploads.pop()
+                try:
+                    uploads = await extract_audio_files(
+                        packed,
+                        settings.UPLOAD_DIR,
+                        max_size=settings.MAX_FILE_SIZE,
+                        max_files=settings.UPLOAD_BATCH_MAX_FILES,
+                        chunk_size=settings.UPLOAD_CHUNK_SIZE,
+                        spool_size=settings.UPLOAD_SPOOL_SIZE,
+                    )
+                finally:
+                    packed.close()
+                if not uploads:
+                    raise ValidationError("Archive contains no supported audio files")
+        except FileTooLargeError:
+            for upload in uploads:
+                upload.close()
+            TRANSCRIPTION_REQUESTS.labels(mode="batch", outcome="too_large").inc()
+            raise
+        except BaseException:
+            for upload in uploads:
+                upload.close()
+            raise
+        return uploads
+
+    async def _save_batch(
+        self,
+        succeeded: List[Tuple[int, Dict[str, Any]]],
+        uploads: List[SpooledUpload],
+        user_id: uuid.UUID,
+    ) -> List[Dict[str, Any]]:
+        """Insert a group of finished transcriptions in one transaction"""
+        transcripts = [
+            Transcript(
+                **TranscriptCreate(
+                    filename=result["filename"],
+                    transcription=result["transcription"],
+                    duration=result.get("duration"),
+                    file_size=result.get("file_size"),
+                ).model_dump(),
+                user_id=user_id,
+                content_hash=result.get("content_hash"),
+            )
+            for _, result in succeeded
+        ]
+        # Everything TranscriptRead needs is set client-side, before the insert
+        reads = [TranscriptRead.model_validate(t) for t in transcripts]
+        try:
+            async with AsyncSession(engine) as session:
+                session.add_all(transcripts)
+                with stage_timer("db_commit"):
+                    await session.commit()
+        except Exception as e:
+            return [
+                {
+                    "index": index,
+                    "filename": uploads[index].filename,
+                    "status": "failed",
+                    "error": f"Failed to save transcript: {e}",
+                }
+                for index, _ in succeeded
+            ]
+        return [
+            {
+                "index": index,
+                "filename": uploads[index].filename,
+                "status": "completed",
+                "transcript": read.model_dump(mode="json"),
+            }
+            for (index, _), read in zip(succeeded, reads)
+        ]
+
+    async def _admit(self, upload: SpooledUpload) -> Optional[AdmissionTicket]:
+        if not settings.ADMISSION_ENABLED:
+            return None
+        # A cached result runs no inference, so it doesn't join the backlog
+        if await self.transcription_service.is_cached(upload):
+            return None
+        return admission_controller.admit(
+            admission_controller.estimate_audio_seconds(upload.filename, upload.size)
+        )
+
+    async def _admit_waiting(self, upload: SpooledUpload) -> Optional[AdmissionTicket]:
+        """Admit an upload once there is capacity, giving up after a while"""
+        deadline = time.monotonic() + settings.UPLOAD_BATCH_ADMISSION_WAIT_S
+        while True:
+            try:
+                return await self._admit(upload)
+            except ServiceUnavailableError as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+                await asyncio.sleep(min(e.retry_after, remaining))
+
+    def _release(self, ticket: Optional[AdmissionTicket]) -> None:
+        if ticket is not None:
+            admission_controller.release(ticket)
+
+    async def _save_transcript(
+        self, result: Dict[str, Any], user_id: uuid.UUID, session: AsyncSession
+    ) -> Transcript:
+        """Persist a transcription result as the user's transcript"""
+        transcript_data = TranscriptCreate(
+            filename=result["filename"],
+            transcription=result["transcription"],
+            duration=result.get("duration"),
+            file_size=result.get("file_size"),
+        )
+        transcript = Transcript(
+            **transcript_data.model_dump(),
+            user_id=user_id,
+            content_hash=result.get("content_hash"),
+        )
+
+        session.add(transcript)
+        with stage_timer("db_commit"):
+            await session.commit()
+        await session.refresh(transcript)
+
+        return transcript
+
+    async def _submit_job(
+        self,
+        upload: SpooledUpload,
+        current_user: User,
+        session: AsyncSession,
+        ticket: Optional[AdmissionTicket] = None,
+    ) -> TranscriptionJobRead:
+        """Queue an already received upload for background transcription"""
+        if current_user.id is None:
+            upload.close()
+            self._release(ticket)
+            raise ValidationError("User ID is required")
+        user_id = current_user.id
+
+        try:
+            job = await job_service.create_job(upload.filename, user_id, session)
+        except Exception:
+            upload.close()
+            self._release(ticket)
+            raise
+
+        # Jobs run outside the request, so keep its rate-limit bucket for them
+        rate_limit = current_rate_limit.get()
+
+        async def work() -> uuid.UUID:
+            in_flight = TRANSCRIPTIONS_IN_FLIGHT.labels(mode="async")
+            in_flight.inc()
+            try:
+                result = await self.transcription_service.transcribe_audio(upload)
+                await charge_audio_seconds(result.get("duration"), rate_limit)
+                async with AsyncSession(engine) as job_session:
+                    transcript = await self._save_transcript(
+                        result, user_id, job_session
+                    )
+                    assert transcript.id is not None
+            except Exception:
+                TRANSCRIPTION_REQUESTS.labels(mode="async", outcome="failed").inc()
+                raise
+            finally:
+                upload.close()
+                self._release(ticket)
+                in_flight.dec()
+            TRANSCRIPTION_REQUESTS.labels(mode="async", outcome="success").inc()
+            return transcript.id
+
+        assert job.id is not None
+        await job_service.enqueue(job.id, work)
+        TRANSCRIPTION_REQUESTS.labels(mode="async", outcome="queued").inc()
+        return TranscriptionJobRead.model_validate(job)
+
+    async def _get_job(
+        self, job_id: uuid.UUID, current_user: User, session: AsyncSession
+    ) -> TranscriptionJob:
+        statement = select(TranscriptionJob).where(
+            TranscriptionJob.id == job_id, TranscriptionJob.user_id == current_user.id
+        )
+        result = await session.execute(statement)
+        job = result.scalar_one_or_none()
+
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+            )
+
+        return job
+
+    async def get_job(
+        self,
+        job_id: uuid.UUID,
+        current_user: User = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ) -> TranscriptionJobRead:
+        """Get status of a transcription job, with the transcript once done"""
+        job = await self._get_job(job_id, current_user, session)
+        job_read = TranscriptionJobRead.model_validate(job)
+
+        if job.transcript_id is not None:
+            transcript = await session.get(Transcript, job.transcript_id)
+            if transcript is not None:
+                job_read.transcript = TranscriptRead.model_validate(transcript)
+
+        return job_read
+
+    async def stream_job_events(
+        self,
+        job_id: uuid.UUID,
+        current_user: User = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ) -> StreamingResponse:
+        """Stream job status changes as Server-Sent Events"""
+        # Subscribe before reading the row so no transition is missed
+        events = job_service.subscribe(job_id)
+        try:
+            job = await self._get_job(job_id, current_user, session)
+        except HTTPException:
+            job_service.unsubscribe(job_id, events)
+            raise
+
+        initial: Dict[str, Any] = {"status": job.status.value}
+        if job.error:
+            initial["error"] = job.error
+        if job.transcript_id:
+            initial["transcript_id"] = str(job.transcript_id)
+
+        async def event_stream() -> AsyncIterator[str]:
+            try:
+                event = initial
+                while True:
+                    yield f"event: status\ndata: {json.dumps(event)}\n\n"
+                    if JobStatus(event["status"]) in TERMINAL_STATUSES:
+                        return
+                    event = None
+                    while event is None:
+                        try:
+                            event = await asyncio.wait_for(events.get(), timeout=15)
+                        except asyncio.TimeoutError:
+                            # Keep idle proxies from closing the connection
+                            yield ": keep-alive\n\n"
+            finally:
+                job_service.unsubscribe(job_id, events)
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def stream_transcription(
+        self,
+        websocket: WebSocket,
+        current_user: User,
+        encoding: str = "pcm_s16le",
+        sample_rate: int = 16000,
+        filename: str = "live-dictation",
+    ) -> None:
+        """Transcribe audio frames from a WebSocket as they arrive.
+
+        Binary messages carry audio; ``{"type": "end"}`` (or closing the
+        socket) ends the stream. The client receives ``partial`` and
+        ``final`` segments, then ``done`` with the saved transcript.
+        """
+        transcriber = StreamingTranscriber(
+            self.transcription_service.transcribe_segment
+        )
+        new_audio = asyncio.Event()
+        ending = False
+
+        def on_samples(samples) -> None:
+            transcriber.add(samples)
+            if transcriber.ready():
+                new_audio.set()
+
+        try:
+            decoder = create_stream_decoder(encoding, sample_rate, on_samples)
+        except ValueError as e:
+            raise WebSocketException(
+                code=status.WS_1003_UNSUPPORTED_DATA, reason=str(e)
+            )
+
+        await websocket.accept()
+        STREAM_SESSIONS.inc()
+        connected = True
+        first_audio_at: Optional[float] = None
+        first_word_sent = False
+        bytes_received = 0
+
+        async def send_events(events: List[Dict[str, Any]]) -> None:
+            nonlocal connected, first_word_sent
+            for event in events:
+                if not first_word_sent and first_audio_at is not None:
+                    first_word_sent = True
+                    STREAM_TIME_TO_FIRST_WORD.observe(
+                        time.perf_counter() - first_audio_at
+                    )
+                if connected:
+                    try:
+                        await websocket.send_json(event)
+                    except (WebSocketDisconnect, RuntimeError):
+                        # Keep transcribing; the transcript is still saved
+                        connected = False
+
+        async def process() -> None:
+            # One pass at a time; audio arriving meanwhile joins the next pass
+            while True:
+                await new_audio.wait()
+                new_audio.clear()
+                if ending:
+                    return
+                while transcriber.ready():
+                    await send_events(await transcriber.step())
+
+        processor = asyncio.create_task(process())
+        try:
+            while not processor.done():
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    connected = False
+                    break
+
+                if message.get("bytes"):
+                    if first_audio_at is None:
+                        first_audio_at = time.perf_counter()
+                    bytes_received += len(message["bytes"])
+                    if bytes_received > settings.MAX_FILE_SIZE:
+                        await websocket.close(
+                            code=status.WS_1009_MESSAGE_TOO_BIG,
+                            reason="Stream exceeds the maximum upload size",
+                        )
+                        connected = False
+                        break
+                    await decoder.feed(message["bytes"])
+                elif message.get("text"):
+                    try:
+                        control = json.loads(message["text"])
+                    except ValueError:
+                        control = None
+                    if isinstance(control, dict) and control.get("type") == "end":
+                        break
+
+            # Decode what's left, let the current pass finish, then flush
+            await decoder.close()
+            ending = True
+            new_audio.set()
+            await processor
+            await send_events(await transcriber.flush())
+
+        except TranscriptionError as e:
+            TRANSCRIPTION_REQUESTS.labels(mode="stream", outcome="failed").inc()
+            if connected:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+            return
+        finally:
+            processor.cancel()
+            await decoder.close()
+            STREAM_SESSIONS.dec()
+
+        TRANSCRIPTION_REQUESTS.labels(mode="stream", outcome="success").inc()
+        await charge_audio_seconds(transcriber.duration)
+
+        transcript_read = None
+        if transcriber.text:
+            if current_user.id is None:
+                raise ValidationError("User ID is required")
+            result = {
+                "filename": filename,
+                "transcription": transcriber.text,
+                "duration": transcriber.duration,
+                "file_size": bytes_received,
+            }
+            async with AsyncSession(engine) as session:
+                transcript = await self._save_transcript(
+                    result, current_user.id, session
+                )
+                transcript_read = TranscriptRead.model_validate(transcript)
+
+        if connected:
+            await websocket.send_json(
+                {
+                    "type": "done",
+                    "transcript": (
+                        transcript_read.model_dump(mode="json")
+                        if transcript_read
+                        else None
+                    ),
+                }
+            )
+            await websocket.close()
 
     async def get_transcripts(
         self,
@@ -98,7 +690,7 @@ class TranscriptionController:
         statement = (
             select(Transcript)
             .where(Transcript.user_id == current_user.id)
-            .order_by(desc(Transcript.created_at))
+            .order_by(desc(Transcript.created_at), desc(Transcript.id))
             .offset(skip)
             .limit(limit)
         )
@@ -108,6 +700,131 @@ class TranscriptionController:
 
         return [TranscriptRead.model_validate(transcript) for transcript in transcripts]
 
+    async def get_transcript_summaries(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        preview_chars: int = 0,
+        current_user: User = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ) -> TranscriptPage:
+        """Page through the user's history newest-first, without transcript bodies"""
+        columns = [
+            Transcript.id,
+            Transcript.filename,
+            Transcript.duration,
+            Transcript.file_size,
+            Transcript.created_at,
+        ]
+        if preview_chars:
+            # From the plaintext preview column: bodies are stored compressed
+            columns.append(
+                func.substr(Transcript.preview, 1, preview_chars).label("preview")
+            )
+
+        # Keyset pagination: seek past the cursor on the (user_id, created_at, id)
+        # index instead of counting through skipped rows
+        statement = select(*columns).where(Transcript.user_id == current_user.id)
+        if cursor:
+            try:
+                created_at, transcript_id = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                )
+            statement = statement.where(
+                tuple_(Transcript.created_at, Transcript.id)
+                < tuple_(created_at, transcript_id)
+            )
+        statement = statement.order_by(
+            desc(Transcript.created_at), desc(Transcript.id)
+        ).limit(limit + 1)
+
+        result = await session.execute(statement)
+        rows = result.mappings().all()
+
+        items = [TranscriptSummary.model_validate(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return TranscriptPage(items=items, next_cursor=next_cursor)
+
+    async def export_transcripts(
+        self,
+        format: str = "ndjson",
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        current_user: User = Depends(get_current_user),
+    ) -> StreamingResponse:
+        """Stream all of the user's transcripts, oldest first, in one file"""
+        try:
+            encoder = export_encoder(format)
+        except ImportError:
+            raise HTTPException(
+                status_code=status.HTTP_501_NOT_IMPLEMENTED,
+                detail=f"{format} export needs the 'export' extra installed",
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        statement = select(
+            *(getattr(Transcript, column) for column in EXPORT_COLUMNS)
+        ).where(Transcript.user_id == current_user.id)
+        if created_after:
+            statement = statement.where(Transcript.created_at >= created_after)
+        if created_before:
+            statement = statement.where(Transcript.created_at < created_before)
+        statement = statement.order_by(Transcript.created_at, Transcript.id)
+        batch_size = settings.EXPORT_BATCH_SIZE
+
+        async def rows() -> AsyncIterator[bytes]:
+            header = encoder.header()
+            if header:
+                yield header
+            # The request's session is closed once streaming starts. A
+            # server-side cursor fetches batch_size rows at a time, so memory
+            # stays flat however many transcripts there are
+            async with AsyncSession(engine) as session:
+                result = await session.stream(
+                    statement.execution_options(yield_per=batch_size)
+                )
+                async for batch in result.mappings().partitions(batch_size):
+                    yield encoder.encode(batch)
+            tail = encoder.finish()
+            if tail:
+                yield tail
+
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        return StreamingResponse(
+            rows(),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": f'attachment; filename="transcripts-{stamp}.{format}"',
+                "Cache-Control": "no-store",
+            },
+        )
+
+    async def search_transcripts(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        current_user: User = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ) -> List[TranscriptSearchResult]:
+        """Full-text search over the user's transcripts"""
+        if not search_terms(query):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search query must contain at least one word",
+            )
+        assert current_user.id is not None
+        return await self.search_service.search(
+            current_user.id, query, limit, offset, session
+        )
+
     async def get_transcript(
         self,
         transcript_id: uuid.UUID,
@@ -120,7 +837,7 @@ class TranscriptionController:
         )
 
         result = await session.execute(statement)
-        transcript = result.first()
+        transcript = result.scalar_one_or_none()
 
         if not transcript:
             raise HTTPException(
@@ -129,6 +846,38 @@ class TranscriptionController:
 
         return TranscriptRead.model_validate(transcript)
 
+    async def get_transcript_text(
+        self,
+        transcript_id: uuid.UUID,
+        accept_encoding: Optional[str] = None,
+        current_user: User = Depends(get_current_user),
+        session: AsyncSession = Depends(get_async_session),
+    ) -> Response:
+        """Transcript body as text, sent as stored when the client accepts that"""
+        # Read the column as raw bytes, skipping CompressedText's decompression
+        statement = select(
+            type_coerce(Transcript.transcription, LargeBinary).label("body")
+        ).where(Transcript.id == transcript_id, Transcript.user_id == current_user.id)
+
+        result = await session.execute(statement)
+        body = result.scalar_one_or_none()
+
+        if body is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Transcript not found"
+            )
+
+        headers = {"Vary": "Accept-Encoding"}
+        encoding = stored_encoding(body)
+        if encoding and accepts_encoding(accept_encoding, encoding):
+            headers["Content-Encoding"] = encoding
+            content = body
+        else:
+            content = decompress_text(body).encode()
+        return Response(
+            content, media_type="text/plain; charset=utf-8", headers=headers
+        )
+
     async def delete_transcript(
         self,
         transcript_id: uuid.UUID,
@@ -148,7 +897,11 @@ class TranscriptionController:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Transcript not found"
             )
 
+        content_hash = transcript.content_hash
         await session.delete(transcript)
+        if content_hash is not None:
+            # Don't keep a copy of the text once no transcript refers to it
+            await transcription_cache.discard_unreferenced(content_hash, session)
         await session.commit()
 
         return {"message": "Transcript deleted successfully"}
@@ -7,6 +7,7 @@ from .custom_exceptions import (
     TranscriptionError,
     FileTooLargeError,
     UnsupportedMediaTypeError,
+    ServiceUnavailableError,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "TranscriptionError",
     "FileTooLargeError",
     "UnsupportedMediaTypeError",
+    "ServiceUnavailableError",
 ]
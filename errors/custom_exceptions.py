@@ -1,15 +1,20 @@
 from fastapi import HTTPException, status
+from typing import Dict, Optional
 
 
 class CustomException(Exception):
     """Base custom exception"""
 
     def __init__(
-        self, detail: str, status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+        self,
+        detail: str,
+        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        headers: Optional[Dict[str, str]] = None,
     ):
         super().__init__(detail)
         self.detail = detail
         self.status_code = status_code
+        self.headers = headers
 
 
 class ValidationError(CustomException):
@@ -59,3 +64,15 @@ class UnsupportedMediaTypeError(CustomException):
 
     def __init__(self, detail: str):
         super().__init__(detail, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+
+class ServiceUnavailableError(CustomException):
+    """Overload error exception, telling clients when to retry"""
+
+    def __init__(self, detail: str, retry_after: int):
+        super().__init__(
+            detail,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(retry_after)},
+        )
+        self.retry_after = retry_after
@@ -1,15 +1,27 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+import asyncio
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from loguru import logger
 import os
 import sys
 from config.settings import settings
 from routes.auth import auth_router
 from routes.transcription import transcription_router
+from routes.profiles import profile_router
 from errors.custom_exceptions import CustomException
-from models import create_db_and_tables
+from middleware.body_limit import BodySizeLimitMiddleware
+from middleware.rate_limit import RateLimitMiddleware
+from middleware.server_timing import ServerTimingMiddleware
+from middleware.profiling import ProfilingMiddleware
+from models import create_db_and_tables, engine
+from services.inference_worker import MODEL_NAME, inference_pool
+from services.batching import inference_batcher
+from services.job_service import job_service
+from services.rate_limiter import create_rate_limiter
+from services.profiler import RequestProfiler, profile_store
 
 
 @asynccontextmanager
@@ -24,11 +36,34 @@ async def lifespan(app: FastAPI):
     # Create database tables
     await create_db_and_tables()
 
+    # Start background workers for async transcription jobs
+    await job_service.start()
+
+    # Load and warm up the model in the background; /ready reports when done
+    warm_up_task = None
+    if settings.PRELOAD_MODEL:
+        warm_up_task = asyncio.create_task(_warm_up_model())
+
     logger.info("AI Scribe API started successfully")
     yield
 
     # Shutdown
     logger.info("Shutting down AI Scribe API...")
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+    await job_service.shutdown()
+    await inference_batcher.shutdown()
+    await inference_pool.shutdown()
+    if rate_limiter is not None:
+        await rate_limiter.backend.close()
+    await engine.dispose()
+
+
+async def _warm_up_model():
+    try:
+        await inference_pool.warm_up()
+    except Exception as e:
+        logger.error(f"Model warm-up failed: {e}")
 
 
 # Configure logging
@@ -43,6 +78,21 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Oversized uploads are cut off while they arrive, before multipart parsing
+app.add_middleware(BodySizeLimitMiddleware)
+
+# Rate limiting sits inside CORS so preflights and 429s still get CORS headers
+rate_limiter = create_rate_limiter() if settings.RATE_LIMIT_ENABLED else None
+if rate_limiter is not None:
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
+# Profiles cover everything but CORS, rate limiting included
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware, profiler=RequestProfiler(profile_store))
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -55,12 +105,18 @@ app.add_middleware(
 # Include routers
 app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
 app.include_router(transcription_router, prefix=settings.API_V1_PREFIX)
+if settings.PROFILING_ENABLED:
+    app.include_router(profile_router, prefix=settings.API_V1_PREFIX)
 
 
 @app.exception_handler(CustomException)
 async def custom_exception_handler(_: Request, exc: CustomException):
     """Handle custom exceptions"""
-    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=exc.headers,
+    )
 
 
 @app.get("/health")
@@ -69,6 +125,33 @@ async def health_check():
     return {"status": "healthy", "service": "AI Scribe API"}
 
 
+@app.get("/ready")
+async def readiness_check(response: Response):
+    """Readiness probe: 503 until the model is loaded and warmed up"""
+    ready = inference_pool.warm or not settings.PRELOAD_MODEL
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    return {
+        "status": "ready" if ready else "warming_up",
+        "model": MODEL_NAME,
+        "backend": inference_pool.backend,
+        "model_loaded": inference_pool.started,
+        "model_warm": inference_pool.warm,
+        "executor": inference_pool.mode,
+        "workers": inference_pool.workers,
+        "in_flight": inference_pool.in_flight,
+        "queue_depth": inference_pool.queue_depth + inference_batcher.pending,
+        "queued_jobs": job_service.queue_depth,
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -1,7 +1,21 @@
 from .auth_middleware import (
     get_current_user,
     get_optional_current_user,
+    get_websocket_user,
     get_async_session,
 )
+from .body_limit import BodySizeLimitMiddleware
+from .rate_limit import RateLimitMiddleware
+from .server_timing import ServerTimingMiddleware
+from .profiling import ProfilingMiddleware
 
-__all__ = ["get_current_user", "get_optional_current_user", "get_async_session"]
+__all__ = [
+    "get_current_user",
+    "get_optional_current_user",
+    "get_websocket_user",
+    "get_async_session",
+    "BodySizeLimitMiddleware",
+    "RateLimitMiddleware",
+    "ServerTimingMiddleware",
+    "ProfilingMiddleware",
+]
@@ -1,13 +1,12 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, WebSocket, WebSocketException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 import uuid
 from fastapi import Request
 from models import engine
 from models.user import User
-from utils.jwt_utils import verify_token
+from services.principal_cache import principal_cache
 
 security = HTTPBearer()
 
@@ -17,13 +16,9 @@ async def get_async_session():
     async with AsyncSession(engine) as session:
         yield session
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_async_session),
-) -> User:
-    """Get current authenticated user"""
-    token = credentials.credentials
-    payload = verify_token(token, "access")
+async def authenticate_token(token: str, session: AsyncSession) -> User:
+    """Resolve an access token to its active user"""
+    payload = principal_cache.verify_token(token, "access")
 
     if payload is None:
         raise HTTPException(
@@ -49,9 +44,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    statement = select(User).where(User.id == user_uuid)
-    result = await session.execute(statement)
-    user = result.scalar_one_or_none()
+    user = await principal_cache.get_user(user_uuid, session)
 
     if user is None:
         raise HTTPException(
@@ -70,6 +63,37 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_async_session),
+) -> User:
+    """Get current authenticated user"""
+    return await authenticate_token(credentials.credentials, session)
+
+
+async def get_websocket_user(websocket: WebSocket) -> User:
+    """Get the user of a WebSocket from its Bearer header or ``token`` query param"""
+    # Browsers can't set headers on a WebSocket handshake
+    token = websocket.query_params.get("token")
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        token = credentials
+
+    if not token:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION, reason="Not authenticated"
+        )
+
+    # Short-lived session: the socket may stay open for a long time
+    async with AsyncSession(engine) as session:
+        try:
+            return await authenticate_token(token, session)
+        except HTTPException as e:
+            raise WebSocketException(
+                code=status.WS_1008_POLICY_VIOLATION, reason=e.detail
+            )
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session: AsyncSession = Depends(get_async_session),
@@ -0,0 +1,83 @@
+from typing import Dict, Optional, Tuple
+from fastapi import HTTPException, status
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config.settings import settings
+
+# Multipart boundaries, part headers and small form fields around the file
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class BodySizeLimitMiddleware:
+    """Rejects oversized upload bodies with 413 before they are parsed.
+
+    The multipart parser spools a whole request before the endpoint runs,
+    so size checks in the endpoint come too late. Bodies declaring a
+    Content-Length over the route's limit are rejected without reading
+    them; others are counted as they arrive and cut off at the limit.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        prefix = f"{settings.API_V1_PREFIX}/transcriptions"
+        single = settings.MAX_FILE_SIZE + MULTIPART_OVERHEAD
+        self.limits: Dict[Tuple[str, str], int] = {
+            ("POST", f"{prefix}/"): single,
+            ("POST", prefix): single,
+            # A batch request carries an archive or several files
+            ("POST", f"{prefix}/batch"): settings.UPLOAD_BATCH_MAX_ARCHIVE_SIZE
+            + MULTIPART_OVERHEAD,
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = (
+            self.limits.get((scope["method"], scope["path"]))
+            if scope["type"] == "http"
+            else None
+        )
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = self._content_length(scope)
+        if declared is not None and declared > limit:
+            response = JSONResponse(
+                {"detail": self._detail(limit)},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                headers={"Connection": "close"},
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the body parser; FastAPI lets HTTPExceptions
+                    # through and the rest of the body is never read
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self._detail(limit),
+                        headers={"Connection": "close"},
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _content_length(self, scope: Scope) -> Optional[int]:
+        value = Headers(scope=scope).get("content-length")
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def _detail(self, limit: int) -> str:
+        return (
+            "File too large. Maximum size: "
+            f"{(limit - MULTIPART_OVERHEAD) / 1024 / 1024:.1f}MB"
+        )
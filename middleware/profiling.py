@@ -0,0 +1,46 @@
+import asyncio
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from services.profiler import RequestProfiler
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class ProfilingMiddleware:
+    """Samples selected requests with a stack profiler.
+
+    Profiled responses carry ``X-Profile-Id``; once the request finishes its
+    speedscope profile can be downloaded from ``/profiles/{id}`` with the
+    admin token (open it at https://www.speedscope.app).
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.should_profile(
+            Headers(scope=scope).get(PROFILE_TOKEN_HEADER)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.profiler.store.new_id()
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = profile_id
+            await send(message)
+
+        profiler = self.profiler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            session = self.profiler.stop(profiler)
+            label = f"{scope['method']} {scope['path']}"
+            try:
+                await asyncio.to_thread(self.profiler.save, profile_id, session, label)
+            except Exception as e:
+                logger.warning(f"Failed to save profile {profile_id}: {e}")
@@ -0,0 +1,147 @@
+import re
+from typing import Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config.settings import settings
+from services.principal_cache import principal_cache
+from services.rate_limiter import (
+    BucketState,
+    RateLimitContext,
+    RateLimiter,
+    current_rate_limit,
+)
+
+
+class RateLimitMiddleware:
+    """Token-bucket rate limiting per user (or per client IP when anonymous).
+
+    API requests cost one request token. Polling a job and reading
+    transcripts back cost a token from a separate, larger reads bucket, so
+    waiting on results doesn't use up the budget for everything else.
+    Transcription uploads and live streams are admitted while the client has
+    audio-seconds left and are charged their audio duration once it is known
+    (``charge_audio_seconds``). Responses carry ``X-RateLimit-*`` headers;
+    rejections are 429 with ``Retry-After``.
+    """
+
+    HEADER_PREFIXES = {
+        "requests": "X-RateLimit",
+        "reads": "X-RateLimit-Read",
+        "audio_seconds": "X-RateLimit-Audio",
+    }
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+        prefix = f"{settings.API_V1_PREFIX}/transcriptions"
+        self.audio_routes = {
+            ("POST", f"{prefix}/"),
+            ("POST", prefix),
+            ("POST", f"{prefix}/batch"),
+            ("WEBSOCKET", f"{prefix}/stream"),
+        }
+        # GETs of job status and events, and of transcripts by id or page
+        self.read_routes = re.compile(
+            re.escape(prefix)
+            + r"(/|/summaries|/jobs/[^/]+(/events)?|/[0-9a-fA-F-]{32,36}(/text)?)?"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] not in ("http", "websocket")
+            or scope.get("method") == "OPTIONS"
+            or not scope["path"].startswith(settings.API_V1_PREFIX)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = self._client_key(scope)
+        bucket, cost = self._bucket(scope.get("method", "WEBSOCKET"), scope["path"])
+        state = await self.limiter.consume(key, bucket, cost)
+        if not state.allowed:
+            await self._reject(scope, receive, send, bucket, state, cost)
+            return
+
+        context = RateLimitContext(self.limiter, key)
+        token = current_rate_limit.set(context)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Transcriptions report the bucket after their audio was charged
+                headers = MutableHeaders(scope=message)
+                self._set_headers(headers, bucket, context.audio_state or state)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_rate_limit.reset(token)
+
+    def _bucket(self, method: str, path: str) -> Tuple[str, float]:
+        """The bucket a request is charged to, and its up-front cost"""
+        if (method, path) in self.audio_routes:
+            return "audio_seconds", 0.0
+        if method == "GET" and self.read_routes.fullmatch(path):
+            return "reads", 1.0
+        return "requests", 1.0
+
+    def _client_key(self, scope: Scope) -> str:
+        token: Optional[str] = None
+        scheme, _, credentials = (
+            Headers(scope=scope).get("authorization", "").partition(" ")
+        )
+        if scheme.lower() == "bearer" and credentials:
+            token = credentials
+        elif scope["type"] == "websocket":
+            token = QueryParams(scope.get("query_string", b"")).get("token")
+
+        if token:
+            payload = principal_cache.verify_token(token, "access")
+            if payload and payload.get("sub"):
+                return f"user:{payload['sub']}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    def _set_headers(
+        self, headers: MutableHeaders, bucket: str, state: BucketState
+    ) -> None:
+        prefix = self.HEADER_PREFIXES[bucket]
+        headers[f"{prefix}-Limit"] = str(int(state.capacity))
+        headers[f"{prefix}-Remaining"] = str(state.remaining)
+        headers[f"{prefix}-Reset"] = str(state.reset_after)
+
+    async def _reject(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        bucket: str,
+        state: BucketState,
+        cost: float,
+    ) -> None:
+        retry_after = state.retry_after(cost)
+        if scope["type"] == "websocket":
+            # Closing before accept makes the server answer the handshake with 403
+            await send(
+                {
+                    "type": "websocket.close",
+                    "code": 1008,
+                    "reason": f"Rate limit exceeded, retry in {retry_after}s",
+                }
+            )
+            return
+
+        detail = (
+            "Rate limit exceeded"
+            if bucket != "audio_seconds"
+            else "Transcription quota exceeded (audio seconds)"
+        )
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": detail},
+            headers={"Retry-After": str(retry_after)},
+        )
+        self._set_headers(response.headers, bucket, state)
+        await response(scope, receive, send)
@@ -0,0 +1,49 @@
+import time
+from typing import Dict, List, Tuple
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils.metrics import request_timings
+
+
+class ServerTimingMiddleware:
+    """Adds a ``Server-Timing`` header with the request's pipeline stages.
+
+    Stages timed with ``stage_timer`` / ``observe_stage`` while handling the
+    request (upload, decode, inference, db_commit, ...) are summed by name
+    and reported in milliseconds, followed by ``app``: the time until the
+    response started. Browsers show the breakdown in their network panel.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        timings: List[Tuple[str, float]] = []
+        token = request_timings.set(timings)
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", self._format(timings, elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            request_timings.reset(token)
+
+    @staticmethod
+    def _format(timings: List[Tuple[str, float]], elapsed: float) -> str:
+        totals: Dict[str, float] = {}
+        for stage, seconds in timings:
+            totals[stage] = totals.get(stage, 0.0) + seconds
+        totals["app"] = elapsed
+        return ", ".join(
+            f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in totals.items()
+        )
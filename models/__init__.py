@@ -1,21 +1,75 @@
+from loguru import logger
 from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from config.settings import settings
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateColumn
+from .database import create_engine
 
-# Create async engine
-engine: AsyncEngine = create_async_engine(
-    settings.DATABASE_URL, echo=settings.DEBUG, future=True
-)
+# Create async engine (pooling and pragmas per DB_ENGINE_PROFILE)
+engine: AsyncEngine = create_engine()
 
 
 async def create_db_and_tables():
     """Create database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+        await conn.run_sync(create_search_index)
+
+
+def _add_missing_columns(connection):
+    """Add nullable columns declared after their table was first created.
+
+    ``create_all`` leaves existing tables alone. Anything beyond a new
+    nullable column (constraints, type changes) needs ``alembic upgrade head``
+    """
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    added = set()
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                raise RuntimeError(
+                    f"Column {table.name}.{column.name} is missing; "
+                    "run `alembic upgrade head`"
+                )
+            connection.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN "
+                    f"{CreateColumn(column).compile(dialect=connection.dialect)}"
+                )
+            )
+            logger.info(f"Added column {table.name}.{column.name}")
+            added.add(column)
+
+    if Transcript.__table__.c.preview in added:
+        backfill_previews(connection)
+
+
+def _create_missing_indexes(connection):
+    """Add indexes declared after their table was first created"""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 # Import models to ensure they're registered
 from .user import User
-from .transcript import Transcript
+from .transcript import Transcript, backfill_previews
+from .transcription_job import TranscriptionJob, JobStatus
+from .transcription_cache import TranscriptionCacheEntry
+from .search import create_search_index
 
-__all__ = ["User", "Transcript", "create_db_and_tables", "engine"]
+__all__ = [
+    "User",
+    "Transcript",
+    "TranscriptionJob",
+    "JobStatus",
+    "TranscriptionCacheEntry",
+    "create_db_and_tables",
+    "engine",
+]
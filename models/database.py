@@ -0,0 +1,81 @@
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from config.settings import settings
+
+ENGINE_PROFILES = ("tuned", "baseline")
+
+
+def engine_options(
+    url: str, profile: str = settings.DB_ENGINE_PROFILE
+) -> Dict[str, Any]:
+    """``create_async_engine`` keyword arguments for ``url`` under ``profile``"""
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown DB_ENGINE_PROFILE '{profile}'. "
+            f"Available: {', '.join(ENGINE_PROFILES)}"
+        )
+    options: Dict[str, Any] = {"echo": settings.DEBUG, "future": True}
+    if profile == "baseline":
+        return options
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        # sqlite3's own wait on a locked database, matching busy_timeout
+        options["connect_args"] = {"timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000}
+        return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_S,
+        pool_recycle=settings.DB_POOL_RECYCLE_S,
+        pool_pre_ping=True,
+    )
+    if parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            # SQLAlchemy's prepared statement cache and asyncpg's own
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def _is_memory_database(url: str) -> bool:
+    database = make_url(url).database
+    return not database or database == ":memory:" or "mode=memory" in url
+
+
+def _sqlite_pragmas(in_memory: bool) -> Dict[str, Any]:
+    pragmas: Dict[str, Any] = {
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        # Negative sizes are KiB rather than pages
+        "cache_size": -settings.SQLITE_CACHE_SIZE_KB,
+        "temp_store": "MEMORY",
+    }
+    if not in_memory:
+        # WAL lets readers run alongside the single writer
+        pragmas["journal_mode"] = settings.SQLITE_JOURNAL_MODE
+        pragmas["mmap_size"] = settings.SQLITE_MMAP_SIZE
+    return pragmas
+
+
+def create_engine(
+    url: str = settings.DATABASE_URL, profile: str = settings.DB_ENGINE_PROFILE
+) -> AsyncEngine:
+    """Async engine for ``url`` configured by the engine profile"""
+    engine = create_async_engine(url, **engine_options(url, profile))
+
+    if profile == "tuned" and engine.dialect.name == "sqlite":
+        pragmas = _sqlite_pragmas(_is_memory_database(url))
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
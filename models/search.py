@@ -0,0 +1,162 @@
+"""Full-text index over transcripts.
+
+SQLite uses a contentless FTS5 table whose rowid is the transcript's rowid;
+Postgres uses a ``transcript_search`` table with a GIN-indexed ``tsvector``.
+Neither keeps a copy of the text, only its terms, so compressing bodies at
+rest isn't undone by the index. Both are kept in sync from ORM events so
+the indexed text is the plaintext transcription, whatever the
+``transcript`` column stores.
+"""
+
+from typing import Any, Dict, Optional
+import uuid
+from sqlalchemy import event, inspect, select, text
+from sqlalchemy.engine import Connection
+from .transcript import Transcript
+
+FTS_TABLE = "transcript_fts"
+FTS_CONTENTLESS = "content = ''"
+TSVECTOR_TABLE = "transcript_search"
+TS_CONFIG = "english"
+
+SQLITE_DDL = [
+    # owner holds the user id as a single token so MATCH scopes by user
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"owner, transcription, {FTS_CONTENTLESS}, tokenize = 'porter unicode61')",
+]
+
+POSTGRES_DDL = [
+    # btree_gin lets one GIN index serve user_id = ? AND document @@ ?
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"CREATE TABLE IF NOT EXISTS {TSVECTOR_TABLE} ("
+    "transcript_id UUID PRIMARY KEY REFERENCES transcript (id) ON DELETE CASCADE, "
+    "user_id UUID NOT NULL, "
+    "document TSVECTOR NOT NULL)",
+    f"CREATE INDEX IF NOT EXISTS ix_{TSVECTOR_TABLE}_user_document "
+    f"ON {TSVECTOR_TABLE} USING gin (user_id, document)",
+]
+
+SQLITE_INSERT = (
+    f"INSERT INTO {FTS_TABLE} (rowid, owner, transcription) "
+    "SELECT rowid, :owner, :body FROM transcript WHERE id = :id"
+)
+# Contentless rows are removed by repeating the text that was indexed
+SQLITE_DELETE = (
+    f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, owner, transcription) "
+    "SELECT 'delete', rowid, :owner, :body FROM transcript WHERE id = :id"
+)
+POSTGRES_INSERT = (
+    f"INSERT INTO {TSVECTOR_TABLE} (transcript_id, user_id, document) "
+    f"VALUES (:id, :user_id, to_tsvector('{TS_CONFIG}', :body)) "
+    "ON CONFLICT (transcript_id) DO UPDATE SET document = EXCLUDED.document"
+)
+BACKFILL_BATCH_SIZE = 500
+
+
+def search_dialect(connection: Connection) -> Optional[str]:
+    """Dialect name if it has a full-text index, else None"""
+    name = connection.dialect.name
+    return name if name in ("sqlite", "postgresql") else None
+
+
+def owner_token(user_id: uuid.UUID) -> str:
+    return user_id.hex
+
+
+def create_search_index(connection: Connection) -> None:
+    """Create the index if missing, filling it from existing transcripts"""
+    dialect = search_dialect(connection)
+    if dialect is None:
+        return
+    if dialect == "sqlite":
+        existing = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = :name"),
+            {"name": FTS_TABLE},
+        ).scalar_one_or_none()
+        if existing is not None and FTS_CONTENTLESS in existing:
+            return
+        if existing is not None:
+            # Built before the index was contentless: it holds a plaintext copy
+            connection.execute(text(f"DROP TABLE {FTS_TABLE}"))
+    elif inspect(connection).has_table(TSVECTOR_TABLE):
+        return
+
+    for statement in SQLITE_DDL if dialect == "sqlite" else POSTGRES_DDL:
+        connection.execute(text(statement))
+
+    # Bodies may be stored compressed, so index the text the column type
+    # reads back rather than copying the column in SQL
+    result = connection.execute(
+        select(
+            Transcript.id, Transcript.user_id, Transcript.transcription
+        ).execution_options(yield_per=BACKFILL_BATCH_SIZE)
+    )
+    for rows in result.partitions():
+        connection.execute(
+            text(SQLITE_INSERT if dialect == "sqlite" else POSTGRES_INSERT),
+            [_index_params(dialect, *row) for row in rows],
+        )
+
+
+def _index_params(
+    dialect: str, transcript_id: uuid.UUID, user_id: uuid.UUID, body: str
+) -> Dict[str, Any]:
+    if dialect == "sqlite":
+        return {"id": transcript_id.hex, "owner": owner_token(user_id), "body": body}
+    return {"id": transcript_id, "user_id": user_id, "body": body}
+
+
+def _index(connection: Connection, transcript: Transcript) -> None:
+    dialect = search_dialect(connection)
+    if dialect is None:
+        return
+    connection.execute(
+        text(SQLITE_INSERT if dialect == "sqlite" else POSTGRES_INSERT),
+        _index_params(
+            dialect, transcript.id, transcript.user_id, transcript.transcription
+        ),
+    )
+
+
+def _unindex(connection: Connection, transcript: Transcript) -> None:
+    dialect = search_dialect(connection)
+    if dialect == "sqlite":
+        # The text as stored, which is what was indexed, not any pending change
+        row = connection.execute(
+            select(Transcript.user_id, Transcript.transcription).where(
+                Transcript.id == transcript.id
+            )
+        ).one_or_none()
+        if row is not None:
+            connection.execute(
+                text(SQLITE_DELETE), _index_params(dialect, transcript.id, *row)
+            )
+    elif dialect == "postgresql":
+        connection.execute(
+            text(f"DELETE FROM {TSVECTOR_TABLE} WHERE transcript_id = :id"),
+            {"id": transcript.id},
+        )
+
+
+# ORM events cover session.add/delete; bulk UPDATE/DELETE statements bypass them
+@event.listens_for(Transcript, "after_insert")
+def _after_insert(mapper, connection: Connection, target: Transcript) -> None:
+    _index(connection, target)
+
+
+@event.listens_for(Transcript, "before_update")
+def _before_update(mapper, connection: Connection, target: Transcript) -> None:
+    if inspect(target).attrs.transcription.history.has_changes():
+        _unindex(connection, target)
+
+
+@event.listens_for(Transcript, "after_update")
+def _after_update(mapper, connection: Connection, target: Transcript) -> None:
+    if inspect(target).attrs.transcription.history.has_changes():
+        _index(connection, target)
+
+
+@event.listens_for(Transcript, "before_delete")
+def _before_delete(mapper, connection: Connection, target: Transcript) -> None:
+    # Before the row goes, while the SQLite rowid can still be looked up
+    _unindex(connection, target)
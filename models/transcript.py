@@ -1,7 +1,12 @@
 from sqlmodel import SQLModel, Field, Relationship
-from typing import Optional
+from sqlalchemy import Index, bindparam, event, select, update
+from sqlalchemy.engine import Connection
+from typing import List, Optional
 from datetime import datetime
 import uuid
+from .types import CompressedText
+
+PREVIEW_CHARS = 500
 
 
 class TranscriptBase(SQLModel):
@@ -12,11 +17,59 @@ class TranscriptBase(SQLModel):
 
 
 class Transcript(TranscriptBase, table=True):
+    # Serves a user's history newest-first, including keyset pagination
+    __table_args__ = (
+        Index("ix_transcript_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
+
     id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="user.id")
+    # Compressed at rest; GET /transcriptions/{id}/text serves it as stored
+    transcription: str = Field(sa_type=CompressedText)
+    # SHA-256 of the source audio, to drop its cached result with the last copy
+    content_hash: Optional[str] = Field(default=None, index=True)
+    # Plaintext start of the transcription, so listings needn't decompress
+    preview: Optional[str] = Field(default=None, max_length=PREVIEW_CHARS)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+@event.listens_for(Transcript, "before_insert")
+@event.listens_for(Transcript, "before_update")
+def _set_preview(mapper, connection, target: Transcript) -> None:
+    target.preview = target.transcription[:PREVIEW_CHARS]
+
+
+def backfill_previews(connection: Connection, batch_size: int = 500) -> None:
+    """Fill in previews for rows written before the column existed"""
+    table = Transcript.__table__
+    set_preview = (
+        update(table)
+        .where(table.c.id == bindparam("transcript_id"))
+        .values(preview=bindparam("body_preview"))
+    )
+    last_id: Optional[uuid.UUID] = None
+    while True:
+        # Bodies may be stored compressed, so previews are cut in Python
+        statement = select(Transcript.id, Transcript.transcription).where(
+            Transcript.preview.is_(None)
+        )
+        if last_id is not None:
+            statement = statement.where(Transcript.id > last_id)
+        rows = connection.execute(
+            statement.order_by(Transcript.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            set_preview,
+            [
+                {"transcript_id": transcript_id, "body_preview": body[:PREVIEW_CHARS]}
+                for transcript_id, body in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+
 class TranscriptCreate(TranscriptBase):
     pass
 
@@ -25,3 +78,26 @@ class TranscriptRead(TranscriptBase):
     id: uuid.UUID
     user_id: uuid.UUID
     created_at: datetime
+
+
+class TranscriptSummary(SQLModel):
+    id: uuid.UUID
+    filename: str
+    duration: Optional[float] = None
+    file_size: Optional[int] = None
+    created_at: datetime
+    preview: Optional[str] = None
+
+
+class TranscriptPage(SQLModel):
+    items: List[TranscriptSummary]
+    next_cursor: Optional[str] = None
+
+
+class TranscriptSearchResult(SQLModel):
+    id: uuid.UUID
+    filename: str
+    duration: Optional[float] = None
+    created_at: datetime
+    rank: float
+    snippet: str
@@ -0,0 +1,17 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from .types import CompressedText
+
+
+class TranscriptionCacheEntry(SQLModel, table=True):
+    """Transcription result keyed by audio content hash, model and decode parameters"""
+
+    __tablename__ = "transcription_cache"
+
+    key: str = Field(primary_key=True)
+    content_hash: str = Field(index=True)
+    model: str
+    transcription: str = Field(sa_type=CompressedText)
+    duration: Optional[float] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -0,0 +1,40 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+import uuid
+from .transcript import TranscriptRead
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class TranscriptionJobBase(SQLModel):
+    filename: str
+    status: JobStatus = Field(default=JobStatus.QUEUED)
+    error: Optional[str] = None
+
+
+class TranscriptionJob(TranscriptionJobBase, table=True):
+    __tablename__ = "transcription_job"
+
+    id: Optional[uuid.UUID] = Field(default_factory=uuid.uuid4, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="user.id", index=True)
+    transcript_id: Optional[uuid.UUID] = Field(default=None, foreign_key="transcript.id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class TranscriptionJobRead(TranscriptionJobBase):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    transcript_id: Optional[uuid.UUID] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    transcript: Optional[TranscriptRead] = None
@@ -0,0 +1,25 @@
+from typing import Any, Optional
+from sqlalchemy.types import LargeBinary, TypeDecorator
+from utils.compression import compress_text, decompress_text
+
+
+class CompressedText(TypeDecorator):
+    """Text stored compressed per TRANSCRIPT_COMPRESSION, read back as str.
+
+    The database only ever sees opaque bytes: filter and search on the
+    plaintext elsewhere (e.g. the full-text index), not on this column.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[bytes]:
+        if value is None:
+            return None
+        return compress_text(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        # SQLite keeps rows written before compression as TEXT
+        return decompress_text(value if isinstance(value, str) else bytes(value))
@@ -1,4 +1,5 @@
 from .auth import auth_router
 from .transcription import transcription_router
+from .profiles import profile_router
 
-__all__ = ["auth_router", "transcription_router"]
+__all__ = ["auth_router", "transcription_router", "profile_router"]
@@ -0,0 +1,33 @@
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import FileResponse
+from services.profiler import is_profiler_admin, profile_store
+
+profile_router = APIRouter(prefix="/profiles", tags=["Profiling"])
+
+
+def require_profiler_admin(
+    x_profile_token: Optional[str] = Header(None, alias="X-Profile-Token"),
+) -> None:
+    """Only the holder of PROFILER_TOKEN may read profiles"""
+    if not is_profiler_admin(x_profile_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Invalid profiler token"
+        )
+
+
+@profile_router.get("/", dependencies=[Depends(require_profiler_admin)])
+async def list_profiles() -> List[Dict[str, Any]]:
+    """List stored request profiles, newest first"""
+    return profile_store.list()
+
+
+@profile_router.get("/{profile_id}", dependencies=[Depends(require_profiler_admin)])
+async def download_profile(profile_id: str) -> FileResponse:
+    """Download a request profile in speedscope format"""
+    path = profile_store.path(profile_id)
+    if path is None or not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+    return FileResponse(path, media_type="application/json", filename=path.name)
@@ -1,27 +1,107 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Query
-from typing import List
+from fastapi import APIRouter, Depends, UploadFile, File, Header, Query, Response
+from fastapi import status
+from fastapi import WebSocket
+from datetime import datetime
+from typing import List, Literal, Optional, Union
 import uuid
 from middleware import get_async_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from models import User
-from middleware import get_current_user
+from middleware import get_current_user, get_websocket_user
 
-from models.transcript import TranscriptRead
+from config.settings import settings
+from models.transcript import (
+    PREVIEW_CHARS,
+    TranscriptPage,
+    TranscriptRead,
+    TranscriptSearchResult,
+)
+from models.transcription_job import TranscriptionJobRead
 from controllers.transcription_controller import TranscriptionController
 
 transcription_router = APIRouter(prefix="/transcriptions", tags=["Transcription"])
 transcription_controller = TranscriptionController()
 
 
-@transcription_router.post("/", response_model=TranscriptRead)
+@transcription_router.post(
+    "/", response_model=Union[TranscriptRead, TranscriptionJobRead]
+)
 async def transcribe_audio(
+    response: Response,
     file: UploadFile = File(..., description="Audio file to transcribe"),
+    async_mode: bool = Query(
+        False,
+        alias="async",
+        description="Queue the transcription as a job and return 202 with its id",
+    ),
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session),
 ):
     """Upload and transcribe an audio file"""
-    return await transcription_controller.transcribe_audio(
-        file, current_user=user, session=session
+    result = await transcription_controller.transcribe_audio(
+        file, current_user=user, session=session, background=async_mode
+    )
+    if async_mode:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = (
+            f"{settings.API_V1_PREFIX}{transcription_router.prefix}/jobs/{result.id}"
+        )
+    return result
+
+
+@transcription_router.post("/batch")
+async def transcribe_batch(
+    files: List[UploadFile] = File(
+        ..., description="Audio files, or a single zip/tar archive of them"
+    ),
+    user: User = Depends(get_current_user),
+):
+    """Transcribe several audio files, streaming one NDJSON line per file"""
+    return await transcription_controller.transcribe_batch(files, current_user=user)
+
+
+@transcription_router.get("/jobs/{job_id}", response_model=TranscriptionJobRead)
+async def get_job(
+    job_id: uuid.UUID,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(get_current_user),
+):
+    """Get status of an async transcription job"""
+    return await transcription_controller.get_job(
+        job_id, current_user=user, session=session
+    )
+
+
+@transcription_router.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: uuid.UUID,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(get_current_user),
+):
+    """Stream status changes of an async transcription job (Server-Sent Events)"""
+    return await transcription_controller.stream_job_events(
+        job_id, current_user=user, session=session
+    )
+
+
+@transcription_router.websocket("/stream")
+async def stream_transcription(
+    websocket: WebSocket,
+    encoding: str = Query(
+        "pcm_s16le",
+        description="pcm_s16le (mono) or opus (Ogg/WebM, e.g. from MediaRecorder)",
+    ),
+    sample_rate: int = Query(16000, ge=8000, le=48000, description="PCM only"),
+    filename: str = Query("live-dictation", description="Name of the transcript"),
+    user: User = Depends(get_websocket_user),
+):
+    """Live transcription: send audio frames, receive partial and final text"""
+    await transcription_controller.stream_transcription(
+        websocket,
+        current_user=user,
+        encoding=encoding,
+        sample_rate=sample_rate,
+        filename=filename,
     )
 
 
@@ -40,6 +120,66 @@ async def get_transcripts(
     )
 
 
+@transcription_router.get("/summaries", response_model=TranscriptPage)
+async def get_transcript_summaries(
+    cursor: Optional[str] = Query(
+        None, description="next_cursor of the previous page; omit for the first page"
+    ),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of records to return"
+    ),
+    preview: int = Query(
+        0, ge=0, le=PREVIEW_CHARS, description="Characters of transcription to include (0: none)"
+    ),
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """Get user's transcription history as lightweight summaries, page by page"""
+    return await transcription_controller.get_transcript_summaries(
+        cursor=cursor,
+        limit=limit,
+        preview_chars=preview,
+        current_user=user,
+        session=session,
+    )
+
+
+@transcription_router.get("/export")
+async def export_transcripts(
+    format: Literal["ndjson", "csv", "parquet"] = Query(
+        "ndjson", description="File format of the export"
+    ),
+    created_after: Optional[datetime] = Query(
+        None, description="Only transcripts created at or after this time"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Only transcripts created before this time"
+    ),
+    user: User = Depends(get_current_user),
+):
+    """Download all of the user's transcripts as one streamed file"""
+    return await transcription_controller.export_transcripts(
+        format,
+        created_after=created_after,
+        created_before=created_before,
+        current_user=user,
+    )
+
+
+@transcription_router.get("/search", response_model=List[TranscriptSearchResult])
+async def search_transcripts(
+    q: str = Query(..., min_length=1, max_length=500, description="Words to find"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """Search the user's transcripts, best match first with highlighted snippets"""
+    return await transcription_controller.search_transcripts(
+        q, limit=limit, offset=offset, current_user=user, session=session
+    )
+
+
 @transcription_router.get("/{transcript_id}", response_model=TranscriptRead)
 async def get_transcript(
     transcript_id: uuid.UUID,
@@ -52,6 +192,26 @@ async def get_transcript(
     )
 
 
+@transcription_router.get(
+    "/{transcript_id}/text",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}}},
+)
+async def get_transcript_text(
+    transcript_id: uuid.UUID,
+    accept_encoding: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(get_current_user),
+):
+    """Get a transcript's text, compressed as stored if the client accepts it"""
+    return await transcription_controller.get_transcript_text(
+        transcript_id,
+        accept_encoding=accept_encoding,
+        current_user=user,
+        session=session,
+    )
+
+
 @transcription_router.delete("/{transcript_id}")
 async def delete_transcript(
     transcript_id: uuid.UUID,
@@ -0,0 +1,111 @@
+"""Compress stored transcript bodies and report the storage saved.
+
+Rewrites every body not yet stored the way TRANSCRIPT_COMPRESSION says:
+plain text from before compression, or bodies written with another codec.
+Rows are visited in batches in id order and each batch commits on its own,
+so the backfill can run against a live database and be stopped and rerun.
+The full-text index holds plaintext already and isn't touched.
+
+    python -m scripts.compress_transcripts --dry-run
+    python -m scripts.compress_transcripts --batch-size 500
+    python -m scripts.compress_transcripts --decompress  # before downgrading
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Dict, List, Optional
+import uuid
+from sqlalchemy import LargeBinary, bindparam, select, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from models import Transcript, engine
+from utils.compression import compress_text, decompress_text
+
+
+async def backfill(batch_size: int, decompress: bool, dry_run: bool) -> Dict:
+    stats = {"rows": 0, "rewritten": 0, "bytes_before": 0, "bytes_after": 0}
+    body = type_coerce(Transcript.transcription, LargeBinary)
+    # Store the new bytes as they are, not through CompressedText again
+    rewrite = (
+        update(Transcript.__table__)
+        .where(Transcript.__table__.c.id == bindparam("transcript_id"))
+        .values(transcription=type_coerce(bindparam("body"), LargeBinary))
+    )
+
+    last_id: Optional[uuid.UUID] = None
+    while True:
+        statement = select(Transcript.id, body.label("body"))
+        if last_id is not None:
+            statement = statement.where(Transcript.id > last_id)
+        statement = statement.order_by(Transcript.id).limit(batch_size)
+
+        async with AsyncSession(engine) as session:
+            rows = (await session.execute(statement)).all()
+            if not rows:
+                break
+
+            changes: List[Dict] = []
+            for transcript_id, stored in rows:
+                text = decompress_text(stored)
+                current = stored.encode() if isinstance(stored, str) else stored
+                target = text.encode() if decompress else compress_text(text)
+                stats["rows"] += 1
+                stats["bytes_before"] += len(current)
+                stats["bytes_after"] += len(target)
+                # Plain text kept as TEXT by SQLite counts as already stored
+                if target != current:
+                    changes.append({"transcript_id": transcript_id, "body": target})
+
+            if changes and not dry_run:
+                await session.execute(rewrite, changes)
+                await session.commit()
+            stats["rewritten"] += len(changes)
+            last_id = rows[-1][0]
+
+        print(
+            f"{stats['rows']} rows scanned, {stats['rewritten']} "
+            f"{'to rewrite' if dry_run else 'rewritten'}",
+            file=sys.stderr,
+        )
+
+    await engine.dispose()
+    return stats
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--decompress",
+        action="store_true",
+        help="Store every body as plain text instead",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report the savings only"
+    )
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(backfill(args.batch_size, args.decompress, args.dry_run))
+    before, after = stats["bytes_before"], stats["bytes_after"]
+    ratio = before / after if after else 1.0
+    mode = "plain text" if args.decompress else settings.TRANSCRIPT_COMPRESSION
+    print(
+        f"{stats['rows']} transcripts, {stats['rewritten']} "
+        f"{'would be ' if args.dry_run else ''}rewritten as {mode}: "
+        f"{_format_size(before)} -> {_format_size(after)} "
+        f"({_format_size(before - after)} saved, {ratio:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import math
+from pathlib import Path
+from config.settings import settings
+from errors.custom_exceptions import ServiceUnavailableError
+from services.inference_worker import InferencePool, inference_pool
+from utils.metrics import (
+    ADMISSION_BACKLOG_SECONDS,
+    ADMISSION_DECISIONS,
+    ADMISSION_ESTIMATED_WAIT_SECONDS,
+    ADMISSION_REAL_TIME_FACTOR,
+)
+
+# Rough upload bytes per second of audio, to size work before it is decoded
+UNCOMPRESSED_BYTES_PER_SECOND = 88200  # e.g. 44.1 kHz 16-bit mono
+COMPRESSED_BYTES_PER_SECOND = 16000  # ~128 kbps
+UNCOMPRESSED_FORMATS = {".wav", ".flac"}
+
+
+class AdmissionTicket:
+    def __init__(self, audio_seconds: float):
+        self.audio_seconds = audio_seconds
+        self.released = False
+
+
+class AdmissionController:
+    """Bounds the transcription backlog by its expected processing time.
+
+    Admitted work is tracked in estimated audio-seconds. The backlog's
+    processing time is estimated from a moving average of the real-time
+    factor (inference seconds per audio second) across the inference
+    workers; work that would push it past ``latency_budget_s`` is rejected
+    with a 503 and a ``Retry-After`` of when enough of it should be done.
+    """
+
+    def __init__(
+        self,
+        pool: InferencePool,
+        latency_budget_s: float = settings.ADMISSION_LATENCY_BUDGET_S,
+        initial_rtf: float = settings.ADMISSION_INITIAL_RTF,
+        smoothing: float = 0.2,
+    ):
+        self._pool = pool
+        self.latency_budget_s = latency_budget_s
+        self.rtf = initial_rtf
+        self.smoothing = smoothing
+        self.backlog_seconds = 0.0
+        ADMISSION_REAL_TIME_FACTOR.set(self.rtf)
+
+    def estimate_audio_seconds(self, filename: str, size: int) -> float:
+        """Guess an upload's duration from its size and format"""
+        if Path(filename).suffix.lower() in UNCOMPRESSED_FORMATS:
+            return size / UNCOMPRESSED_BYTES_PER_SECOND
+        return size / COMPRESSED_BYTES_PER_SECOND
+
+    def estimated_wait(self, extra_audio_seconds: float = 0.0) -> float:
+        """Seconds to work through the backlog (plus ``extra_audio_seconds``)"""
+        workers = max(1, self._pool.workers)
+        return (self.backlog_seconds + extra_audio_seconds) * self.rtf / workers
+
+    def admit(self, audio_seconds: float) -> AdmissionTicket:
+        """Reserve capacity for work, or raise ServiceUnavailableError"""
+        wait = self.estimated_wait(audio_seconds)
+        # An idle service always takes work, however long
+        if self.backlog_seconds > 0 and wait > self.latency_budget_s:
+            ADMISSION_DECISIONS.labels(outcome="rejected").inc()
+            retry_after = max(1, math.ceil(wait - self.latency_budget_s))
+            raise ServiceUnavailableError(
+                "Transcription service is at capacity, please retry later",
+                retry_after=retry_after,
+            )
+
+        ADMISSION_DECISIONS.labels(outcome="admitted").inc()
+        self.backlog_seconds += audio_seconds
+        self._export()
+        return AdmissionTicket(audio_seconds)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Return a ticket's capacity once its work is done or abandoned"""
+        if ticket.released:
+            return
+        ticket.released = True
+        self.backlog_seconds = max(0.0, self.backlog_seconds - ticket.audio_seconds)
+        self._export()
+
+    def observe(self, audio_seconds: float, inference_seconds: float) -> None:
+        """Fold a finished transcription into the real-time factor estimate"""
+        if audio_seconds <= 0:
+            return
+        rtf = inference_seconds / audio_seconds
+        self.rtf += self.smoothing * (rtf - self.rtf)
+        ADMISSION_REAL_TIME_FACTOR.set(self.rtf)
+
+    def _export(self) -> None:
+        ADMISSION_BACKLOG_SECONDS.set(self.backlog_seconds)
+        ADMISSION_ESTIMATED_WAIT_SECONDS.set(self.estimated_wait())
+
+
+admission_controller = AdmissionController(inference_pool)
@@ -0,0 +1,183 @@
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+import numpy as np
+from loguru import logger
+from config.settings import settings
+
+
+class ASRBackend:
+    """Speech-to-text engine loaded once per inference worker.
+
+    Backends take 16 kHz mono float32 clips and return pipeline-style
+    results (``{"text": ...}``), so callers don't care which runtime runs.
+    """
+
+    name = ""
+
+    def __init__(
+        self, model_name: str, model_path: Optional[str] = None, num_threads: int = 0
+    ):
+        self.model_name = model_name
+        self.model_path = model_path or model_name
+        self.num_threads = num_threads
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def transcribe_batch(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        return [self.transcribe(clip) for clip in clips]
+
+    def _limit_torch_threads(self) -> None:
+        if self.num_threads > 0:
+            import torch
+
+            torch.set_num_threads(self.num_threads)
+
+
+class TransformersBackend(ASRBackend):
+    """Hugging Face ``automatic-speech-recognition`` pipeline in fp32 PyTorch"""
+
+    name = "transformers"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        from transformers import pipeline
+
+        self._limit_torch_threads()
+        self._pipeline = pipeline("automatic-speech-recognition", model=self.model_path)
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        return self._pipeline(audio)
+
+    def transcribe_batch(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        return self._pipeline(clips, batch_size=len(clips))
+
+
+class QuantizedTorchBackend(TransformersBackend):
+    """Transformers pipeline with Linear layers dynamically quantized to int8"""
+
+    name = "torch-int8"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        import torch
+
+        self._pipeline.model = torch.ao.quantization.quantize_dynamic(
+            self._pipeline.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class ONNXBackend(TransformersBackend):
+    """Whisper exported to ONNX, run by ONNX Runtime (needs ``optimum[onnxruntime]``).
+
+    ``model_path`` may point at an already exported model; a hub id is
+    exported on first load.
+    """
+
+    name = "onnx"
+
+    def __init__(
+        self, model_name: str, model_path: Optional[str] = None, num_threads: int = 0
+    ):
+        ASRBackend.__init__(self, model_name, model_path, num_threads)
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+
+        session_options = onnxruntime.SessionOptions()
+        if num_threads > 0:
+            session_options.intra_op_num_threads = num_threads
+        processor = AutoProcessor.from_pretrained(self.model_path)
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            self.model_path,
+            export=not _is_onnx_export(self.model_path),
+            provider="CPUExecutionProvider",
+            session_options=session_options,
+        )
+        self._pipeline = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+        )
+
+
+class CTranslate2Backend(ASRBackend):
+    """Whisper converted to CTranslate2 with int8 weights (needs ``faster-whisper``).
+
+    ``model_path`` must be a CTranslate2 conversion of the model, e.g. from
+    ``ct2-transformers-converter --model <MODEL> --quantization int8``.
+    """
+
+    name = "ctranslate2"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        from faster_whisper import WhisperModel
+
+        self._model = WhisperModel(
+            self.model_path,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=self.num_threads,
+        )
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        segments, _ = self._model.transcribe(audio, beam_size=1)
+        return {"text": "".join(segment.text for segment in segments).strip()}
+
+
+class StubBackend(ASRBackend):
+    """Model-free stand-in that returns placeholder text (benchmarks, load tests).
+
+    Emits about two words per second of audio and sleeps ASR_STUB_RTF
+    seconds per audio second, so HTTP, queueing and database overhead can
+    be measured without Whisper.
+    """
+
+    name = "stub"
+    WORDS = ("the", "patient", "reports", "mild", "pain", "since", "monday")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.real_time_factor = settings.ASR_STUB_RTF
+
+    def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        seconds = len(audio) / 16000
+        if self.real_time_factor > 0:
+            time.sleep(seconds * self.real_time_factor)
+        words = max(1, round(seconds * 2))
+        return {
+            "text": " ".join(self.WORDS[i % len(self.WORDS)] for i in range(words))
+        }
+
+
+BACKENDS: Dict[str, Type[ASRBackend]] = {
+    backend.name: backend
+    for backend in (
+        TransformersBackend,
+        QuantizedTorchBackend,
+        ONNXBackend,
+        CTranslate2Backend,
+        StubBackend,
+    )
+}
+
+
+def load_backend(
+    name: str, model_name: str, model_path: Optional[str] = None, num_threads: int = 0
+) -> ASRBackend:
+    """Instantiate the backend registered under ``name``"""
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(
+            f"Unknown ASR backend '{name}'. Available: {', '.join(sorted(BACKENDS))}"
+        )
+    backend = backend_cls(model_name, model_path, num_threads)
+    logger.info(f"Loaded {name} ASR backend for {model_name}")
+    return backend
+
+
+def _is_onnx_export(path: str) -> bool:
+    return Path(path).is_dir() and any(Path(path).glob("*.onnx"))
@@ -4,7 +4,8 @@ from typing import Optional, Dict, Any
 import uuid
 from loguru import logger
 from models.user import User, UserCreate
-from utils.password_utils import hash_password, verify_password
+from services.principal_cache import principal_cache
+from utils.password_utils import hash_password_async, verify_and_update_password
 from utils.jwt_utils import create_access_token, create_refresh_token, verify_token
 from errors.custom_exceptions import AuthenticationError, ValidationError
 
@@ -22,7 +23,7 @@ class AuthService:
             raise ValidationError("Email already registered")
 
         # Hash password and create user
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         user = User(email=user_data.email, password_hash=hashed_password)
 
         session.add(user)
@@ -39,9 +40,22 @@ class AuthService:
         statement = select(User).where(User.email == email)
         result = await session.execute(statement)
         user = result.scalar_one_or_none()
-        if not user or not verify_password(password, user.password_hash):
+        if not user:
             return None
 
+        verified, new_hash = await verify_and_update_password(
+            password, user.password_hash
+        )
+        if not verified:
+            return None
+
+        if new_hash is not None:
+            # Argon2 parameters changed since this hash was made
+            user.password_hash = new_hash
+            session.add(user)
+            await session.commit()
+            await session.refresh(user)
+
         if not user.is_active:
             return None
 
@@ -81,9 +95,7 @@ class AuthService:
             raise AuthenticationError("Invalid user ID in token")
 
         # Verify user still exists and is active
-        statement = select(User).where(User.id == user_uuid)
-        result = await session.execute(statement)
-        user = result.scalar_one_or_none()
+        user = await principal_cache.get_user(user_uuid, session)
 
         if not user or not user.is_active:
             raise AuthenticationError("User not found or inactive")
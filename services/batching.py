@@ -0,0 +1,128 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+from config.settings import settings
+from services.inference_worker import InferencePool, inference_pool
+from utils.metrics import (
+    BATCH_OCCUPANCY,
+    BATCH_SIZE,
+    BATCH_WAIT_SECONDS,
+    INFERENCE_QUEUE_DEPTH,
+)
+
+PendingClip = Tuple[np.ndarray, asyncio.Future, float]
+
+
+class MicroBatcher:
+    """Coalesces concurrently submitted clips into batched forward passes.
+
+    A batch is dispatched once an inference worker is free and either
+    ``max_batch_size`` clips are pending or the oldest pending clip has
+    waited ``max_wait_ms``. While every worker is busy clips keep
+    accumulating, so batches grow with load.
+    """
+
+    def __init__(
+        self,
+        pool: InferencePool,
+        max_batch_size: int = settings.BATCH_MAX_SIZE,
+        max_wait_ms: float = settings.BATCH_MAX_WAIT_MS,
+    ):
+        self._pool = pool
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._pending: List[PendingClip] = []
+        self._changed: Optional[asyncio.Condition] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Queue a clip for the next batch and wait for its result"""
+        if self.max_batch_size == 1:
+            return await self._pool.transcribe(audio)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._changed = asyncio.Condition()
+            self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+        assert self._changed is not None
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        async with self._changed:
+            self._pending.append((audio, future, time.perf_counter()))
+            self._changed.notify()
+
+        return await future
+
+    async def _dispatch_loop(self) -> None:
+        assert self._changed is not None
+        slots = asyncio.Semaphore(self._pool.workers)
+        while True:
+            await slots.acquire()
+            async with self._changed:
+                await self._changed.wait_for(lambda: bool(self._pending))
+                deadline = self._pending[0][2] + self.max_wait
+                while len(self._pending) < self.max_batch_size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                batch = self._pending[: self.max_batch_size]
+                self._pending = self._pending[self.max_batch_size :]
+
+            task = asyncio.create_task(self._run(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+    async def _run(self, batch: List[PendingClip]) -> None:
+        # Callers that went away (cancelled request) don't need a slot
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+
+        now = time.perf_counter()
+        for _, _, queued_at in batch:
+            BATCH_WAIT_SECONDS.observe(now - queued_at)
+        BATCH_SIZE.observe(len(batch))
+        BATCH_OCCUPANCY.observe(len(batch) / self.max_batch_size)
+
+        try:
+            if len(batch) == 1:
+                results = [await self._pool.transcribe(batch[0][0])]
+            else:
+                results = await self._pool.transcribe_batch(
+                    [clip for clip, _, _ in batch]
+                )
+        except Exception as e:
+            logger.error(f"Batched inference of {len(batch)} clip(s) failed: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def shutdown(self) -> None:
+        """Stop dispatching; pending callers are cancelled"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        for _, future, _ in self._pending:
+            future.cancel()
+        self._pending = []
+
+
+inference_batcher = MicroBatcher(inference_pool)
+INFERENCE_QUEUE_DEPTH.set_function(lambda: inference_batcher.pending)
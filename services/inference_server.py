@@ -0,0 +1,203 @@
+"""Standalone inference server for API workers running INFERENCE_EXECUTOR=socket.
+
+Loads the ASR backend into its own inference pool and serves transcription
+requests on a Unix socket, so API workers stay free of ML libraries and
+every worker on the host shares the same model replicas.
+
+    python -m services.inference_server --executor process --workers 2
+
+Messages are frames of a 4-byte big-endian header length, a JSON header
+and ``payload_bytes`` of raw data. ``transcribe_batch`` requests carry the
+clips as concatenated float32 samples with their ``lengths`` in the header.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+from config.settings import settings
+from errors.custom_exceptions import TranscriptionError
+from services.inference_worker import InferencePool
+
+_LENGTH = struct.Struct(">I")
+MAX_HEADER_BYTES = 1 << 20
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Tuple[Dict[str, Any], bytes]:
+    (size,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if size > MAX_HEADER_BYTES:
+        raise ValueError(f"Frame header of {size} bytes is too large")
+    header = json.loads(await reader.readexactly(size))
+    payload = await reader.readexactly(header.get("payload_bytes", 0))
+    return header, payload
+
+
+async def write_frame(
+    writer: asyncio.StreamWriter, header: Dict[str, Any], payload: bytes = b""
+) -> None:
+    encoded = json.dumps(
+        {**header, "payload_bytes": len(payload)}, default=_to_json
+    ).encode()
+    writer.write(_LENGTH.pack(len(encoded)) + encoded)
+    if payload:
+        writer.write(payload)
+    await writer.drain()
+
+
+class InferenceClient:
+    """Client side of the inference server socket.
+
+    Each connection carries one request at a time; idle connections are
+    kept for reuse, so concurrent callers get connections of their own.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def request(
+        self, header: Dict[str, Any], payload: bytes = b""
+    ) -> Dict[str, Any]:
+        try:
+            if self._idle:
+                reader, writer = self._idle.pop()
+            else:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+        except OSError as e:
+            raise TranscriptionError(
+                f"Inference server unavailable at {self.path}: {e}"
+            )
+
+        try:
+            await write_frame(writer, header, payload)
+            response, _ = await read_frame(reader)
+        except BaseException as e:
+            # A half-finished exchange leaves the connection unusable
+            writer.close()
+            if isinstance(e, (OSError, asyncio.IncompleteReadError)):
+                raise TranscriptionError(f"Lost connection to inference server: {e}")
+            raise
+
+        self._idle.append((reader, writer))
+        if "error" in response:
+            raise TranscriptionError(response["error"])
+        return response
+
+    async def transcribe_batch(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        arrays = [np.ascontiguousarray(clip, dtype=np.float32) for clip in clips]
+        response = await self.request(
+            {"op": "transcribe_batch", "lengths": [len(a) for a in arrays]},
+            b"".join(a.tobytes() for a in arrays),
+        )
+        return response["results"]
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+
+class InferenceServer:
+    """Serves an inference pool's transcriptions on a Unix socket"""
+
+    def __init__(self, pool: InferencePool, path: str = settings.INFERENCE_SOCKET):
+        self.pool = pool
+        self.path = path
+
+    async def serve(self, stop: asyncio.Event) -> None:
+        await self.pool.warm_up()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self._handle, path=self.path)
+        # Only this user's processes may submit work
+        os.chmod(self.path, 0o600)
+        logger.info(f"Inference server listening on {self.path}")
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            await self.pool.shutdown()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    header, payload = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                try:
+                    response = await self._dispatch(header, payload)
+                except Exception as e:
+                    logger.error(f"Inference request failed: {e}")
+                    response = {"error": str(e)}
+                await write_frame(writer, response)
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Dropping inference client: {e}")
+        finally:
+            writer.close()
+
+    async def _dispatch(self, header: Dict[str, Any], payload: bytes) -> Dict:
+        op = header.get("op")
+        if op == "info":
+            return {
+                "pid": os.getpid(),
+                "backend": self.pool.backend,
+                "model_path": self.pool.model_path,
+                "mode": self.pool.mode,
+                "workers": self.pool.workers,
+            }
+        if op == "warm_up":
+            await self.pool.warm_up()
+            return {}
+        if op == "transcribe_batch":
+            samples = np.frombuffer(payload, dtype=np.float32)
+            lengths = header["lengths"]
+            if sum(lengths) != len(samples):
+                raise ValueError("Clip lengths don't match the payload")
+            clips = np.split(samples, np.cumsum(lengths)[:-1])
+            if len(clips) == 1:
+                return {"results": [await self.pool.transcribe(clips[0])]}
+            return {"results": await self.pool.transcribe_batch(clips)}
+        raise ValueError(f"Unknown inference op '{op}'")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--socket", default=settings.INFERENCE_SOCKET)
+    parser.add_argument("--executor", choices=("process", "thread"), default="process")
+    parser.add_argument("--workers", type=int, default=settings.INFERENCE_WORKERS)
+    parser.add_argument("--backend", default=settings.ASR_BACKEND)
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        pool = InferencePool(args.executor, args.workers, args.backend)
+        await InferenceServer(pool, args.socket).serve(stop)
+
+    asyncio.run(run())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
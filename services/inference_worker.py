@@ -0,0 +1,252 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import numpy as np
+from loguru import logger
+from config.settings import settings
+from errors.custom_exceptions import TranscriptionError
+from utils.metrics import INFERENCE_IN_FLIGHT, MODEL_LOAD_SECONDS
+
+if TYPE_CHECKING:
+    from services.asr_backends import ASRBackend
+    from services.inference_server import InferenceClient
+
+MODEL_NAME = settings.MODEL
+SAMPLE_RATE = 16000
+
+# Backend owned by the current process. In process mode every pool worker
+# loads its own copy; in thread mode the workers share the one in the API process.
+_backend: Optional["ASRBackend"] = None
+_backend_lock = threading.Lock()
+
+
+def _load_backend(backend_name: str, model_name: str) -> "ASRBackend":
+    """Load the ASR backend into the current process"""
+    # Imported here so web processes only load ML code once they run a model
+    from services.asr_backends import load_backend
+
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = load_backend(
+                backend_name,
+                model_name,
+                model_path=settings.ASR_MODEL_PATH or None,
+                num_threads=settings.ASR_NUM_THREADS,
+            )
+    return _backend
+
+
+def _init_worker(backend_name: str, model_name: str) -> None:
+    """Process pool initializer: load the model and warm it up before taking work"""
+    _load_backend(backend_name, model_name)
+    _warm_up()
+
+
+def _worker_pid(hold_s: float = 0.0) -> int:
+    """Identify the worker process, holding it briefly so siblings get tasks too"""
+    time.sleep(hold_s)
+    return os.getpid()
+
+
+def _run_inference(audio: np.ndarray) -> Dict[str, Any]:
+    """Transcribe a 16 kHz mono clip with the loaded backend.
+
+    Results carry ``inference_seconds``, the time the model spent on the
+    clip, excluding any wait for a worker.
+    """
+    if _backend is None:
+        raise TranscriptionError("model not loaded properly")
+    started = time.perf_counter()
+    result = _backend.transcribe(audio)
+    return {**result, "inference_seconds": time.perf_counter() - started}
+
+
+def _warm_up() -> None:
+    """First forward pass on a second of faint noise to build kernels and caches"""
+    noise = np.random.default_rng(0).normal(0, 1e-3, SAMPLE_RATE).astype(np.float32)
+    _run_inference(noise)
+
+
+def _run_batch_inference(clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+    """Transcribe several 16 kHz mono clips in one batched call"""
+    if _backend is None:
+        raise TranscriptionError("model not loaded properly")
+    started = time.perf_counter()
+    results = _backend.transcribe_batch(clips)
+    elapsed = time.perf_counter() - started
+    # Each clip is charged its share of the batch by length
+    total = sum(len(clip) for clip in clips) or 1
+    return [
+        {**result, "inference_seconds": elapsed * len(clip) / total}
+        for clip, result in zip(clips, results)
+    ]
+
+
+class InferencePool:
+    """Runs Whisper inference off the event loop.
+
+    The preferred mode is a process pool where every worker holds its own
+    loaded backend, so one host can run several model replicas. If the
+    process pool cannot be started the pool falls back to threads sharing a
+    single backend, which still keeps the event loop free. In socket mode
+    the model runs in a separate inference server
+    (``python -m services.inference_server``) shared by every API worker on
+    the host, so API processes never load it.
+    """
+
+    def __init__(
+        self,
+        mode: str = settings.INFERENCE_EXECUTOR,
+        workers: int = settings.INFERENCE_WORKERS,
+        backend: str = settings.ASR_BACKEND,
+    ):
+        self.mode = mode
+        self.backend = backend
+        self.model_path = settings.ASR_MODEL_PATH
+        self.workers = max(1, workers)
+        self._executor: Optional[Executor] = None
+        self._client: Optional["InferenceClient"] = None
+        self._start_lock = asyncio.Lock()
+        self.warm = False
+        self.in_flight = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None or self._client is not None
+
+    @property
+    def queue_depth(self) -> int:
+        """Submitted tasks waiting for a free worker"""
+        return max(0, self.in_flight - self.workers)
+
+    async def start(self) -> None:
+        """Create the executor and load the model(s) if not done yet"""
+        if self.started:
+            return
+        async with self._start_lock:
+            if self.started:
+                return
+            if self.mode == "socket":
+                await self._connect()
+                return
+            try:
+                started = time.perf_counter()
+                self._executor = await asyncio.to_thread(self._create_executor)
+                MODEL_LOAD_SECONDS.labels(backend=self.backend).set(
+                    time.perf_counter() - started
+                )
+            except TranscriptionError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to load Whisper model: {e}")
+                raise TranscriptionError(
+                    f"Failed to load transcription model: {str(e)}"
+                )
+
+    async def _connect(self) -> None:
+        from services.inference_server import InferenceClient
+
+        client = InferenceClient(settings.INFERENCE_SOCKET)
+        info = await client.request({"op": "info"})
+        self.backend = info["backend"]
+        self.model_path = info.get("model_path", "")
+        self.workers = info["workers"]
+        self._client = client
+        logger.info(
+            f"Connected to inference server at {settings.INFERENCE_SOCKET} "
+            f"({self.workers} {info['mode']} worker(s), {self.backend} backend)"
+        )
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "process":
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.backend, MODEL_NAME),
+            )
+            try:
+                executor.submit(_worker_pid).result()
+                logger.info(f"Started {self.workers} inference worker process(es)")
+                return executor
+            except Exception as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                logger.warning(
+                    f"Inference process pool unavailable ({e}), falling back to threads"
+                )
+                self.mode = "thread"
+
+        _load_backend(self.backend, MODEL_NAME)
+        logger.info(f"Started {self.workers} inference worker thread(s)")
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="inference"
+        )
+
+    async def submit(self, fn, *args) -> Any:
+        """Run a picklable module-level function on an inference worker"""
+        await self.start()
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+
+    async def warm_up(self) -> None:
+        """Load the model(s) and run a first inference on every worker"""
+        await self.start()
+        if self._client is not None:
+            await self._client.request({"op": "warm_up"})
+        elif self.mode == "process":
+            # Workers warm up in their initializer; wait until all have started
+            seen: set[int] = set()
+            while len(seen) < self.workers:
+                pids = await asyncio.gather(
+                    *(self.submit(_worker_pid, 0.05) for _ in range(self.workers))
+                )
+                seen.update(pids)
+        else:
+            await self.submit(_warm_up)
+        self.warm = True
+        logger.info(f"Warmed up {self.workers} inference worker(s)")
+
+    async def transcribe(self, audio: np.ndarray) -> Dict[str, Any]:
+        """Transcribe a decoded 16 kHz mono clip"""
+        if self.mode == "socket":
+            return (await self._transcribe_remote([audio]))[0]
+        return await self.submit(_run_inference, audio)
+
+    async def transcribe_batch(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """Transcribe several decoded clips as a single batch"""
+        if self.mode == "socket":
+            return await self._transcribe_remote(clips)
+        return await self.submit(_run_batch_inference, clips)
+
+    async def _transcribe_remote(self, clips: List[np.ndarray]) -> List[Dict[str, Any]]:
+        await self.start()
+        assert self._client is not None
+        self.in_flight += 1
+        try:
+            return await self._client.transcribe_batch(clips)
+        finally:
+            self.in_flight -= 1
+
+    async def shutdown(self) -> None:
+        """Stop the workers, dropping any queued work"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            self.warm = False
+            await client.close()
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            self.warm = False
+            await asyncio.to_thread(executor.shutdown, True, cancel_futures=True)
+
+
+inference_pool = InferencePool()
+INFERENCE_IN_FLIGHT.set_function(lambda: inference_pool.in_flight)
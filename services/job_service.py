@@ -0,0 +1,130 @@
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from models import engine
+from models.transcription_job import TranscriptionJob, JobStatus
+from errors.custom_exceptions import CustomException
+
+JobWork = Callable[[], Awaitable[uuid.UUID]]
+
+TERMINAL_STATUSES = {JobStatus.DONE, JobStatus.FAILED}
+
+
+class JobService:
+    """Persists transcription jobs and runs them on background workers.
+
+    Jobs are queued in memory on the API process that accepted them, so a
+    job whose process goes away stays queued/running in the table.
+    """
+
+    def __init__(self, workers: int = settings.JOB_WORKERS):
+        self.workers = max(1, workers)
+        self._queue: Optional[asyncio.Queue[Tuple[uuid.UUID, JobWork]]] = None
+        self._tasks: list[asyncio.Task] = []
+        self._subscribers: Dict[uuid.UUID, Set[asyncio.Queue]] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Start the background workers"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"transcription-job-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} transcription job worker(s)")
+
+    async def shutdown(self) -> None:
+        """Stop the background workers"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def create_job(
+        self, filename: str, user_id: uuid.UUID, session: AsyncSession
+    ) -> TranscriptionJob:
+        """Persist a new queued job"""
+        job = TranscriptionJob(filename=filename, user_id=user_id)
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job
+
+    async def enqueue(self, job_id: uuid.UUID, work: JobWork) -> None:
+        """Queue work for a persisted job; ``work`` returns the transcript id"""
+        await self.start()
+        assert self._queue is not None
+        await self._queue.put((job_id, work))
+
+    def subscribe(self, job_id: uuid.UUID) -> asyncio.Queue:
+        """Receive status events for a job"""
+        events: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(job_id, set()).add(events)
+        return events
+
+    def unsubscribe(self, job_id: uuid.UUID, events: asyncio.Queue) -> None:
+        subscribers = self._subscribers.get(job_id)
+        if subscribers is not None:
+            subscribers.discard(events)
+            if not subscribers:
+                del self._subscribers[job_id]
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            job_id, work = await self._queue.get()
+            try:
+                await self._update(
+                    job_id, status=JobStatus.RUNNING, started_at=datetime.utcnow()
+                )
+                transcript_id = await work()
+                await self._update(
+                    job_id,
+                    status=JobStatus.DONE,
+                    transcript_id=transcript_id,
+                    finished_at=datetime.utcnow(),
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                detail = e.detail if isinstance(e, CustomException) else str(e)
+                logger.error(f"Transcription job {job_id} failed: {detail}")
+                await self._update(
+                    job_id,
+                    status=JobStatus.FAILED,
+                    error=detail,
+                    finished_at=datetime.utcnow(),
+                )
+            finally:
+                self._queue.task_done()
+
+    async def _update(self, job_id: uuid.UUID, **fields: Any) -> None:
+        async with AsyncSession(engine) as session:
+            job = await session.get(TranscriptionJob, job_id)
+            if job is None:
+                return
+            for key, value in fields.items():
+                setattr(job, key, value)
+            session.add(job)
+            await session.commit()
+
+        event = {"status": fields["status"].value}
+        if fields.get("error"):
+            event["error"] = fields["error"]
+        if fields.get("transcript_id"):
+            event["transcript_id"] = str(fields["transcript_id"])
+        for events in self._subscribers.get(job_id, ()):
+            events.put_nowait(event)
+
+
+job_service = JobService()
@@ -0,0 +1,115 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import uuid
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from models.user import User
+from utils.jwt_utils import verify_token
+from utils.metrics import PRINCIPAL_CACHE_REQUESTS
+
+
+class _TTLCache:
+    """Bounded LRU mapping whose entries expire at a per-entry wall-clock time"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max(0, max_size)
+        self._entries: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any, expires_at: float) -> None:
+        if self.max_size == 0:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class PrincipalCache:
+    """In-process cache of verified tokens and the users they belong to.
+
+    Saves the JWT decode and the user lookup on every authenticated request.
+    Entries live for at most ``ttl_s`` and are dropped as soon as a user row
+    is updated or deleted through the ORM in this process; with several
+    workers, the TTL bounds how long another process can see stale data.
+    """
+
+    def __init__(
+        self,
+        ttl_s: float = settings.PRINCIPAL_CACHE_TTL_S,
+        max_users: int = settings.PRINCIPAL_CACHE_SIZE,
+        max_tokens: int = settings.TOKEN_CACHE_SIZE,
+    ):
+        self.ttl_s = ttl_s
+        self._users = _TTLCache(max_users if ttl_s > 0 else 0)
+        self._tokens = _TTLCache(max_tokens if ttl_s > 0 else 0)
+
+    def verify_token(self, token: str, token_type: str) -> Optional[Dict[str, Any]]:
+        """``verify_token`` with the decoded payload cached until expiry"""
+        key = (hashlib.sha256(token.encode()).digest(), token_type)
+        payload = self._tokens.get(key)
+        if payload is not None:
+            PRINCIPAL_CACHE_REQUESTS.labels(cache="token", outcome="hit").inc()
+            return payload
+
+        PRINCIPAL_CACHE_REQUESTS.labels(cache="token", outcome="miss").inc()
+        payload = verify_token(token, token_type)
+        if payload is not None:
+            expires_at = time.time() + self.ttl_s
+            if isinstance(payload.get("exp"), (int, float)):
+                expires_at = min(expires_at, payload["exp"])
+            self._tokens.put(key, payload, expires_at)
+        return payload
+
+    async def get_user(
+        self, user_id: uuid.UUID, session: AsyncSession
+    ) -> Optional[User]:
+        """The user with ``user_id`` as a detached copy, or None if it doesn't exist"""
+        snapshot = self._users.get(user_id)
+        if snapshot is not None:
+            PRINCIPAL_CACHE_REQUESTS.labels(cache="user", outcome="hit").inc()
+            return User.model_validate(snapshot)
+
+        PRINCIPAL_CACHE_REQUESTS.labels(cache="user", outcome="miss").inc()
+        user = await session.get(User, user_id)
+        if user is None:
+            return None
+        self._users.put(user_id, user.model_dump(), time.time() + self.ttl_s)
+        return user
+
+    def invalidate(self, user_id: Optional[uuid.UUID] = None) -> None:
+        """Forget one user, or every cached user and token"""
+        if user_id is None:
+            self._users.clear()
+            self._tokens.clear()
+        else:
+            self._users.pop(user_id)
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    if target.id is not None:
+        principal_cache.invalidate(target.id)
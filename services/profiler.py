@@ -0,0 +1,127 @@
+import hmac
+import random
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from config.settings import settings
+
+PROFILE_SUFFIX = ".speedscope.json"
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def is_profiler_admin(token: Optional[str]) -> bool:
+    """Whether ``token`` is PROFILER_TOKEN (never true while it's unset)"""
+    if not settings.PROFILER_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), settings.PROFILER_TOKEN.encode())
+
+
+class ProfileStore:
+    """Speedscope profiles on disk, keeping only the newest ``max_files``"""
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max(1, max_files)
+
+    def new_id(self) -> str:
+        return uuid.uuid4().hex
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """Where a profile is stored, or None if the id isn't one of ours"""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        return self.directory / f"{profile_id}{PROFILE_SUFFIX}"
+
+    def save(self, profile_id: str, data: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(profile_id)
+        assert path is not None
+        temp = path.with_suffix(".tmp")
+        temp.write_text(data)
+        temp.replace(path)
+        self._prune()
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Stored profiles, newest first"""
+        profiles = []
+        for path in self._files():
+            stat = path.stat()
+            profiles.append(
+                {
+                    "id": path.name[: -len(PROFILE_SUFFIX)],
+                    "created_at": stat.st_mtime,
+                    "size": stat.st_size,
+                }
+            )
+        return profiles
+
+    def _files(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        files = self.directory.glob(f"*{PROFILE_SUFFIX}")
+        return sorted(files, key=lambda p: p.stat().st_mtime, reverse=True)
+
+    def _prune(self) -> None:
+        for path in self._files()[self.max_files :]:
+            path.unlink(missing_ok=True)
+
+
+class RequestProfiler:
+    """Decides which requests to profile and captures them with pyinstrument.
+
+    A request is profiled when it carries ``X-Profile-Token`` matching
+    PROFILER_TOKEN, or at random with probability ``sample_rate``. Profiling
+    samples the stack every ``interval_s`` rather than tracing every call;
+    at most ``max_concurrent`` requests are profiled at once to bound the
+    overhead. Needs the ``profiling`` extra (pyinstrument).
+    """
+
+    def __init__(
+        self,
+        store: ProfileStore,
+        sample_rate: float = settings.PROFILE_SAMPLE_RATE,
+        interval_s: float = settings.PROFILE_INTERVAL_MS / 1000,
+        max_concurrent: int = 1,
+    ):
+        import pyinstrument  # noqa: F401  (fail at startup, not per request)
+
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval_s = interval_s
+        self.max_concurrent = max_concurrent
+        self.active = 0
+
+    def should_profile(self, token: Optional[str]) -> bool:
+        if self.active >= self.max_concurrent:
+            return False
+        return is_profiler_admin(token) or random.random() < self.sample_rate
+
+    def start(self) -> Any:
+        from pyinstrument import Profiler
+
+        profiler = Profiler(interval=self.interval_s, async_mode="enabled")
+        profiler.start()
+        self.active += 1
+        return profiler
+
+    def stop(self, profiler: Any) -> Any:
+        self.active -= 1
+        return profiler.stop()
+
+    def save(self, profile_id: str, session: Any, label: str) -> None:
+        """Render a finished profile session as speedscope JSON and store it"""
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        started = time.perf_counter()
+        self.store.save(profile_id, SpeedscopeRenderer().render(session))
+        logger.info(
+            f"Saved profile {profile_id} of {label} "
+            f"({session.duration:.3f}s, rendered in "
+            f"{time.perf_counter() - started:.3f}s)"
+        )
+
+
+profile_store = ProfileStore(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
@@ -0,0 +1,213 @@
+import math
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from loguru import logger
+from config.settings import settings
+
+
+@dataclass
+class BucketState:
+    allowed: bool
+    tokens: float
+    capacity: float
+    rate: float  # tokens refilled per second
+
+    @property
+    def remaining(self) -> int:
+        return max(0, math.floor(self.tokens))
+
+    @property
+    def reset_after(self) -> int:
+        """Seconds until the bucket is full again"""
+        return math.ceil(max(0.0, self.capacity - self.tokens) / self.rate)
+
+    def retry_after(self, cost: float) -> int:
+        """Seconds until a request of ``cost`` would be allowed"""
+        needed = max(cost, 1e-6) - self.tokens
+        return max(1, math.ceil(needed / self.rate))
+
+
+class RateLimitBackend:
+    """Token-bucket storage.
+
+    ``consume`` refills the bucket for the time elapsed, then takes ``cost``
+    tokens if at least that many (and more than zero) are left. With
+    ``force`` the cost is taken regardless, which can leave the bucket in
+    debt; that is how work is charged after the fact.
+    """
+
+    async def consume(
+        self, key: str, capacity: float, rate: float, cost: float, force: bool = False
+    ) -> BucketState:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Buckets in this process; each worker enforces its own limits"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    async def consume(
+        self, key: str, capacity: float, rate: float, cost: float, force: bool = False
+    ) -> BucketState:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+
+        allowed = force or (tokens >= cost and tokens > 0)
+        if allowed:
+            tokens -= cost
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return BucketState(allowed, tokens, capacity, rate)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets shared by every worker through Redis (needs ``redis``)"""
+
+    # Refill, check and take atomically, using the server clock
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local force = ARGV[4] == "1"
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local allowed = force or (tokens >= cost and tokens > 0)
+if allowed then
+    tokens = tokens - cost
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now)
+redis.call("EXPIRE", KEYS[1], math.ceil((capacity - tokens) / rate) + 60)
+return {allowed and 1 or 0, tostring(tokens)}
+"""
+
+    def __init__(self, url: str, prefix: str = "scribe:ratelimit:"):
+        import redis.asyncio as redis
+
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(self.SCRIPT)
+
+    async def consume(
+        self, key: str, capacity: float, rate: float, cost: float, force: bool = False
+    ) -> BucketState:
+        allowed, tokens = await self._script(
+            keys=[self.prefix + key],
+            args=[capacity, rate, cost, "1" if force else "0"],
+        )
+        return BucketState(bool(allowed), float(tokens), capacity, rate)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+@dataclass
+class Limit:
+    capacity: float  # per window
+    window_s: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.window_s
+
+
+class RateLimiter:
+    """Per-client limits: buckets of requests, of reads and of transcribed audio.
+
+    Most requests take one token from the request bucket; job polling and
+    transcript reads take theirs from the larger reads bucket. Transcriptions
+    are charged by audio duration instead: they are admitted while the
+    client's audio bucket isn't empty, and their duration is taken once known.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        requests: Limit = Limit(
+            settings.RATE_LIMIT_REQUESTS, settings.RATE_LIMIT_WINDOW
+        ),
+        audio_seconds: Limit = Limit(
+            settings.RATE_LIMIT_AUDIO_SECONDS, settings.RATE_LIMIT_WINDOW
+        ),
+        reads: Limit = Limit(
+            settings.RATE_LIMIT_READ_REQUESTS, settings.RATE_LIMIT_WINDOW
+        ),
+    ):
+        self.backend = backend
+        self.limits: Dict[str, Limit] = {
+            "requests": requests,
+            "reads": reads,
+            "audio_seconds": audio_seconds,
+        }
+
+    async def consume(
+        self, key: str, bucket: str, cost: float, force: bool = False
+    ) -> BucketState:
+        limit = self.limits[bucket]
+        return await self.backend.consume(
+            f"{bucket}:{key}", limit.capacity, limit.rate, cost, force
+        )
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Rate limiter with the backend chosen by RATE_LIMIT_BACKEND"""
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        backend: RateLimitBackend = RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    elif settings.RATE_LIMIT_BACKEND == "memory":
+        backend = MemoryRateLimitBackend()
+    else:
+        raise ValueError(
+            f"Unknown RATE_LIMIT_BACKEND '{settings.RATE_LIMIT_BACKEND}'. "
+            "Available: memory, redis"
+        )
+    return RateLimiter(backend)
+
+
+class RateLimitContext:
+    """The rate-limit bucket of the client behind the current request"""
+
+    def __init__(self, limiter: RateLimiter, key: str):
+        self.limiter = limiter
+        self.key = key
+        self.audio_state: Optional[BucketState] = None
+
+    async def charge_audio(self, seconds: float) -> None:
+        self.audio_state = await self.limiter.consume(
+            self.key, "audio_seconds", seconds, force=True
+        )
+
+
+# Set by RateLimitMiddleware for each request; None when rate limiting is off
+current_rate_limit: ContextVar[Optional[RateLimitContext]] = ContextVar(
+    "current_rate_limit", default=None
+)
+
+
+async def charge_audio_seconds(
+    seconds: Optional[float], context: Optional[RateLimitContext] = None
+) -> None:
+    """Charge transcribed audio to the current client's audio bucket"""
+    context = context or current_rate_limit.get()
+    if context is None or not seconds:
+        return
+    try:
+        await context.charge_audio(seconds)
+    except Exception as e:
+        # Never fail a finished transcription over accounting
+        logger.warning(f"Failed to charge {seconds:.1f}s of audio: {e}")
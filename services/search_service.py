@@ -0,0 +1,200 @@
+import re
+from typing import Any, List, Mapping, Sequence
+import uuid
+from sqlalchemy import column, desc, func, literal_column, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from models.search import FTS_TABLE, TSVECTOR_TABLE, TS_CONFIG, owner_token
+from models.transcript import Transcript, TranscriptSearchResult
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+SNIPPET_WORDS = 16
+LIKE_SCAN_BATCH_SIZE = 200
+
+_fts = table(FTS_TABLE, column("rowid"))
+_tsvector = table(
+    TSVECTOR_TABLE, column("transcript_id"), column("user_id"), column("document")
+)
+
+
+def search_terms(query: str) -> List[str]:
+    """Words of a free-text query, without any index query syntax"""
+    return re.findall(r"\w+", query)
+
+
+def highlight(body: str, terms: List[str], words: int = SNIPPET_WORDS) -> str:
+    """About ``words`` words of ``body`` around the first term, terms marked"""
+    pattern = re.compile(
+        r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*",
+        re.IGNORECASE,
+    )
+    tokens = body.split()
+    first = next((i for i, token in enumerate(tokens) if pattern.search(token)), 0)
+    start = max(0, min(first - words // 4, len(tokens) - words))
+    snippet = pattern.sub(
+        lambda match: f"{HIGHLIGHT_START}{match.group(0)}{HIGHLIGHT_END}",
+        " ".join(tokens[start : start + words]),
+    )
+    return (
+        ("…" if start > 0 else "")
+        + snippet
+        + ("…" if start + words < len(tokens) else "")
+    )
+
+
+class SearchService:
+    async def search(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        limit: int,
+        offset: int,
+        session: AsyncSession,
+    ) -> List[TranscriptSearchResult]:
+        """Rank the user's transcripts against ``query``, best match first"""
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        dialect = session.bind.dialect.name
+        if dialect == "sqlite":
+            rows = await self._search_fts5(user_id, terms, limit, offset, session)
+        elif dialect == "postgresql":
+            rows = await self._search_tsvector(user_id, query, limit, offset, session)
+        else:
+            rows = await self._search_like(user_id, terms, limit, offset, session)
+
+        return [TranscriptSearchResult.model_validate(row) for row in rows]
+
+    async def _search_fts5(
+        self,
+        user_id: uuid.UUID,
+        terms: List[str],
+        limit: int,
+        offset: int,
+        session: AsyncSession,
+    ) -> Sequence[Mapping[str, Any]]:
+        # Every term must match, the last one as a prefix (search-as-you-type)
+        phrases = " ".join(f'"{term}"' for term in terms[:-1])
+        match = (
+            f'owner : "{owner_token(user_id)}" '
+            f'AND transcription : ({phrases} "{terms[-1]}"*)'
+        )
+        statement = (
+            select(
+                Transcript.id,
+                Transcript.filename,
+                Transcript.duration,
+                Transcript.created_at,
+                Transcript.transcription,
+                # bm25 is lower-is-better; the owner column doesn't count
+                literal_column(f"-bm25({FTS_TABLE}, 0.0, 1.0)").label("rank"),
+            )
+            .select_from(_fts)
+            .join(Transcript, literal_column("transcript.rowid") == _fts.c.rowid)
+            .where(
+                text(f"{FTS_TABLE} MATCH :match").bindparams(match=match),
+                # The owner token already scopes the match; this guards the
+                # join should the index ever disagree with the table
+                Transcript.user_id == user_id,
+            )
+            .order_by(desc("rank"))
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await session.execute(statement)
+        # The index is contentless, so FTS5's snippet() has no text to cut
+        return [
+            {**row, "snippet": highlight(row["transcription"], terms)}
+            for row in result.mappings()
+        ]
+
+    async def _search_tsvector(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        limit: int,
+        offset: int,
+        session: AsyncSession,
+    ) -> Sequence[Mapping[str, Any]]:
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, query)
+        ranked = (
+            select(
+                _tsvector.c.transcript_id,
+                func.ts_rank_cd(_tsvector.c.document, tsquery).label("rank"),
+            )
+            .where(
+                _tsvector.c.user_id == user_id,
+                _tsvector.c.document.op("@@")(tsquery),
+            )
+            .order_by(desc("rank"))
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        # Bodies are compressed at rest, out of ts_headline's reach: snippets
+        # are cut in Python, and only for the page
+        statement = (
+            select(
+                Transcript.id,
+                Transcript.filename,
+                Transcript.duration,
+                Transcript.created_at,
+                Transcript.transcription,
+                ranked.c.rank,
+            )
+            .join(ranked, ranked.c.transcript_id == Transcript.id)
+            .order_by(desc(ranked.c.rank))
+        )
+        result = await session.execute(statement)
+        terms = search_terms(query)
+        return [
+            {**row, "snippet": highlight(row["transcription"], terms)}
+            for row in result.mappings()
+        ]
+
+    async def _search_like(
+        self,
+        user_id: uuid.UUID,
+        terms: List[str],
+        limit: int,
+        offset: int,
+        session: AsyncSession,
+    ) -> Sequence[Mapping[str, Any]]:
+        # No full-text index on this database: unranked substring scan. The
+        # bodies are compressed at rest, so it runs here rather than as LIKE
+        statement = (
+            select(
+                Transcript.id,
+                Transcript.filename,
+                Transcript.duration,
+                Transcript.created_at,
+                Transcript.transcription,
+            )
+            .where(Transcript.user_id == user_id)
+            .order_by(desc(Transcript.created_at))
+            .execution_options(yield_per=LIKE_SCAN_BATCH_SIZE)
+        )
+        needles = [term.lower() for term in terms]
+        rows: List[Mapping[str, Any]] = []
+        skipped = 0
+        result = await session.stream(statement)
+        async for row in result.mappings():
+            body = row["transcription"].lower()
+            if not all(needle in body for needle in needles):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            rows.append(
+                {
+                    **row,
+                    "rank": 0.0,
+                    "snippet": highlight(row["transcription"], terms),
+                }
+            )
+            if len(rows) == limit:
+                break
+        await result.close()
+        return rows
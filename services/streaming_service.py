@@ -0,0 +1,137 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import numpy as np
+from config.settings import settings
+from utils.vad import Region, detect_speech
+
+SAMPLE_RATE = 16000
+
+StreamEvent = Dict[str, Any]
+
+
+class StreamingTranscriber:
+    """Sliding-window transcription of an open-ended audio stream.
+
+    Audio since the last finalized segment forms the window. Every
+    ``partial_interval_ms`` of new audio the window is re-transcribed and
+    sent as a partial; it is finalized once speech is followed by a pause of
+    ``pause_ms`` or the window reaches ``max_window_s``, cutting at the last
+    gap between speech regions so words aren't split.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray], Awaitable[str]],
+        partial_interval_ms: int = settings.STREAM_PARTIAL_INTERVAL_MS,
+        max_window_s: float = settings.STREAM_MAX_WINDOW_S,
+        pause_ms: int = settings.STREAM_PAUSE_MS,
+    ):
+        self._transcribe = transcribe
+        self.partial_interval = SAMPLE_RATE * partial_interval_ms // 1000
+        self.max_window = int(SAMPLE_RATE * max_window_s)
+        self.pause = SAMPLE_RATE * pause_ms // 1000
+        self._chunks: List[np.ndarray] = []
+        self._window = np.zeros(0, dtype=np.float32)
+        self._offset = 0  # samples finalized before the window
+        self._unprocessed = 0
+        self._last_partial = ""
+        self.segments: List[StreamEvent] = []
+
+    @property
+    def duration(self) -> float:
+        return (self._offset + len(self._window) + self._pending) / SAMPLE_RATE
+
+    @property
+    def text(self) -> str:
+        return " ".join(segment["text"] for segment in self.segments)
+
+    @property
+    def _pending(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def add(self, samples: np.ndarray) -> None:
+        """Append decoded 16 kHz mono samples"""
+        self._chunks.append(samples)
+        self._unprocessed += len(samples)
+
+    def ready(self) -> bool:
+        """Enough new audio arrived for another pass"""
+        return self._unprocessed >= self.partial_interval
+
+    async def step(self) -> List[StreamEvent]:
+        """Transcribe the window, finalizing a segment when a cut point is found"""
+        self._collect()
+        self._unprocessed = 0
+
+        regions = self._speech_regions()
+        if not regions:
+            # Nothing to say yet; drop stale silence so the window stays short
+            if len(self._window) > self.pause:
+                self._advance(len(self._window) - self.pause)
+            return []
+
+        cut = self._find_cut(regions)
+        if cut is not None:
+            return await self._finalize(cut)
+
+        text = await self._transcribe(self._window)
+        if not text or text == self._last_partial:
+            return []
+        self._last_partial = text
+        return [{"type": "partial", "text": text, "start": self._offset / SAMPLE_RATE}]
+
+    async def flush(self) -> List[StreamEvent]:
+        """Finalize whatever audio is left when the stream ends"""
+        self._collect()
+        self._unprocessed = 0
+        if not self._speech_regions():
+            return []
+        return await self._finalize(len(self._window))
+
+    def _speech_regions(self) -> List[Region]:
+        # A window can be all speech, so no noise floor is estimated from it
+        return detect_speech(
+            self._window,
+            SAMPLE_RATE,
+            threshold_db=settings.VAD_THRESHOLD_DB,
+            margin_db=None,
+            padding_ms=0,
+        )
+
+    def _find_cut(self, regions: List[Region]) -> Optional[int]:
+        last_speech_end = regions[-1][1]
+        if len(self._window) - last_speech_end >= self.pause:
+            return last_speech_end + self.pause // 2
+
+        if len(self._window) < self.max_window:
+            return None
+        if len(regions) > 1:
+            # Middle of the last gap between speech regions
+            return (regions[-2][1] + regions[-1][0]) // 2
+        return len(self._window)
+
+    async def _finalize(self, cut: int) -> List[StreamEvent]:
+        audio = self._window[:cut]
+        start = self._offset
+        self._advance(cut)
+        self._last_partial = ""
+
+        text = await self._transcribe(audio)
+        if not text:
+            return []
+        segment = {
+            "type": "final",
+            "text": text,
+            "start": start / SAMPLE_RATE,
+            "end": (start + cut) / SAMPLE_RATE,
+        }
+        self.segments.append(segment)
+        return [segment]
+
+    def _collect(self) -> None:
+        if self._chunks:
+            self._window = np.concatenate([self._window, *self._chunks])
+            self._chunks = []
+
+    def _advance(self, samples: int) -> None:
+        self._window = self._window[samples:]
+        self._offset += samples
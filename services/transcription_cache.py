@@ -0,0 +1,190 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from loguru import logger
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from config.settings import settings
+from models import Transcript, engine
+from models.transcription_cache import TranscriptionCacheEntry
+from utils.metrics import TRANSCRIPTION_CACHE_REQUESTS
+
+CachedResult = Dict[str, Any]
+# How often a process deletes expired entries, at most
+PRUNE_INTERVAL_S = 600.0
+
+
+class TranscriptionCache:
+    """Content-addressed cache of transcription results.
+
+    Entries live in the ``transcription_cache`` table with a small in-memory
+    LRU in front. Concurrent requests for the same key are coalesced so only
+    one of them runs inference. Entries expire after ``ttl_s`` and go as
+    soon as the last transcript of their audio is deleted (another process'
+    LRU may still hold a copy until it expires).
+    """
+
+    def __init__(
+        self,
+        lru_size: int = settings.TRANSCRIPTION_CACHE_LRU_SIZE,
+        ttl_s: float = settings.TRANSCRIPTION_CACHE_TTL_S,
+    ):
+        self.lru_size = max(0, lru_size)
+        self.ttl = timedelta(seconds=ttl_s)
+        # key -> (result, content hash, stored at)
+        self._lru: OrderedDict[str, Tuple[CachedResult, str, datetime]] = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._next_prune = 0.0
+
+    @staticmethod
+    def make_key(content_hash: str, model: str, params: Dict[str, Any]) -> str:
+        """Cache key for audio content transcribed by ``model`` with ``params``"""
+        material = json.dumps(
+            {"content": content_hash, "model": model, "params": params},
+            sort_keys=True,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _expired_before(self) -> datetime:
+        return datetime.utcnow() - self.ttl
+
+    async def get(self, key: str) -> Optional[CachedResult]:
+        if key in self._lru:
+            result, _, stored_at = self._lru[key]
+            if stored_at >= self._expired_before():
+                self._lru.move_to_end(key)
+                return result
+            del self._lru[key]
+
+        async with AsyncSession(engine) as session:
+            entry = await session.get(TranscriptionCacheEntry, key)
+        if entry is None or entry.created_at < self._expired_before():
+            return None
+
+        result = {"transcription": entry.transcription, "duration": entry.duration}
+        self._remember(key, result, entry.content_hash, entry.created_at)
+        return result
+
+    async def put(
+        self, key: str, content_hash: str, model: str, result: CachedResult
+    ) -> None:
+        entry = TranscriptionCacheEntry(
+            key=key,
+            content_hash=content_hash,
+            model=model,
+            transcription=result["transcription"],
+            duration=result.get("duration"),
+        )
+        self._remember(key, result, content_hash, entry.created_at)
+        try:
+            async with AsyncSession(engine) as session:
+                session.add(entry)
+                await session.commit()
+        except IntegrityError:
+            # Another worker stored the same result first
+            pass
+        if time.monotonic() >= self._next_prune:
+            self._next_prune = time.monotonic() + PRUNE_INTERVAL_S
+            await self.prune()
+
+    async def prune(self) -> int:
+        """Delete expired entries; returns how many rows went"""
+        cutoff = self._expired_before()
+        for key in [k for k, (_, _, at) in self._lru.items() if at < cutoff]:
+            del self._lru[key]
+        async with AsyncSession(engine) as session:
+            result = await session.execute(
+                delete(TranscriptionCacheEntry).where(
+                    TranscriptionCacheEntry.created_at < cutoff
+                )
+            )
+            await session.commit()
+        return result.rowcount
+
+    async def discard_unreferenced(
+        self, content_hash: str, session: AsyncSession
+    ) -> None:
+        """Drop the results for some audio once no transcript of it is left.
+
+        Runs in the caller's transaction, after its transcript was deleted
+        """
+        await session.flush()
+        remaining = await session.scalar(
+            select(func.count())
+            .select_from(Transcript)
+            .where(Transcript.content_hash == content_hash)
+        )
+        if remaining:
+            return
+        await session.execute(
+            delete(TranscriptionCacheEntry).where(
+                TranscriptionCacheEntry.content_hash == content_hash
+            )
+        )
+        for key in [k for k, (_, h, _) in self._lru.items() if h == content_hash]:
+            del self._lru[key]
+
+    async def get_or_compute(
+        self,
+        key: str,
+        content_hash: str,
+        model: str,
+        compute: Callable[[], Awaitable[CachedResult]],
+    ) -> CachedResult:
+        """Return the cached result for ``key`` or compute it exactly once"""
+        cached = await self.get(key)
+        if cached is not None:
+            TRANSCRIPTION_CACHE_REQUESTS.labels(outcome="hit").inc()
+            return cached
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            TRANSCRIPTION_CACHE_REQUESTS.labels(outcome="coalesced").inc()
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # The request computing it went away; take over
+                return await self.get_or_compute(key, content_hash, model, compute)
+
+        TRANSCRIPTION_CACHE_REQUESTS.labels(outcome="miss").inc()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await compute()
+            try:
+                await self.put(key, content_hash, model, result)
+            except Exception as e:
+                logger.warning(f"Failed to store transcription cache entry: {e}")
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Waiters re-raise it; don't warn when there are none
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    def _remember(
+        self, key: str, result: CachedResult, content_hash: str, stored_at: datetime
+    ) -> None:
+        if self.lru_size == 0:
+            return
+        self._lru[key] = (result, content_hash, stored_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+
+transcription_cache = TranscriptionCache()
@@ -1,89 +1,231 @@
-import os
-import tempfile
-from typing import Dict, Any
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+import numpy as np
 # import whisper
 from loguru import logger
 from config.settings import settings
-from utils.file_utils import convert_to_wav, get_audio_duration, cleanup_file
+from utils.file_utils import SpooledUpload, SEEKABLE_INPUT_FORMATS, decode_audio
+from utils.audio_chunking import overlap_words, split_audio, stitch_transcripts
+from utils.vad import trim_silence
+from utils.metrics import (
+    REAL_TIME_FACTOR,
+    TRANSCRIBED_AUDIO_SECONDS,
+    VAD_REMOVED_RATIO,
+    VAD_REMOVED_SECONDS,
+    observe_stage,
+    stage_timer,
+)
 from errors.custom_exceptions import TranscriptionError
-from transformers import AutomaticSpeechRecognitionPipeline, pipeline
-import librosa
+from services.inference_worker import MODEL_NAME, inference_pool
+from services.batching import inference_batcher
+from services.transcription_cache import transcription_cache
+from services.admission import admission_controller
+
+SAMPLE_RATE = 16000
 
 
 class TranscriptionService:
     def __init__(self):
         # self.model_path = settings.WHISPER_MODEL_PATH
-        self._model : AutomaticSpeechRecognitionPipeline | None = None
-
-    def _load_model(self):
-        """Load Whisper model lazily"""
-        if self._model is None:
-            try:
-                # if not os.path.exists(self.model_path):
-                #     raise TranscriptionError(
-                #         f"Whisper model not found at {self.model_path}"
-                #     )
-
-                self._model = pipeline("automatic-speech-recognition", model="0x456665/whisper-small-medical")
-                logger.info("Loaded Whisper model")
-            except Exception as e:
-                logger.error(f"Failed to load Whisper model: {e}")
-                raise TranscriptionError(
-                    f"Failed to load transcription model: {str(e)}"
-                )
-
-    async def transcribe_audio(
-        self, file_path: str, original_filename: str
-    ) -> Dict[str, Any]:
+        self._pool = inference_pool
+        self._batcher = inference_batcher
+        self._cache = transcription_cache
+        self._admission = admission_controller
+
+    async def transcribe_audio(self, upload: SpooledUpload) -> Dict[str, Any]:
         """Transcribe audio file using Whisper"""
-        self._load_model()
+        if settings.TRANSCRIPTION_CACHE_ENABLED:
+            # Identical audio decoded the same way gives the same text
+            key = self._cache.make_key(
+                upload.sha256, MODEL_NAME, await self._decode_params()
+            )
+            result = await self._cache.get_or_compute(
+                key, upload.sha256, MODEL_NAME, lambda: self._transcribe(upload)
+            )
+        else:
+            result = await self._transcribe(upload)
+
+        return {
+            "transcription": result["transcription"],
+            "duration": result.get("duration"),
+            "file_size": upload.size,
+            "filename": upload.filename,
+            "content_hash": upload.sha256,
+        }
 
-        temp_wav_path = None
+    async def is_cached(self, upload: SpooledUpload) -> bool:
+        """Whether the upload's transcription would come from the cache"""
+        if not settings.TRANSCRIPTION_CACHE_ENABLED:
+            return False
+        key = self._cache.make_key(
+            upload.sha256, MODEL_NAME, await self._decode_params()
+        )
+        # Also warms the in-memory LRU for the lookup that follows
+        return await self._cache.get(key) is not None
+
+    async def transcribe_segment(self, audio: np.ndarray) -> str:
+        """Transcribe a short decoded clip of a live stream (not cached)"""
+        await self._pool.start()
         try:
-            # Get file info
-            duration = get_audio_duration(file_path)
-            file_size = os.path.getsize(file_path)
-
-            # Convert to WAV if necessary
-            if not file_path.lower().endswith(".wav"):
-                temp_wav_path = tempfile.mkstemp(suffix=".wav")
-                if not convert_to_wav(file_path, temp_wav_path[1]):
-                    raise TranscriptionError("Failed to convert audio file")
-                transcription_path = temp_wav_path[1]
-            else:
-                transcription_path = file_path
-
-            # Perform transcription
-            logger.info(f"Starting transcription of {original_filename}")
-
-            try:
-                audio, _ = librosa.load(transcription_path, sr=16000)
-                if (not self._model):
-                    raise TranscriptionError("model not loaded properly")
-                result =  self._model(audio)
-                print(result)
-                transcription_text = result.get("text", "")
-
-                if not transcription_text:
-                    raise TranscriptionError("No speech detected in audio file")
-
-                logger.info(f"Transcription completed for {original_filename}")
-
-                return {
-                    "transcription": transcription_text,
-                    "duration": duration,
-                    "file_size": file_size,
-                    "filename": original_filename,
+            started = time.perf_counter()
+            result = await self._batcher.transcribe(audio)
+            self._record_inference(
+                len(audio) / SAMPLE_RATE, started, result.get("inference_seconds")
+            )
+        except Exception as e:
+            logger.error(f"Whisper transcription failed: {e}")
+            raise TranscriptionError(f"Transcription failed: {str(e)}")
+        return result.get("text", "").strip()
+
+    async def _transcribe(self, upload: SpooledUpload) -> Dict[str, Any]:
+        await self._pool.start()
+
+        original_filename = upload.filename
+        audio = await self._decode(upload)
+        duration = len(audio) / SAMPLE_RATE
+
+        if settings.VAD_ENABLED:
+            with stage_timer("vad"):
+                audio = await self._remove_silence(audio, original_filename)
+
+        # Perform transcription
+        logger.info(f"Starting transcription of {original_filename}")
+
+        try:
+            started = time.perf_counter()
+            transcription_text, service_seconds = await self._run_model(audio)
+            self._record_inference(len(audio) / SAMPLE_RATE, started, service_seconds)
+            logger.debug(
+                f"Whisper result for {original_filename}: {transcription_text}"
+            )
+
+            if not transcription_text:
+                raise TranscriptionError("No speech detected in audio file")
+
+            logger.info(f"Transcription completed for {original_filename}")
+
+            return {"transcription": transcription_text, "duration": duration}
+
+        except Exception as e:
+            logger.error(f"Whisper transcription failed: {e}")
+            raise TranscriptionError(f"Transcription failed: {str(e)}")
+
+    def _record_inference(
+        self,
+        audio_seconds: float,
+        started: float,
+        service_seconds: Optional[float] = None,
+    ) -> None:
+        """Record inference timings.
+
+        The stage timing is wall-clock, queueing included. The real-time
+        factor uses the workers' own ``service_seconds``: admission already
+        accounts for queued work, so counting the wait again would inflate it.
+        """
+        elapsed = time.perf_counter() - started
+        observe_stage("inference", elapsed)
+        TRANSCRIBED_AUDIO_SECONDS.inc(audio_seconds)
+        if service_seconds is None:
+            service_seconds = elapsed
+        if audio_seconds > 0:
+            REAL_TIME_FACTOR.observe(service_seconds / audio_seconds)
+        self._admission.observe(audio_seconds, service_seconds)
+
+    async def _remove_silence(self, audio: np.ndarray, filename: str) -> np.ndarray:
+        """Drop non-speech audio, failing fast when nothing is left"""
+        speech, removed = await asyncio.to_thread(
+            trim_silence,
+            audio,
+            SAMPLE_RATE,
+            backend=settings.VAD_BACKEND,
+            aggressiveness=settings.VAD_AGGRESSIVENESS,
+            threshold_db=settings.VAD_THRESHOLD_DB,
+            padding_ms=settings.VAD_PADDING_MS,
+        )
+        VAD_REMOVED_SECONDS.inc(removed)
+        if len(audio):
+            VAD_REMOVED_RATIO.observe(removed / (len(audio) / SAMPLE_RATE))
+        logger.info(f"VAD removed {removed:.1f}s of non-speech audio from {filename}")
+
+        if len(speech) == 0:
+            raise TranscriptionError("No speech detected in audio file")
+        return speech
+
+    async def _decode_params(self) -> Dict[str, Any]:
+        """Settings that change the text produced for the same audio"""
+        if self._pool.mode == "socket":
+            # The inference server decides which model runs; connecting is
+            # cheap, unlike loading a local model for what may be a cache hit
+            await self._pool.start()
+            backend, model_path = self._pool.backend, self._pool.model_path
+        else:
+            backend, model_path = settings.ASR_BACKEND, settings.ASR_MODEL_PATH
+        return {
+            "backend": backend,
+            "model_path": model_path,
+            "sample_rate": SAMPLE_RATE,
+            "longform": settings.LONGFORM_ENABLED,
+            "longform_min_duration_s": settings.LONGFORM_MIN_DURATION_S,
+            "chunk_length_s": settings.LONGFORM_CHUNK_LENGTH_S,
+            "stride_s": settings.LONGFORM_STRIDE_S,
+            "vad": (
+                {
+                    "backend": settings.VAD_BACKEND,
+                    "aggressiveness": settings.VAD_AGGRESSIVENESS,
+                    "threshold_db": settings.VAD_THRESHOLD_DB,
+                    "padding_ms": settings.VAD_PADDING_MS,
                 }
+                if settings.VAD_ENABLED
+                else None
+            ),
+        }
+
+    async def _decode(self, upload: SpooledUpload) -> np.ndarray:
+        """Decode the upload to 16 kHz mono float32 samples"""
+        suffix = Path(upload.filename).suffix.lower()
+        if upload.in_memory and suffix not in SEEKABLE_INPUT_FORMATS:
+            source: Union[str, bytes] = upload.getvalue()
+        else:
+            with stage_timer("disk_write"):
+                source = await upload.materialize()
+
+        with stage_timer("decode"):
+            audio = await asyncio.to_thread(decode_audio, source, SAMPLE_RATE)
+        if audio is None:
+            raise TranscriptionError("Failed to convert audio file")
+        return audio
+
+    async def _run_model(self, audio: np.ndarray) -> Tuple[str, Optional[float]]:
+        """Run Whisper on decoded audio, chunking long recordings.
 
-            except Exception as e:
-                logger.error(f"Whisper transcription failed: {e}")
-                raise TranscriptionError(f"Transcription failed: {str(e)}")
+        Returns the text and the worker time spent on it, summed over chunks
+        """
+        if (
+            not settings.LONGFORM_ENABLED
+            or len(audio) <= settings.LONGFORM_MIN_DURATION_S * SAMPLE_RATE
+        ):
+            result = await self._batcher.transcribe(audio)
+            return result.get("text", ""), result.get("inference_seconds")
 
-        finally:
-            # Clean up temporary files
-            if temp_wav_path and os.path.exists(temp_wav_path[1]):
-                cleanup_file(temp_wav_path[1])
+        # Long-form: overlapping windows run concurrently across the workers
+        chunks = split_audio(
+            audio,
+            SAMPLE_RATE,
+            settings.LONGFORM_CHUNK_LENGTH_S,
+            settings.LONGFORM_STRIDE_S,
+        )
+        results = await asyncio.gather(
+            *(self._batcher.transcribe(chunk) for chunk in chunks)
+        )
+        text = stitch_transcripts(
+            [result.get("text", "").strip() for result in results],
+            max_overlap_words=overlap_words(settings.LONGFORM_STRIDE_S),
+        )
+        if any("inference_seconds" not in result for result in results):
+            return text, None
+        return text, sum(result["inference_seconds"] for result in results)
 
     def get_supported_formats(self) -> list[str]:
         """Get list of supported audio formats"""
@@ -0,0 +1,135 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from config.settings import settings
+from controllers import transcription_controller
+from controllers.transcription_controller import TranscriptionController
+from errors.custom_exceptions import ServiceUnavailableError
+from services.admission import UNCOMPRESSED_BYTES_PER_SECOND, AdmissionController
+
+
+def make_controller(workers=1, budget=10.0, rtf=1.0) -> AdmissionController:
+    pool = SimpleNamespace(workers=workers)
+    return AdmissionController(pool, latency_budget_s=budget, initial_rtf=rtf)
+
+
+def test_idle_service_admits_any_amount():
+    controller = make_controller()
+
+    ticket = controller.admit(3600.0)
+
+    assert controller.backlog_seconds == 3600.0
+    assert ticket.audio_seconds == 3600.0
+
+
+def test_admit_rejects_past_the_budget_with_retry_after():
+    controller = make_controller(budget=10.0)
+    controller.admit(8.0)
+
+    with pytest.raises(ServiceUnavailableError) as excinfo:
+        controller.admit(5.0)
+
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.retry_after == 3
+    assert controller.backlog_seconds == 8.0
+
+
+def test_wait_is_shared_across_workers():
+    controller = make_controller(workers=2, budget=10.0)
+    controller.admit(8.0)
+
+    controller.admit(12.0)
+
+    assert controller.estimated_wait() == pytest.approx(10.0)
+
+
+def test_release_returns_capacity_once():
+    controller = make_controller()
+    first = controller.admit(4.0)
+    controller.admit(2.0)
+
+    controller.release(first)
+    controller.release(first)
+
+    assert first.released
+    assert controller.backlog_seconds == 2.0
+
+
+def test_observe_moves_the_real_time_factor_towards_measurements():
+    controller = make_controller(rtf=1.0)
+
+    controller.observe(audio_seconds=10.0, inference_seconds=2.0)
+    controller.observe(audio_seconds=0.0, inference_seconds=5.0)
+
+    assert controller.rtf == pytest.approx(1.0 + 0.2 * (0.2 - 1.0))
+
+
+def test_estimate_audio_seconds_by_format():
+    controller = make_controller()
+
+    assert (
+        controller.estimate_audio_seconds("a.WAV", UNCOMPRESSED_BYTES_PER_SECOND) == 1
+    )
+    assert controller.estimate_audio_seconds("a.mp3", 32000) == 2
+
+
+@pytest.fixture
+def batch_admission(monkeypatch):
+    controller = make_controller(budget=10.0)
+    monkeypatch.setattr(transcription_controller, "admission_controller", controller)
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", True)
+    monkeypatch.setattr(settings, "TRANSCRIPTION_CACHE_ENABLED", False)
+    return controller
+
+
+def wav_upload(seconds: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        filename="clip.wav", size=int(seconds * UNCOMPRESSED_BYTES_PER_SECOND)
+    )
+
+
+def test_batch_file_waits_for_capacity(monkeypatch, batch_admission):
+    monkeypatch.setattr(settings, "UPLOAD_BATCH_ADMISSION_WAIT_S", 30.0)
+    busy = batch_admission.admit(5.0)
+
+    async def run():
+        asyncio.get_running_loop().call_later(0.1, batch_admission.release, busy)
+        return await TranscriptionController()._admit_waiting(wav_upload(5.5))
+
+    ticket = asyncio.run(run())
+
+    assert ticket.audio_seconds == pytest.approx(5.5)
+    assert batch_admission.backlog_seconds == pytest.approx(5.5)
+
+
+def test_batch_file_gives_up_after_the_wait(monkeypatch, batch_admission):
+    monkeypatch.setattr(settings, "UPLOAD_BATCH_ADMISSION_WAIT_S", 0.05)
+    batch_admission.admit(5.0)
+
+    with pytest.raises(ServiceUnavailableError):
+        asyncio.run(TranscriptionController()._admit_waiting(wav_upload(5.5)))
+
+    assert batch_admission.backlog_seconds == 5.0
+
+
+def test_batch_admission_off_admits_nothing(monkeypatch, batch_admission):
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", False)
+
+    ticket = asyncio.run(TranscriptionController()._admit_waiting(wav_upload(60)))
+
+    assert ticket is None
+    assert batch_admission.backlog_seconds == 0.0
+
+
+def test_cached_audio_skips_admission(monkeypatch, batch_admission):
+    batch_admission.admit(5.0)
+    controller = TranscriptionController()
+
+    async def is_cached(upload):
+        return True
+
+    monkeypatch.setattr(controller.transcription_service, "is_cached", is_cached)
+
+    # The backlog is full, but a cache hit runs no inference
+    assert asyncio.run(controller._admit(wav_upload(60))) is None
+    assert batch_admission.backlog_seconds == 5.0
@@ -0,0 +1,59 @@
+from utils.audio_chunking import overlap_words, stitch_transcripts
+
+
+def test_overlap_is_kept_once():
+    texts = [
+        "the quick brown fox jumps over",
+        "fox jumps over the lazy dog",
+    ]
+
+    assert stitch_transcripts(texts) == "the quick brown fox jumps over the lazy dog"
+
+
+def test_overlap_ignores_case_and_punctuation():
+    texts = ["and then we left. The", "We left, the car was gone"]
+
+    assert stitch_transcripts(texts) == "and then we left. The car was gone"
+
+
+def test_single_word_only_counts_at_the_seam():
+    assert stitch_transcripts(["see you", "you later"]) == "see you later"
+    # "a" also appears earlier in the tail, away from the seam
+    assert stitch_transcripts(["a cat sat", "a dog ran"]) == "a cat sat a dog ran"
+
+
+def test_no_overlap_appends():
+    assert stitch_transcripts(["one two", "three four"]) == "one two three four"
+
+
+def test_empty_chunks_are_skipped():
+    assert stitch_transcripts(["", "hello there", "", "there friend"]) == (
+        "hello there friend"
+    )
+    assert stitch_transcripts([]) == ""
+
+
+def test_repeated_phrase_away_from_the_seam_is_not_an_overlap():
+    first = (
+        "the patient reports chest pain radiating to the left arm since "
+        "yesterday we will follow up next week with cardiology"
+    )
+    second = "with cardiology and the patient reports no other complaints at this time"
+
+    assert stitch_transcripts([first, second]) == (
+        first + " and the patient reports no other complaints at this time"
+    )
+
+
+def test_overlap_is_limited_to_max_overlap_words():
+    texts = ["one two three four", "two three four five"]
+
+    assert stitch_transcripts(texts, max_overlap_words=2) == (
+        "one two three four two three four five"
+    )
+    assert stitch_transcripts(texts, max_overlap_words=3) == "one two three four five"
+
+
+def test_overlap_words_scales_with_the_stride():
+    assert overlap_words(5.0) == 20
+    assert overlap_words(0.1) == 1
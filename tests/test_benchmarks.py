@@ -0,0 +1,40 @@
+import os
+import pytest
+from benchmarks import login_bench
+
+
+@pytest.fixture
+def login_run(monkeypatch):
+    seen = {}
+
+    async def run(users, requests, concurrency):
+        seen["RATE_LIMIT_ENABLED"] = os.environ.get("RATE_LIMIT_ENABLED")
+        return {
+            "requests": requests,
+            "concurrency": concurrency,
+            "failures": 0,
+            "throughput_rps": 1.0,
+            "p50_ms": 1.0,
+            "p99_ms": 1.0,
+            "max_loop_lag_ms": 0.0,
+        }
+
+    monkeypatch.setattr(login_bench, "run", run)
+    return seen
+
+
+def test_login_bench_disables_rate_limiting(monkeypatch, login_run):
+    # setenv first so the value main() sets is undone afterwards
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "")
+    monkeypatch.delenv("RATE_LIMIT_ENABLED")
+
+    assert login_bench.main(["--requests", "1"]) == 0
+    assert login_run["RATE_LIMIT_ENABLED"] == "false"
+
+
+def test_login_bench_keeps_an_explicit_rate_limit_setting(monkeypatch, login_run):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+
+    login_bench.main(["--requests", "1"])
+
+    assert login_run["RATE_LIMIT_ENABLED"] == "true"
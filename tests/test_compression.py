@@ -0,0 +1,82 @@
+import pytest
+from utils.compression import (
+    GZIP_MAGIC,
+    ZSTD_MAGIC,
+    accepts_encoding,
+    compress_text,
+    decompress_text,
+    stored_encoding,
+)
+
+TEXT = "The patient reports mild pain since Monday. " * 20
+
+
+def test_gzip_round_trip():
+    data = compress_text(TEXT, encoding="gzip", min_bytes=0)
+
+    assert data.startswith(GZIP_MAGIC)
+    assert stored_encoding(data) == "gzip"
+    assert decompress_text(data) == TEXT
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    data = compress_text(TEXT, encoding="zstd", min_bytes=0)
+
+    assert data.startswith(ZSTD_MAGIC)
+    assert stored_encoding(data) == "zstd"
+    assert decompress_text(data) == TEXT
+
+
+def test_gzip_output_is_deterministic():
+    assert compress_text(TEXT, encoding="gzip", min_bytes=0) == compress_text(
+        TEXT, encoding="gzip", min_bytes=0
+    )
+
+
+def test_short_text_is_stored_plain():
+    data = compress_text("hello", encoding="gzip", min_bytes=256)
+
+    assert data == b"hello"
+    assert stored_encoding(data) is None
+
+
+def test_none_stores_plain():
+    assert compress_text(TEXT, encoding="none", min_bytes=0) == TEXT.encode()
+
+
+def test_unknown_encoding_raises():
+    with pytest.raises(ValueError):
+        compress_text(TEXT, encoding="brotli", min_bytes=0)
+
+
+@pytest.mark.parametrize("stored", ["plain text", b"plain text"])
+def test_plain_bodies_read_back(stored):
+    # Rows from before compression: TEXT on SQLite, bytes elsewhere
+    assert stored_encoding(stored) is None
+    assert decompress_text(stored) == "plain text"
+
+
+def test_plain_text_is_never_mistaken_for_a_frame():
+    for text in ("\x1f", "\x28\xb5", "(", "\x1f\x8b"):
+        assert stored_encoding(text.encode()) is None
+
+
+@pytest.mark.parametrize(
+    "header, encoding, expected",
+    [
+        (None, "gzip", False),
+        ("", "gzip", False),
+        ("gzip", "gzip", True),
+        ("br, gzip;q=0.5", "gzip", True),
+        ("GZIP", "gzip", True),
+        ("gzip;q=0", "gzip", False),
+        ("deflate", "gzip", False),
+        ("*", "zstd", True),
+        ("*;q=0", "zstd", False),
+        ("zstd;q=0, *", "zstd", False),
+        ("gzip;q=bogus", "gzip", False),
+    ],
+)
+def test_accepts_encoding(header, encoding, expected):
+    assert accepts_encoding(header, encoding) is expected
@@ -0,0 +1,64 @@
+import io
+import tarfile
+import zipfile
+import pytest
+from utils.file_utils import _audio_members
+
+MEMBERS = {
+    "a.wav": b"wav",
+    "nested/b.MP3": b"mp3",
+    "notes.txt": b"text",
+    ".hidden.wav": b"hidden",
+    "nested/.c.flac": b"hidden",
+    "__MACOSX/._a.wav": b"resource fork",
+}
+EXPECTED = {"a.wav": b"wav", "nested/b.MP3": b"mp3"}
+
+
+def zip_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("nested/", b"")
+        for name, data in MEMBERS.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def tar_bytes(mode: str) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as archive:
+        directory = tarfile.TarInfo("nested")
+        directory.type = tarfile.DIRTYPE
+        archive.addfile(directory)
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def read_members(source, filename):
+    members, close = _audio_members(source, filename)
+    try:
+        return {name: opener().read() for name, opener in members}
+    finally:
+        close()
+
+
+@pytest.mark.parametrize(
+    "filename, source",
+    [
+        ("batch.zip", zip_bytes),
+        ("batch.tar", lambda: tar_bytes("w")),
+        ("batch.tar.gz", lambda: tar_bytes("w:gz")),
+    ],
+)
+def test_only_visible_audio_members_are_kept(filename, source):
+    assert read_members(source(), filename) == EXPECTED
+
+
+def test_archive_on_disk(tmp_path):
+    path = tmp_path / "batch.zip"
+    path.write_bytes(zip_bytes())
+
+    assert read_members(str(path), "Batch.ZIP") == EXPECTED
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+import pytest
+import sqlalchemy as sa
+from sqlmodel import SQLModel
+from models import Transcript, _add_missing_columns
+from models.transcript import PREVIEW_CHARS
+
+
+@pytest.fixture
+def connection(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'scribe.db'}")
+    with engine.begin() as connection:
+        yield connection
+    engine.dispose()
+
+
+def test_columns_added_later_are_created_and_backfilled(connection):
+    SQLModel.metadata.create_all(connection)
+    # A database created before transcripts had previews
+    connection.execute(sa.text("ALTER TABLE transcript DROP COLUMN preview"))
+    body = "word " * 200
+    transcript_id = uuid.uuid4()
+    connection.execute(
+        sa.insert(Transcript.__table__).values(
+            id=transcript_id,
+            user_id=uuid.uuid4(),
+            filename="old.wav",
+            transcription=body,
+            created_at=datetime(2025, 1, 1),
+        )
+    )
+
+    _add_missing_columns(connection)
+
+    preview = connection.execute(
+        sa.select(Transcript.preview).where(Transcript.id == transcript_id)
+    ).scalar_one()
+    assert preview == body[:PREVIEW_CHARS]
+
+
+def test_up_to_date_schema_is_left_alone(connection):
+    SQLModel.metadata.create_all(connection)
+
+    _add_missing_columns(connection)
+
+    columns = {c["name"] for c in sa.inspect(connection).get_columns("transcript")}
+    assert "preview" in columns
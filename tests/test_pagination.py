@@ -0,0 +1,35 @@
+import base64
+import uuid
+from datetime import datetime, timezone
+import pytest
+from utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2025, 3, 14, 15, 9, 26, 535897, tzinfo=timezone.utc)
+    item_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, item_id)
+
+    assert decode_cursor(cursor) == (created_at, item_id)
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(datetime(2025, 1, 1), uuid.UUID(int=0))
+
+    assert "=" not in cursor
+    assert not set(cursor) & set("+/")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        base64.urlsafe_b64encode(b"[1, 2]").decode(),
+        base64.urlsafe_b64encode(b'{"c": "2025-01-01"}').decode(),
+        base64.urlsafe_b64encode(b'{"c": "yesterday", "i": "00"}').decode(),
+    ],
+)
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
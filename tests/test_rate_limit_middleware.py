@@ -0,0 +1,86 @@
+import asyncio
+import uuid
+import pytest
+from config.settings import settings
+from middleware.rate_limit import RateLimitMiddleware
+from services.rate_limiter import Limit, MemoryRateLimitBackend, RateLimiter
+
+PREFIX = f"{settings.API_V1_PREFIX}/transcriptions"
+TRANSCRIPT_ID = str(uuid.uuid4())
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+@pytest.fixture
+def middleware():
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(),
+        requests=Limit(2, 3600),
+        audio_seconds=Limit(60, 3600),
+        reads=Limit(10, 3600),
+    )
+    return RateLimitMiddleware(ok_app, limiter)
+
+
+def request(middleware, method: str, path: str):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [],
+        "client": ("203.0.113.7", 1234),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    start = messages[0]
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}
+
+
+@pytest.mark.parametrize(
+    "method, path, bucket",
+    [
+        ("GET", f"{PREFIX}/jobs/{TRANSCRIPT_ID}", "reads"),
+        ("GET", f"{PREFIX}/jobs/{TRANSCRIPT_ID}/events", "reads"),
+        ("GET", f"{PREFIX}/{TRANSCRIPT_ID}", "reads"),
+        ("GET", f"{PREFIX}/{TRANSCRIPT_ID}/text", "reads"),
+        ("GET", f"{PREFIX}/summaries", "reads"),
+        ("GET", f"{PREFIX}/", "reads"),
+        ("GET", f"{PREFIX}/search", "requests"),
+        ("GET", f"{PREFIX}/export", "requests"),
+        ("DELETE", f"{PREFIX}/{TRANSCRIPT_ID}", "requests"),
+        ("GET", f"{settings.API_V1_PREFIX}/auth/me", "requests"),
+        ("POST", f"{PREFIX}/", "audio_seconds"),
+        ("POST", f"{PREFIX}/batch", "audio_seconds"),
+    ],
+)
+def test_requests_are_charged_to_their_bucket(middleware, method, path, bucket):
+    assert middleware._bucket(method, path)[0] == bucket
+
+
+def test_polling_a_job_leaves_the_request_budget_alone(middleware):
+    for _ in range(5):
+        status, headers = request(middleware, "GET", f"{PREFIX}/jobs/{TRANSCRIPT_ID}")
+        assert status == 200
+
+    assert headers["x-ratelimit-read-remaining"] == "5"
+    status, headers = request(middleware, "GET", f"{settings.API_V1_PREFIX}/auth/me")
+    assert status == 200
+    assert headers["x-ratelimit-remaining"] == "1"
+
+
+def test_reads_are_limited_too(middleware):
+    statuses = [
+        request(middleware, "GET", f"{PREFIX}/{TRANSCRIPT_ID}")[0] for _ in range(11)
+    ]
+
+    assert statuses == [200] * 10 + [429]
@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+from services import rate_limiter
+from services.rate_limiter import (
+    Limit,
+    MemoryRateLimitBackend,
+    RateLimitContext,
+    RateLimiter,
+    RedisRateLimitBackend,
+    charge_audio_seconds,
+    current_rate_limit,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def redis_backend(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    import redis.asyncio
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis.asyncio,
+        "from_url",
+        lambda url: fakeredis.FakeAsyncRedis(server=server),
+    )
+    return RedisRateLimitBackend("redis://fake")
+
+
+def consume(backend, key="k", capacity=3.0, rate=1.0, cost=1.0, force=False):
+    return asyncio.run(backend.consume(key, capacity, rate, cost, force))
+
+
+def test_memory_bucket_allows_up_to_capacity(clock):
+    backend = MemoryRateLimitBackend()
+
+    states = [consume(backend) for _ in range(4)]
+
+    assert [s.allowed for s in states] == [True, True, True, False]
+    assert states[2].remaining == 0
+    assert states[3].retry_after(1.0) == 1
+    assert states[3].reset_after == 3
+
+
+def test_memory_bucket_refills_over_time(clock):
+    backend = MemoryRateLimitBackend()
+    for _ in range(3):
+        consume(backend)
+
+    clock.now += 1.5
+
+    assert consume(backend).allowed
+    assert not consume(backend).allowed
+
+
+def test_memory_bucket_never_exceeds_capacity(clock):
+    backend = MemoryRateLimitBackend()
+    consume(backend)
+
+    clock.now += 3600
+
+    assert consume(backend, cost=0).remaining == 3
+
+
+def test_memory_bucket_forced_cost_goes_into_debt(clock):
+    backend = MemoryRateLimitBackend()
+
+    state = consume(backend, cost=5.0, force=True)
+
+    assert state.allowed
+    assert state.tokens == -2.0
+    # Even a free request waits until the debt is paid off
+    assert not consume(backend, cost=0).allowed
+    clock.now += 2.5
+    assert consume(backend, cost=0).allowed
+
+
+def test_memory_backend_evicts_least_recently_used(clock):
+    backend = MemoryRateLimitBackend(max_keys=2)
+    consume(backend, key="a", cost=3)
+    consume(backend, key="b", cost=3)
+    consume(backend, key="a", cost=0)
+    consume(backend, key="c", cost=3)
+
+    assert not consume(backend, key="a", cost=1).allowed
+    # "b" was evicted, so it starts with a full bucket again
+    assert consume(backend, key="b", cost=1).allowed
+
+
+def test_redis_bucket_allows_up_to_capacity(redis_backend):
+    states = [consume(redis_backend, rate=0.001) for _ in range(4)]
+
+    assert [s.allowed for s in states] == [True, True, True, False]
+    assert states[3].tokens == pytest.approx(0.0, abs=0.01)
+
+
+def test_redis_bucket_forced_cost_goes_into_debt(redis_backend):
+    state = consume(redis_backend, cost=5.0, rate=0.001, force=True)
+
+    assert state.allowed
+    assert state.tokens == pytest.approx(-2.0, abs=0.01)
+    assert not consume(redis_backend, cost=0, rate=0.001).allowed
+
+
+def test_redis_bucket_refills_on_the_server_clock(redis_backend):
+    for _ in range(3):
+        consume(redis_backend, rate=100.0)
+    asyncio.run(asyncio.sleep(0.05))
+
+    assert consume(redis_backend, rate=100.0).allowed
+
+
+def test_redis_buckets_are_per_key(redis_backend):
+    consume(redis_backend, key="a", cost=3, rate=0.001)
+
+    assert not consume(redis_backend, key="a", rate=0.001).allowed
+    assert consume(redis_backend, key="b", rate=0.001).allowed
+
+
+def test_charge_audio_seconds_uses_the_current_context(clock):
+    limiter = RateLimiter(
+        MemoryRateLimitBackend(),
+        requests=Limit(10, 60),
+        audio_seconds=Limit(60, 60),
+    )
+    context = RateLimitContext(limiter, "client")
+
+    async def charge():
+        token = current_rate_limit.set(context)
+        try:
+            await charge_audio_seconds(90.0)
+            await charge_audio_seconds(None)
+        finally:
+            current_rate_limit.reset(token)
+
+    asyncio.run(charge())
+
+    assert context.audio_state.tokens == -30.0
+    assert not asyncio.run(limiter.consume("client", "audio_seconds", 1)).allowed
+    assert asyncio.run(limiter.consume("client", "requests", 1)).allowed
@@ -0,0 +1,100 @@
+import uuid
+import pytest
+import sqlalchemy as sa
+from sqlmodel import Session, SQLModel
+from models import Transcript
+from models.search import FTS_TABLE, create_search_index, owner_token
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'scribe.db'}")
+    with engine.begin() as connection:
+        SQLModel.metadata.create_all(connection)
+        create_search_index(connection)
+    yield engine
+    engine.dispose()
+
+
+def matches(engine, query: str):
+    with engine.connect() as connection:
+        return connection.execute(
+            sa.text(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :query"),
+            {"query": query},
+        ).all()
+
+
+def add(engine, text: str, user_id: uuid.UUID) -> uuid.UUID:
+    with Session(engine) as session:
+        transcript = Transcript(filename="a.wav", transcription=text, user_id=user_id)
+        session.add(transcript)
+        session.commit()
+        return transcript.id
+
+
+def test_index_keeps_no_copy_of_the_text(engine):
+    add(engine, "chest pain since monday " * 50, uuid.uuid4())
+
+    with engine.connect() as connection:
+        ddl = connection.execute(
+            sa.text("SELECT sql FROM sqlite_master WHERE name = :name"),
+            {"name": FTS_TABLE},
+        ).scalar_one()
+        stored = connection.execute(
+            sa.text(f"SELECT transcription FROM {FTS_TABLE}")
+        ).scalar_one()
+    assert "content = ''" in ddl
+    assert stored is None
+    assert len(matches(engine, "monday")) == 1
+
+
+def test_owner_scopes_matches(engine):
+    alice, bob = uuid.uuid4(), uuid.uuid4()
+    add(engine, "chest pain", alice)
+    add(engine, "chest pain", bob)
+
+    assert len(matches(engine, f'owner : "{owner_token(alice)}" AND chest')) == 1
+
+
+def test_deleted_transcripts_leave_the_index(engine):
+    transcript_id = add(engine, "chest pain", uuid.uuid4())
+
+    with Session(engine) as session:
+        session.delete(session.get(Transcript, transcript_id))
+        session.commit()
+
+    assert matches(engine, "chest") == []
+
+
+def test_updated_transcripts_are_reindexed(engine):
+    transcript_id = add(engine, "chest pain", uuid.uuid4())
+
+    with Session(engine) as session:
+        session.get(Transcript, transcript_id).transcription = "knee injury"
+        session.commit()
+
+    assert matches(engine, "chest") == []
+    assert len(matches(engine, "knee")) == 1
+
+
+def test_an_index_with_its_own_copy_is_rebuilt(engine):
+    add(engine, "chest pain", uuid.uuid4())
+    with engine.begin() as connection:
+        connection.execute(sa.text(f"DROP TABLE {FTS_TABLE}"))
+        connection.execute(
+            sa.text(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(owner, transcription)"
+            )
+        )
+
+    with engine.begin() as connection:
+        create_search_index(connection)
+
+    assert len(matches(engine, "chest")) == 1
+    with engine.connect() as connection:
+        assert (
+            connection.execute(
+                sa.text(f"SELECT transcription FROM {FTS_TABLE}")
+            ).scalar_one()
+            is None
+        )
@@ -0,0 +1,123 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+from models import Transcript
+from models.search import create_search_index
+from models.transcription_cache import TranscriptionCacheEntry
+from services import transcription_cache as cache_module
+from services.transcription_cache import TranscriptionCache
+from utils.compression import stored_encoding
+
+RESULT = {"transcription": "the patient reports mild pain " * 20, "duration": 3.0}
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """Run a scenario against a fresh database, as ``scenario(engine)``"""
+
+    def run(scenario):
+        async def main():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'c.db'}")
+            monkeypatch.setattr(cache_module, "engine", engine)
+            async with engine.begin() as connection:
+                await connection.run_sync(SQLModel.metadata.create_all)
+                await connection.run_sync(create_search_index)
+            try:
+                return await scenario(engine)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+async def backdate(engine, days: float) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(
+            sa.update(TranscriptionCacheEntry).values(
+                created_at=datetime.utcnow() - timedelta(days=days)
+            )
+        )
+
+
+def test_entries_are_stored_compressed(run):
+    async def scenario(engine):
+        await TranscriptionCache().put("k", "hash", "model", RESULT)
+        async with engine.connect() as connection:
+            return await connection.scalar(
+                sa.select(
+                    sa.type_coerce(
+                        TranscriptionCacheEntry.transcription, sa.LargeBinary
+                    )
+                )
+            )
+
+    assert stored_encoding(run(scenario)) is not None
+
+
+def test_entries_read_back_from_the_database(run):
+    async def scenario(engine):
+        await TranscriptionCache(lru_size=0).put("k", "hash", "model", RESULT)
+        return await TranscriptionCache(lru_size=0).get("k")
+
+    assert run(scenario) == RESULT
+
+
+def test_expired_entries_miss_and_are_pruned(run):
+    async def scenario(engine):
+        cache = TranscriptionCache(lru_size=0, ttl_s=86400)
+        await cache.put("old", "hash-old", "model", RESULT)
+        await cache.put("new", "hash-new", "model", RESULT)
+        await backdate(engine, days=2)
+        await cache.put("newer", "hash-newer", "model", RESULT)
+        return await cache.get("old"), await cache.prune(), await cache.get("newer")
+
+    missed, pruned, kept = run(scenario)
+
+    assert missed is None
+    assert pruned == 2
+    assert kept == RESULT
+
+
+async def add_transcript(session: AsyncSession, content_hash: str) -> Transcript:
+    transcript = Transcript(
+        filename="a.wav",
+        transcription=RESULT["transcription"],
+        user_id=uuid.uuid4(),
+        content_hash=content_hash,
+    )
+    session.add(transcript)
+    await session.commit()
+    return transcript
+
+
+async def delete_transcript(
+    cache: TranscriptionCache, session: AsyncSession, transcript: Transcript
+) -> None:
+    await session.delete(transcript)
+    await cache.discard_unreferenced(transcript.content_hash, session)
+    await session.commit()
+
+
+def test_entry_goes_with_the_last_transcript_of_its_audio(run):
+    async def scenario(engine):
+        cache = TranscriptionCache()
+        await cache.put("k", "hash", "model", RESULT)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            first = await add_transcript(session, "hash")
+            second = await add_transcript(session, "hash")
+
+            await delete_transcript(cache, session, first)
+            still_cached = await cache.get("k")
+            await delete_transcript(cache, session, second)
+        return still_cached, await cache.get("k")
+
+    still_cached, gone = run(scenario)
+
+    assert still_cached == RESULT
+    assert gone is None
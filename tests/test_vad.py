@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from utils.vad import detect_speech, trim_silence
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds: float, level_db: float, wobble_db: float = 0.0) -> np.ndarray:
+    """A speech-like tone at ``level_db`` dBFS RMS, its loudness drifting by
+    ``wobble_db`` a few times a second"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope_db = level_db + wobble_db * np.sin(2 * np.pi * 3 * t)
+    amplitude = np.sqrt(2) * 10 ** (envelope_db / 20)
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def noise(seconds: float, level_db: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    samples = rng.standard_normal(int(seconds * SAMPLE_RATE))
+    return (samples * 10 ** (level_db / 20)).astype(np.float32)
+
+
+def test_loud_continuous_speech_is_kept():
+    audio = tone(20.0, -15.0, wobble_db=4.0)
+
+    speech, removed = trim_silence(audio, SAMPLE_RATE)
+
+    assert removed == 0
+    assert len(speech) == len(audio)
+
+
+def test_pauses_above_the_absolute_threshold_are_trimmed():
+    # Room noise at -40 dBFS is above the -45 dB threshold but well below speech
+    audio = np.concatenate(
+        [noise(5.0, -40.0), tone(5.0, -15.0, 4.0), noise(5.0, -40.0)]
+    )
+
+    speech, removed = trim_silence(audio, SAMPLE_RATE, padding_ms=0)
+
+    assert removed == pytest.approx(10.0, abs=0.1)
+    assert len(speech) == pytest.approx(5.0 * SAMPLE_RATE, rel=0.02)
+
+
+def test_silence_has_no_speech():
+    assert detect_speech(noise(3.0, -70.0), SAMPLE_RATE) == []
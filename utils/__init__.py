@@ -1,12 +1,21 @@
 from .jwt_utils import create_access_token, create_refresh_token, verify_token
-from .password_utils import hash_password, verify_password
+from .password_utils import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_and_update_password,
+)
 from .file_utils import (
     save_upload_file,
+    SpooledUpload,
+    stream_upload_file,
     is_audio_file,
-    get_audio_duration,
-    convert_to_wav,
+    is_archive_file,
+    extract_audio_files,
+    decode_audio,
     cleanup_file,
 )
+from .pagination import encode_cursor, decode_cursor
 
 __all__ = [
     "create_access_token",
@@ -14,9 +23,16 @@ __all__ = [
     "verify_token",
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_and_update_password",
     "save_upload_file",
+    "SpooledUpload",
+    "stream_upload_file",
     "is_audio_file",
-    "get_audio_duration",
-    "convert_to_wav",
+    "is_archive_file",
+    "extract_audio_files",
+    "decode_audio",
     "cleanup_file",
+    "encode_cursor",
+    "decode_cursor",
 ]
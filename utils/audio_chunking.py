@@ -0,0 +1,67 @@
+import math
+import re
+from typing import List
+import numpy as np
+
+_NORMALIZE_RE = re.compile(r"[^\w']+")
+# Fast speech runs about 3 words a second; leave room above that
+MAX_WORDS_PER_SECOND = 4.0
+
+
+def split_audio(
+    audio: np.ndarray, sample_rate: int, chunk_length_s: float, stride_s: float
+) -> List[np.ndarray]:
+    """Split audio into chunks of ``chunk_length_s`` overlapping by ``stride_s``"""
+    chunk_len = int(chunk_length_s * sample_rate)
+    overlap = int(stride_s * sample_rate)
+    if chunk_len <= 0 or overlap < 0 or overlap >= chunk_len:
+        raise ValueError("Chunk stride must be shorter than the chunk length")
+
+    if len(audio) <= chunk_len:
+        return [audio]
+
+    step = chunk_len - overlap
+    chunks = []
+    for start in range(0, len(audio), step):
+        chunks.append(audio[start : start + chunk_len])
+        if start + chunk_len >= len(audio):
+            break
+    return chunks
+
+
+def _normalize(word: str) -> str:
+    return _NORMALIZE_RE.sub("", word.lower())
+
+
+def overlap_words(stride_s: float) -> int:
+    """Most words that can be spoken in ``stride_s`` seconds of overlap"""
+    return max(1, math.ceil(stride_s * MAX_WORDS_PER_SECOND))
+
+
+def stitch_transcripts(texts: List[str], max_overlap_words: int = 20) -> str:
+    """Join chunk transcripts, dropping words repeated in the overlapping audio.
+
+    The overlap is the longest run of words (ignoring case and punctuation),
+    at most ``max_overlap_words`` long, that both ends the text so far and
+    starts the next chunk. Runs elsewhere are ordinary repeated speech, so
+    without a run at the seam the chunks are simply joined.
+    """
+    words: List[str] = []
+    for text in texts:
+        next_words = text.split()
+        if not words:
+            words = next_words
+            continue
+        if not next_words:
+            continue
+
+        limit = min(len(words), len(next_words), max_overlap_words)
+        tail = [_normalize(w) for w in words[-limit:]]
+        head = [_normalize(w) for w in next_words[:limit]]
+        overlap = next(
+            (size for size in range(limit, 0, -1) if tail[-size:] == head[:size]),
+            0,
+        )
+        words.extend(next_words[overlap:])
+
+    return " ".join(words)
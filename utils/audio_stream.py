@@ -0,0 +1,132 @@
+import asyncio
+from typing import Callable, List, Optional, Union
+import numpy as np
+from loguru import logger
+
+SampleCallback = Callable[[np.ndarray], None]
+
+# Encodings accepted by the streaming endpoint
+STREAM_ENCODINGS = ("pcm_s16le", "opus")
+
+
+class PCMStreamDecoder:
+    """Converts raw little-endian 16-bit mono PCM frames to float32 samples"""
+
+    def __init__(self, on_samples: SampleCallback):
+        self._on_samples = on_samples
+        self._remainder = b""
+
+    async def feed(self, data: bytes) -> None:
+        data = self._remainder + data
+        usable = len(data) - len(data) % 2
+        self._remainder = data[usable:]
+        if usable:
+            pcm = np.frombuffer(data[:usable], dtype="<i2")
+            self._on_samples(pcm.astype(np.float32) / 32768.0)
+
+    async def close(self) -> None:
+        self._remainder = b""
+
+
+class FFmpegStreamDecoder:
+    """Decodes a byte stream incrementally with one long-lived ffmpeg process.
+
+    Input goes to ffmpeg's stdin as it arrives; 16 kHz mono float32 samples
+    are handed to ``on_samples`` as soon as ffmpeg emits them.
+    """
+
+    def __init__(
+        self,
+        on_samples: SampleCallback,
+        input_args: Optional[List[str]] = None,
+        sample_rate: int = 16000,
+    ):
+        self._on_samples = on_samples
+        self._input_args = input_args or []
+        self.sample_rate = sample_rate
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            # Start decoding after the first packets instead of probing ahead
+            "-probesize",
+            "32",
+            "-analyzeduration",
+            "0",
+            *self._input_args,
+            "-i",
+            "pipe:0",
+            "-f",
+            "f32le",
+            "-ac",
+            "1",
+            "-ar",
+            str(self.sample_rate),
+            "-flush_packets",
+            "1",
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self._reader = asyncio.create_task(self._read())
+
+    async def feed(self, data: bytes) -> None:
+        if self._process is None:
+            await self.start()
+        assert self._process is not None and self._process.stdin is not None
+        self._process.stdin.write(data)
+        await self._process.stdin.drain()
+
+    async def close(self) -> None:
+        """Flush ffmpeg and wait for the remaining samples"""
+        if self._process is None:
+            return
+        assert self._process.stdin is not None and self._reader is not None
+        try:
+            self._process.stdin.close()
+            await self._reader
+        finally:
+            if self._process.returncode is None:
+                self._process.kill()
+            _, stderr = await self._process.communicate()
+            if self._process.returncode not in (0, -9) and stderr:
+                logger.warning(f"Stream decoder error: {stderr.decode().strip()}")
+            self._process = None
+
+    async def _read(self) -> None:
+        assert self._process is not None and self._process.stdout is not None
+        remainder = b""
+        while True:
+            chunk = await self._process.stdout.read(16384)
+            if not chunk:
+                return
+            data = remainder + chunk
+            usable = len(data) - len(data) % 4
+            remainder = data[usable:]
+            if usable:
+                self._on_samples(np.frombuffer(data[:usable], dtype="<f4").copy())
+
+
+def create_stream_decoder(
+    encoding: str, sample_rate: int, on_samples: SampleCallback
+) -> Union[PCMStreamDecoder, FFmpegStreamDecoder]:
+    """Decoder turning ``encoding`` frames into 16 kHz mono float32 samples"""
+    if encoding == "pcm_s16le":
+        if sample_rate == 16000:
+            return PCMStreamDecoder(on_samples)
+        return FFmpegStreamDecoder(
+            on_samples, ["-f", "s16le", "-ar", str(sample_rate), "-ac", "1"]
+        )
+    if encoding == "opus":
+        # Ogg or WebM container, as produced by MediaRecorder
+        return FFmpegStreamDecoder(on_samples)
+    raise ValueError(
+        f"Unsupported stream encoding '{encoding}'. "
+        f"Supported: {', '.join(STREAM_ENCODINGS)}"
+    )
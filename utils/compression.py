@@ -0,0 +1,83 @@
+"""Compression of stored transcript bodies.
+
+A stored body is either plain UTF-8 or a zstd/gzip frame of it, told apart
+by the frame's magic bytes (neither magic is a valid UTF-8 prefix), so rows
+written before compression was enabled, or with another codec, still read.
+"""
+
+import gzip
+from typing import Optional, Union
+from config.settings import settings
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ENCODINGS = ("zstd", "gzip")
+
+
+def stored_encoding(data: Union[bytes, str]) -> Optional[str]:
+    """Content-Encoding of a stored body, or None for plain text"""
+    if isinstance(data, str):
+        return None
+    if data.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if data.startswith(GZIP_MAGIC):
+        return "gzip"
+    return None
+
+
+def compress_text(
+    text: str,
+    encoding: str = settings.TRANSCRIPT_COMPRESSION,
+    min_bytes: int = settings.TRANSCRIPT_COMPRESSION_MIN_BYTES,
+    level: Optional[int] = settings.TRANSCRIPT_COMPRESSION_LEVEL,
+) -> bytes:
+    """Body to store for ``text``; short texts aren't worth a frame header"""
+    data = text.encode()
+    if encoding == "none" or len(data) < min_bytes:
+        return data
+    if encoding == "gzip":
+        # mtime=0 keeps equal texts byte-identical
+        return gzip.compress(data, compresslevel=level or 6, mtime=0)
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=level or 3).compress(data)
+    raise ValueError(
+        f"Unknown TRANSCRIPT_COMPRESSION '{encoding}'. "
+        f"Available: {', '.join(ENCODINGS)}, none"
+    )
+
+
+def decompress_text(data: Union[bytes, str]) -> str:
+    """Text of a stored body, whichever way it was stored"""
+    encoding = stored_encoding(data)
+    if encoding is None:
+        return data if isinstance(data, str) else data.decode()
+    if encoding == "gzip":
+        return gzip.decompress(data).decode()
+    import zstandard
+
+    # Frames written by ZstdCompressor.compress carry their content size
+    return zstandard.ZstdDecompressor().decompress(data).decode()
+
+
+def accepts_encoding(accept_encoding: Optional[str], encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows ``encoding``"""
+    if not accept_encoding:
+        return False
+    wildcard = False
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if name == encoding:
+            return quality > 0
+        if name == "*":
+            wildcard = quality > 0
+    return wildcard
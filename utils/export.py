@@ -0,0 +1,171 @@
+"""Encoders for the streaming transcript export.
+
+Each encoder turns batches of rows (mappings keyed by ``EXPORT_COLUMNS``)
+into bytes as they arrive, so an export never holds more than one batch.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Sequence
+import uuid
+
+EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "filename",
+    "transcription",
+    "duration",
+    "file_size",
+    "created_at",
+)
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+Row = Mapping[str, Any]
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class ExportEncoder:
+    """Encodes an export batch by batch"""
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class NDJSONEncoder(ExportEncoder):
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        return "".join(
+            json.dumps({column: _plain(row[column]) for column in EXPORT_COLUMNS})
+            + "\n"
+            for row in rows
+        ).encode()
+
+
+class CSVEncoder(ExportEncoder):
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(EXPORT_COLUMNS)
+        return self._drain()
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        self._writer.writerows(
+            [_plain(row[column]) for column in EXPORT_COLUMNS] for row in rows
+        )
+        return self._drain()
+
+
+class _ChunkSink:
+    """Write-only file that hands out what was written since the last drain"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        # Parquet footers record absolute offsets, so keep counting
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+class ParquetEncoder(ExportEncoder):
+    """One Parquet row group per batch. Needs the ``export`` extra (pyarrow)"""
+
+    def __init__(self):
+        import pyarrow as pa
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("user_id", pa.string()),
+                ("filename", pa.string()),
+                ("transcription", pa.large_string()),
+                ("duration", pa.float64()),
+                ("file_size", pa.int64()),
+                ("created_at", pa.timestamp("us")),
+            ]
+        )
+        self._sink = _ChunkSink()
+        self._writer: Any = None
+
+    def _open(self) -> Any:
+        if self._writer is None:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(
+                self._pa.PythonFile(self._sink, mode="w"),
+                self._schema,
+                compression="zstd",
+            )
+        return self._writer
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        columns: Dict[str, List[Any]] = {
+            column: [row[column] for row in rows] for column in EXPORT_COLUMNS
+        }
+        for column in ("id", "user_id"):
+            columns[column] = [str(value) for value in columns[column]]
+        self._open().write_table(
+            self._pa.Table.from_pydict(columns, schema=self._schema)
+        )
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        # An empty export is still a valid file with the schema
+        self._open().close()
+        return self._sink.drain()
+
+
+def export_encoder(format: str) -> ExportEncoder:
+    """Encoder for an ``EXPORT_MEDIA_TYPES`` format"""
+    if format == "ndjson":
+        return NDJSONEncoder()
+    if format == "csv":
+        return CSVEncoder()
+    if format == "parquet":
+        return ParquetEncoder()
+    raise ValueError(f"Unknown export format '{format}'")
@@ -1,9 +1,18 @@
 import os
+import io
+import uuid
+import asyncio
+import hashlib
+import tarfile
+import zipfile
 import aiofiles
 from pathlib import Path
-from typing import Optional
+from typing import IO, Callable, List, Optional, Tuple, Union
 import ffmpeg
+import numpy as np
+from fastapi import UploadFile
 from loguru import logger
+from errors.custom_exceptions import FileTooLargeError, ValidationError
 
 
 async def save_upload_file(file_content: bytes, filename: str, upload_dir: str) -> str:
@@ -16,36 +25,244 @@ async def save_upload_file(file_content: bytes, filename: str, upload_dir: str)
     return str(file_path)
 
 
+class SpooledUpload:
+    """Upload body kept in memory up to ``spool_size`` bytes, then spilled to disk.
+
+    The SHA-256 of the content is computed while it is written, so later
+    stages can use ``sha256`` without reading the body again.
+    """
+
+    def __init__(self, filename: str, upload_dir: str, spool_size: int):
+        self.filename = filename
+        self.size = 0
+        self.path: Optional[str] = None
+        self._upload_dir = upload_dir
+        self._spool_size = spool_size
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file = None
+        self._hash = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def in_memory(self) -> bool:
+        return self.path is None
+
+    async def write(self, chunk: bytes) -> None:
+        """Append a chunk, spilling to disk once the spool size is crossed"""
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        if self._file is None and self.size > self._spool_size:
+            await self._rollover()
+
+        if self._file is not None:
+            await self._file.write(chunk)
+        else:
+            assert self._buffer is not None
+            self._buffer.write(chunk)
+
+    async def _rollover(self) -> None:
+        suffix = Path(self.filename).suffix
+        self.path = str(Path(self._upload_dir) / f"{uuid.uuid4()}{suffix}")
+        self._file = await aiofiles.open(self.path, "wb")
+        if self._buffer is not None:
+            await self._file.write(self._buffer.getvalue())
+            self._buffer = None
+
+    async def finish(self) -> None:
+        """Flush and close the on-disk part once the whole body is written"""
+        if self._file is not None:
+            await self._file.close()
+            self._file = None
+
+    def getvalue(self) -> bytes:
+        """Body of an upload that is still in memory"""
+        if self._buffer is None:
+            raise ValueError("Upload was spilled to disk, read it from its path")
+        return self._buffer.getvalue()
+
+    async def materialize(self) -> str:
+        """Path to the upload on disk, spilling an in-memory body if needed"""
+        if self.path is None:
+            await self._rollover()
+            await self.finish()
+        assert self.path is not None
+        return self.path
+
+    def close(self) -> None:
+        """Release the buffer and remove any spilled file"""
+        self._buffer = None
+        if self.path is not None:
+            cleanup_file(self.path)
+
+
+async def stream_upload_file(
+    file: UploadFile,
+    upload_dir: str,
+    max_size: int,
+    chunk_size: int,
+    spool_size: int,
+) -> SpooledUpload:
+    """Read an upload in fixed-size chunks, rejecting it once it exceeds ``max_size``"""
+    too_large = FileTooLargeError(
+        f"File too large. Maximum size: {max_size / 1024 / 1024:.1f}MB"
+    )
+    if file.size is not None and file.size > max_size:
+        raise too_large
+
+    upload = SpooledUpload(file.filename or "", upload_dir, spool_size)
+    try:
+        while chunk := await file.read(chunk_size):
+            if upload.size + len(chunk) > max_size:
+                raise too_large
+            await upload.write(chunk)
+        await upload.finish()
+    except BaseException:
+        await upload.finish()
+        upload.close()
+        raise
+
+    return upload
+
+
 def is_audio_file(filename: str) -> bool:
     """Check if file is a supported audio format"""
     allowed_extensions = {".wav", ".mp3", ".m4a", ".flac", ".ogg", ".webm"}
     return Path(filename).suffix.lower() in allowed_extensions
 
 
-def get_audio_duration(file_path: str) -> Optional[float]:
-    """Get audio file duration in seconds"""
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+def is_archive_file(filename: str) -> bool:
+    """Check if file is a zip or tar archive"""
+    return filename.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _audio_members(
+    source: Union[str, bytes], filename: str
+) -> Tuple[List[Tuple[str, Callable[[], IO[bytes]]]], Callable[[], None]]:
+    """Audio members of an archive as (name, opener) pairs, plus a closer"""
+    fileobj = io.BytesIO(source) if isinstance(source, bytes) else None
+    path = None if fileobj is not None else source
+
+    def wanted(name: str) -> bool:
+        base = Path(name).name
+        return (
+            is_audio_file(base)
+            and not base.startswith(".")
+            and "__MACOSX/" not in name
+        )
+
+    if filename.lower().endswith(".zip"):
+        archive = zipfile.ZipFile(fileobj or path)
+        members = [
+            (info.filename, lambda info=info: archive.open(info))
+            for info in archive.infolist()
+            if not info.is_dir() and wanted(info.filename)
+        ]
+        return members, archive.close
+
+    tar = tarfile.open(name=path, fileobj=fileobj, mode="r:*")
+    members = [
+        (member.name, lambda member=member: tar.extractfile(member))
+        for member in tar.getmembers()
+        if member.isfile() and wanted(member.name)
+    ]
+    return members, tar.close
+
+
+async def extract_audio_files(
+    archive: SpooledUpload,
+    upload_dir: str,
+    max_size: int,
+    max_files: int,
+    chunk_size: int,
+    spool_size: int,
+) -> List[SpooledUpload]:
+    """Unpack the audio files of a zip or tar archive into uploads.
+
+    Other members are skipped. Each audio file is held to ``max_size``, and
+    an archive with more than ``max_files`` of them is rejected.
+    """
+    source = archive.getvalue() if archive.in_memory else await archive.materialize()
     try:
-        probe = ffmpeg.probe(file_path)
-        duration = float(probe["streams"][0]["duration"])
-        return duration
-    except Exception as e:
-        logger.error(f"Error getting audio duration: {e}")
-        return None
+        members, close = await asyncio.to_thread(
+            _audio_members, source, archive.filename
+        )
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        raise ValidationError(f"Could not read archive {archive.filename}: {e}")
+
+    uploads: List[SpooledUpload] = []
+    try:
+        if len(members) > max_files:
+            raise ValidationError(
+                f"Archive holds {len(members)} audio files, the limit is {max_files}"
+            )
+        for name, open_member in members:
+            stream = await asyncio.to_thread(open_member)
+            upload = SpooledUpload(name, upload_dir, spool_size)
+            uploads.append(upload)
+            try:
+                while chunk := await asyncio.to_thread(stream.read, chunk_size):
+                    if upload.size + len(chunk) > max_size:
+                        raise FileTooLargeError(
+                            f"{name} is too large. "
+                            f"Maximum size: {max_size / 1024 / 1024:.1f}MB"
+                        )
+                    await upload.write(chunk)
+            finally:
+                await upload.finish()
+                stream.close()
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+        for upload in uploads:
+            upload.close()
+        raise ValidationError(f"Could not read archive {archive.filename}: {e}")
+    except BaseException:
+        for upload in uploads:
+            upload.close()
+        raise
+    finally:
+        close()
+
+    return uploads
 
 
-def convert_to_wav(input_path: str, output_path: str) -> bool:
-    """Convert audio file to WAV format suitable for Whisper"""
+# Containers whose index may sit at the end of the file; ffmpeg needs a
+# seekable input for these, so they are decoded from disk rather than a pipe
+SEEKABLE_INPUT_FORMATS = {".m4a"}
+
+
+def decode_audio(
+    source: Union[str, bytes], sample_rate: int = 16000
+) -> Optional[np.ndarray]:
+    """Decode audio to mono float32 PCM at ``sample_rate`` in a single ffmpeg pass.
+
+    ``source`` is either a path or the raw file content, which is piped to
+    ffmpeg's stdin. Returns None if ffmpeg cannot decode the input.
+    """
+    from_memory = isinstance(source, bytes)
     try:
-        (
-            ffmpeg.input(input_path)
-            .output(output_path, acodec="pcm_s16le", ac=1, ar="16000")
-            .overwrite_output()
-            .run(quiet=True)
+        out, _ = (
+            ffmpeg.input("pipe:0" if from_memory else source)
+            .output("pipe:1", format="f32le", acodec="pcm_f32le", ac=1, ar=sample_rate)
+            .global_args("-hide_banner", "-loglevel", "error")
+            .run(
+                input=source if from_memory else None,
+                capture_stdout=True,
+                capture_stderr=True,
+            )
         )
-        return True
+        return np.frombuffer(out, dtype=np.float32)
+    except ffmpeg.Error as e:
+        stderr = e.stderr.decode(errors="replace").strip() if e.stderr else e
+        logger.error(f"Error decoding audio: {stderr}")
+        return None
     except Exception as e:
-        logger.error(f"Error converting audio: {e}")
-        return False
+        logger.error(f"Error decoding audio: {e}")
+        return None
 
 
 def cleanup_file(file_path: str) -> None:
@@ -0,0 +1,139 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+from prometheus_client import Counter, Gauge, Histogram
+
+# Transcription pipeline
+PIPELINE_STAGE_SECONDS = Histogram(
+    "scribe_pipeline_stage_seconds",
+    "Time spent in each transcription pipeline stage",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+TRANSCRIPTION_REQUESTS = Counter(
+    "scribe_transcription_requests_total",
+    "Transcription requests by mode (sync, async, stream) and outcome",
+    ["mode", "outcome"],
+)
+TRANSCRIPTIONS_IN_FLIGHT = Gauge(
+    "scribe_transcriptions_in_flight",
+    "Transcriptions currently being processed, by mode",
+    ["mode"],
+)
+TRANSCRIBED_AUDIO_SECONDS = Counter(
+    "scribe_transcribed_audio_seconds_total",
+    "Seconds of audio sent through the model",
+)
+REAL_TIME_FACTOR = Histogram(
+    "scribe_transcription_real_time_factor",
+    "Inference seconds per second of audio",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5),
+)
+INFERENCE_IN_FLIGHT = Gauge(
+    "scribe_inference_in_flight", "Model calls running or queued on the workers"
+)
+INFERENCE_QUEUE_DEPTH = Gauge(
+    "scribe_inference_queue_depth", "Clips waiting in the micro-batcher"
+)
+MODEL_LOAD_SECONDS = Gauge(
+    "scribe_model_load_seconds",
+    "Time to start the inference workers and load the model",
+    ["backend"],
+)
+
+
+# Stage timings of the current request, collected for its Server-Timing header
+request_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record ``seconds`` spent in pipeline stage ``stage``"""
+    PIPELINE_STAGE_SECONDS.labels(stage=stage).observe(seconds)
+    timings = request_timings.get()
+    if timings is not None:
+        timings.append((stage, seconds))
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Record how long the block takes as pipeline stage ``stage``"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+# Inference micro-batching
+BATCH_SIZE = Histogram(
+    "scribe_inference_batch_size",
+    "Number of clips sent to the model in one forward pass",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16, 24, 32),
+)
+BATCH_WAIT_SECONDS = Histogram(
+    "scribe_inference_batch_wait_seconds",
+    "Time a clip waited in the batcher before its batch was dispatched",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+BATCH_OCCUPANCY = Histogram(
+    "scribe_inference_batch_occupancy_ratio",
+    "Batch size divided by the configured maximum batch size",
+    buckets=(0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0),
+)
+
+# Admission control (backlog in audio seconds, for autoscaling)
+ADMISSION_BACKLOG_SECONDS = Gauge(
+    "scribe_admission_backlog_audio_seconds",
+    "Estimated audio seconds admitted and not yet transcribed",
+)
+ADMISSION_ESTIMATED_WAIT_SECONDS = Gauge(
+    "scribe_admission_estimated_wait_seconds",
+    "Estimated seconds to work through the admitted backlog",
+)
+ADMISSION_REAL_TIME_FACTOR = Gauge(
+    "scribe_admission_real_time_factor",
+    "Moving average of inference seconds per audio second",
+)
+ADMISSION_DECISIONS = Counter(
+    "scribe_admission_decisions_total",
+    "Transcription admission decisions by outcome (admitted, rejected)",
+    ["outcome"],
+)
+
+# Content-addressed transcription cache
+TRANSCRIPTION_CACHE_REQUESTS = Counter(
+    "scribe_transcription_cache_requests_total",
+    "Transcription cache lookups by outcome (hit, miss, coalesced)",
+    ["outcome"],
+)
+
+# Authenticated principal caches (verified tokens, user snapshots)
+PRINCIPAL_CACHE_REQUESTS = Counter(
+    "scribe_principal_cache_requests_total",
+    "Principal cache lookups by cache (token, user) and outcome (hit, miss)",
+    ["cache", "outcome"],
+)
+
+# Voice-activity detection
+VAD_REMOVED_SECONDS = Counter(
+    "scribe_vad_removed_audio_seconds_total",
+    "Seconds of non-speech audio dropped before inference",
+)
+VAD_REMOVED_RATIO = Histogram(
+    "scribe_vad_removed_ratio",
+    "Fraction of each recording dropped as non-speech",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+
+# Live (WebSocket) transcription
+STREAM_SESSIONS = Gauge(
+    "scribe_stream_sessions", "Open live transcription WebSocket sessions"
+)
+STREAM_TIME_TO_FIRST_WORD = Histogram(
+    "scribe_stream_time_to_first_word_seconds",
+    "Time from the first audio frame of a stream to the first text sent back",
+    buckets=(0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+)
@@ -0,0 +1,21 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """Opaque cursor pointing just past the given row"""
+    payload = json.dumps({"c": created_at.isoformat(), "i": item_id.hex})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Inverse of ``encode_cursor``; raises ValueError for malformed cursors"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), uuid.UUID(payload["i"])
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -1,7 +1,25 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from passlib.context import CryptContext
+from config.settings import settings
 
-# Configure Argon2 password hashing
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Configure Argon2 password hashing. Hashes made with other cost parameters
+# still verify and are flagged for rehashing.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+# Argon2 releases the GIL, so a small thread pool caps how many hashes run at
+# once (and how much memory they take) without blocking the event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.PASSWORD_HASH_WORKERS),
+    thread_name_prefix="argon2",
+)
 
 
 def hash_password(password: str) -> str:
@@ -12,3 +30,20 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the bounded hashing executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Verify on the hashing executor; also returns a new hash when the stored
+    one uses outdated parameters"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, pwd_context.verify_and_update, plain_password, hashed_password
+    )
@@ -0,0 +1,118 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from loguru import logger
+
+Region = Tuple[int, int]
+
+# webrtcvad only accepts these frame lengths
+WEBRTC_FRAME_MS = (10, 20, 30)
+
+
+def _energy_speech_frames(
+    audio: np.ndarray,
+    frame_len: int,
+    threshold_db: float,
+    margin_db: Optional[float],
+) -> np.ndarray:
+    """Flag frames whose RMS level is well above the recording's noise floor"""
+    n_frames = len(audio) // frame_len
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    level_db = 20 * np.log10(np.maximum(rms, 1e-10))
+
+    if margin_db is None:
+        return level_db > threshold_db
+    noise_floor, loud = np.percentile(level_db, [10, 90])
+    # Without pauses the quietest frames are still speech, not a noise floor
+    if loud - noise_floor < 2 * margin_db:
+        return level_db > threshold_db
+    return level_db > max(threshold_db, noise_floor + margin_db)
+
+
+def _webrtc_speech_frames(
+    audio: np.ndarray, sample_rate: int, frame_len: int, aggressiveness: int
+) -> np.ndarray:
+    import webrtcvad
+
+    vad = webrtcvad.Vad(aggressiveness)
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    n_frames = len(pcm) // frame_len
+    return np.array(
+        [
+            vad.is_speech(
+                pcm[i * frame_len : (i + 1) * frame_len].tobytes(), sample_rate
+            )
+            for i in range(n_frames)
+        ],
+        dtype=bool,
+    )
+
+
+def detect_speech(
+    audio: np.ndarray,
+    sample_rate: int,
+    backend: str = "energy",
+    frame_ms: int = 30,
+    threshold_db: float = -45.0,
+    margin_db: Optional[float] = 10.0,
+    aggressiveness: int = 2,
+    min_speech_ms: int = 90,
+    padding_ms: int = 300,
+) -> List[Region]:
+    """Find speech regions as ``(start, end)`` sample offsets, padded and merged.
+
+    The energy backend adapts to the recording's noise floor when its
+    quiet and loud frames are clearly apart (otherwise there is no floor to
+    go by and the absolute threshold applies); pass
+    ``margin_db=None`` to use the absolute ``threshold_db`` only, e.g. for
+    short windows that may contain nothing but speech.
+    """
+    frame_len = sample_rate * frame_ms // 1000
+    if len(audio) < frame_len:
+        return []
+
+    if backend == "webrtc":
+        if frame_ms not in WEBRTC_FRAME_MS:
+            raise ValueError(f"webrtc VAD needs frames of {WEBRTC_FRAME_MS} ms")
+        try:
+            speech = _webrtc_speech_frames(
+                audio, sample_rate, frame_len, aggressiveness
+            )
+        except ImportError:
+            logger.warning("webrtcvad is not installed, using the energy VAD")
+            speech = _energy_speech_frames(audio, frame_len, threshold_db, margin_db)
+    else:
+        speech = _energy_speech_frames(audio, frame_len, threshold_db, margin_db)
+
+    # Runs of consecutive speech frames
+    edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    min_frames = max(1, min_speech_ms // frame_ms)
+    padding = sample_rate * padding_ms // 1000
+    regions: List[Region] = []
+    for start, end in zip(starts, ends):
+        if end - start < min_frames:
+            continue
+        region = (
+            max(0, start * frame_len - padding),
+            min(len(audio), end * frame_len + padding),
+        )
+        if regions and region[0] <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], region[1])
+        else:
+            regions.append(region)
+    return regions
+
+
+def trim_silence(
+    audio: np.ndarray, sample_rate: int, **kwargs
+) -> Tuple[np.ndarray, float]:
+    """Keep only the (padded) speech regions; returns the audio and seconds removed"""
+    regions = detect_speech(audio, sample_rate, **kwargs)
+    if not regions:
+        return audio[:0], len(audio) / sample_rate
+
+    speech = np.concatenate([audio[start:end] for start, end in regions])
+    return speech, (len(audio) - len(speech)) / sample_rate